@@ -1,7 +1,7 @@
 """``runway plan`` command."""
 # docs: file://./../../../docs/source/commands.rst
 import logging
-from typing import Any, Tuple
+from typing import Any, Optional, Tuple
 
 import click
 from pydantic import ValidationError
@@ -15,6 +15,7 @@ LOGGER = logging.getLogger(__name__.replace("._", "."))
 
 
 @click.command("plan", short_help="plan things")
+@options.changed_since
 @options.ci
 @options.debug
 @options.deploy_environment
@@ -22,7 +23,13 @@ LOGGER = logging.getLogger(__name__.replace("._", "."))
 @options.tags
 @options.verbose
 @click.pass_context
-def plan(ctx: click.Context, debug: bool, tags: Tuple[str, ...], **_: Any) -> None:
+def plan(
+    ctx: click.Context,
+    changed_since: Optional[str],
+    debug: bool,
+    tags: Tuple[str, ...],
+    **_: Any,
+) -> None:
     """Determine what infrastructure changes will occur during the next deploy.
 
     \b
@@ -39,10 +46,14 @@ def plan(ctx: click.Context, debug: bool, tags: Tuple[str, ...], **_: Any) -> No
         - (default) prompts
         - (tags) module contains all tags
         - (non-interactive) all
+        - (changed-since) modules & stacks affected by files changed since
+          the git ref
     3. Attempt to determine change for deployments/modules in the order defined.
 
     """  # noqa: D301
     try:
+        if changed_since:
+            ctx.obj.env.changed_since = changed_since
         Runway(ctx.obj.runway_config, ctx.obj.get_runway_context()).plan(
             select_deployments(ctx, ctx.obj.runway_config.deployments, tags)
         )
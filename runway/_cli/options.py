@@ -10,6 +10,14 @@ ci = click.option(
     help="Run in non-interactive mode.",
 )
 
+changed_since = click.option(
+    "--changed-since",
+    metavar="<git-ref>",
+    help="Only process modules and CFNgin stacks affected by files that have "
+    "changed since the provided git ref (including uncommitted changes). "
+    "Stacks that depend on an affected stack are also processed.",
+)
+
 debug = click.option(
     "--debug",
     count=True,
@@ -5,36 +5,51 @@ import logging
 import os
 import sys
 import threading
-from typing import TYPE_CHECKING, Any, Callable, ClassVar, Optional, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Mapping,
+    Optional,
+    Union,
+)
 
 import botocore.exceptions
 
-from ..dag import ThreadedWalker, UnlimitedSemaphore, walk
+from ...variables import prefetch_lookups
+from ..dag import ThreadedWalker, walk
 from ..exceptions import CfnginBucketNotFound, PlanFailed
 from ..plan import Graph, Plan, Step, merge_graphs
+from ..status import PENDING
 from ..utils import ensure_s3_bucket, get_s3_endpoint, stack_template_key_name
 
 if TYPE_CHECKING:
+    from mypy_boto3_cloudformation.type_defs import StackTypeDef
     from mypy_boto3_s3.client import S3Client
 
     from ...context import CfnginContext
     from ..blueprints.base import Blueprint
     from ..providers.aws.default import Provider, ProviderBuilder
     from ..stack import Stack
+    from ..status import Status
 
 LOGGER = logging.getLogger(__name__)
 
-# After submitting a stack update/create, this controls how long we'll wait
-# between calls to DescribeStacks to check on it's status. Most stack updates
-# take at least a couple minutes, so 30 seconds is pretty reasonable and inline
-# with the suggested value in
+# After submitting a stack update/create, this controls the maximum amount of
+# time we'll wait between calls to DescribeStacks to check on it's status. The
+# wait starts out shorter and backs off to this value as a stack stays in
+# progress. Most stack updates take at least a couple minutes, so 30 seconds is
+# pretty reasonable and inline with the suggested value in
 # https://github.com/boto/botocore/blob/1.6.1/botocore/data/cloudformation/2010-05-15/waiters-2.json#L22
 #
 # This can be controlled via an environment variable, mostly for testing.
 STACK_POLL_TIME = int(os.environ.get("CFNGIN_STACK_POLL_TIME", 30))
 
 
-def build_walker(concurrency: int) -> Callable[..., Any]:
+def build_walker(
+    concurrency: int, weights: Optional[Mapping[str, float]] = None
+) -> Callable[..., Any]:
     """Return a function for waling a graph.
 
     Passed to :class:`runway.cfngin.plan.Plan` for walking the graph.
@@ -46,10 +61,13 @@ def build_walker(concurrency: int) -> Callable[..., Any]:
     fast as the graph topology allows.
 
     If concurrency is greater than 1, it will return a walker that will only
-    execute a maximum of concurrency steps at any given time.
+    execute a maximum of concurrency steps at any given time using a fixed
+    size pool of threads.
 
     Args:
         concurrency: Number of threads to use while walking.
+        weights: Expected duration of each step. Used to start the steps on the
+            critical path first when walking in parallel.
 
     Returns:
         Function to walk a :class:`runway.cfngin.dag.DAG`.
@@ -57,12 +75,7 @@ def build_walker(concurrency: int) -> Callable[..., Any]:
     """
     if concurrency == 1:
         return walk
-
-    semaphore = UnlimitedSemaphore()
-    if concurrency > 1:
-        semaphore = threading.Semaphore(concurrency)
-
-    return ThreadedWalker(semaphore).walk
+    return ThreadedWalker(max(concurrency, 0), weights=weights).walk
 
 
 def stack_template_url(bucket_name: str, blueprint: Blueprint, endpoint: str):
@@ -183,6 +196,13 @@ class BaseAction:
     ) -> None:
         """Perform steps after running the action."""
 
+    def prefetch_lookups(self) -> None:
+        """Prefetch data for the lookups used by the variables of each stack."""
+        prefetch_lookups(
+            [variable for stack in self.context.stacks for variable in stack.variables],
+            self.context,
+        )
+
     def run(
         self,
         *,
@@ -289,6 +309,29 @@ class BaseAction:
             require_unlocked=require_unlocked,
         )
 
+    def _get_provider_stack(
+        self, provider: Provider, stack: Stack, status: Optional[Status]
+    ) -> StackTypeDef:
+        """Get the current state of a stack from the provider.
+
+        Once a step has been acted on, the stack is refreshed by the provider's
+        shared poller along with all other in-flight stacks instead of being
+        described on its own.
+
+        Args:
+            provider: Provider for the stack.
+            stack: The stack.
+            status: Current status of the step for the stack.
+
+        Raises:
+            CancelExecution: Execution was canceled while waiting.
+            StackDoesNotExist: The stack does not exist.
+
+        """
+        if status is PENDING:
+            return provider.get_stack(stack.fqn)
+        return provider.poll_stack(stack.fqn, cancel=self.cancel)
+
     def _tail_stack(
         self, stack: Stack, cancel: threading.Event, retries: int = 0, **kwargs: Any
     ) -> None:
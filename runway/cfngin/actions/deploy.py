@@ -1,11 +1,26 @@
 """CFNgin deploy action."""
 from __future__ import annotations
 
+import concurrent.futures
+import hashlib
+import json
 import logging
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
+import threading
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from typing_extensions import Literal
 
+from ...lookups.handlers.base import LOOKUP_CACHE
+from ...lookups.handlers.ssm import TYPE_NAME as SSM_LOOKUP
 from ..exceptions import (
     CancelExecution,
     CfnginBucketRequired,
@@ -18,7 +33,6 @@ from ..plan import Graph, Plan, Step
 from ..providers.base import Template
 from ..status import (
     INTERRUPTED,
-    PENDING,
     SUBMITTED,
     WAITING,
     CompleteStatus,
@@ -30,7 +44,7 @@ from ..status import (
     SkippedStatus,
     SubmittedStatus,
 )
-from .base import STACK_POLL_TIME, BaseAction, build_walker
+from .base import BaseAction, build_walker
 
 if TYPE_CHECKING:
     from mypy_boto3_cloudformation.type_defs import ParameterTypeDef, StackTypeDef
@@ -39,12 +53,18 @@ if TYPE_CHECKING:
     from ...context import CfnginContext
     from ...core.providers.aws.type_defs import TagTypeDef
     from ..blueprints.base import Blueprint
-    from ..providers.aws.default import Provider
+    from ..providers.aws.default import Provider, ProviderBuilder
     from ..stack import Stack
     from ..status import Status
 
 LOGGER = logging.getLogger(__name__)
 
+#: lookups that cannot read state changed by deploying a stack
+LOCAL_LOOKUPS = frozenset({"default", "env", "envvar", "file", "var"})
+
+#: parts of a template that CloudFormation resolves each time it is deployed
+DEPLOY_TIME_REFERENCES = ("AWS::SSM::Parameter::Value", "Transform", "{{resolve:")
+
 DESTROYED_STATUS = CompleteStatus("stack destroyed")
 DESTROYING_STATUS = SubmittedStatus("submitted for destruction")
 
@@ -222,6 +242,13 @@ class Action(BaseAction):
     - Submitting either a create or update of the given stack to the
       :class:`runway.cfngin.providers.base.BaseProvider`.
 
+    When a persistent graph is used, a fingerprint of what was submitted for
+    each stack is recorded once the stack is deployed. Stacks with a matching
+    fingerprint that have not been updated since are not submitted again.
+    Stacks with templates using SSM parameter types, dynamic references or
+    transforms are always submitted as their values are only known to
+    CloudFormation.
+
     Attributes:
         upload_explicitly_disabled: Explicitly disable uploading rendered templates
             to S3.
@@ -233,6 +260,29 @@ class Action(BaseAction):
 
     upload_explicitly_disabled: bool = False
 
+    def __init__(
+        self,
+        context: CfnginContext,
+        provider_builder: Optional[ProviderBuilder] = None,
+        cancel: Optional[threading.Event] = None,
+    ) -> None:
+        """Instantiate class.
+
+        Args:
+            context: The context for the current run.
+            provider_builder: An object that will build a provider that will be
+                interacted with in order to perform the necessary actions.
+            cancel: Cancel handler.
+
+        """
+        super().__init__(context, provider_builder=provider_builder, cancel=cancel)
+        #: fingerprints of submitted stacks that are recorded once deployed
+        self._stack_fingerprints: Dict[str, str] = {}
+        self._stack_fingerprints_updated = False
+        #: stacks being resolved while the stacks they wait for are launched
+        self._resolve_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._resolve_futures: Dict[str, concurrent.futures.Future[bool]] = {}
+
     @property
     def upload_disabled(self) -> bool:
         """Whether the CloudFormation template should be uploaded to S3."""
@@ -305,14 +355,15 @@ class Action(BaseAction):
             status: The Stack's status represented by a CFNgin status object.
 
         """
-        wait_time = 0 if status is PENDING else STACK_POLL_TIME
-        if self.cancel.wait(wait_time):
+        if self.cancel.is_set():
             return INTERRUPTED
 
         provider = self.build_provider()
 
         try:
-            stack_data = provider.get_stack(stack.fqn)
+            stack_data = self._get_provider_stack(provider, stack, status)
+        except CancelExecution:
+            return INTERRUPTED
         except StackDoesNotExist:
             LOGGER.debug("%s:stack does not exist", stack.fqn)
             if status == SUBMITTED:
@@ -357,8 +408,7 @@ class Action(BaseAction):
             status: The Stack's status represented by a CFNgin status object.
 
         """
-        wait_time = 0 if status is PENDING else STACK_POLL_TIME
-        if self.cancel.wait(wait_time):
+        if self.cancel.is_set():
             return INTERRUPTED
 
         if not should_submit(stack):
@@ -367,7 +417,9 @@ class Action(BaseAction):
         provider = self.build_provider()
 
         try:
-            provider_stack = provider.get_stack(stack.fqn)
+            provider_stack = self._get_provider_stack(provider, stack, status)
+        except CancelExecution:
+            return INTERRUPTED
         except StackDoesNotExist:
             provider_stack = None
 
@@ -415,19 +467,51 @@ class Action(BaseAction):
                 return FailedStatus(reason)
 
             elif provider.is_stack_completed(provider_stack):
+                # drop SSM parameters cached while the stack could change them
+                LOOKUP_CACHE.invalidate(SSM_LOOKUP)
+                self._record_stack_fingerprint(stack, provider_stack)
                 stack.set_outputs(provider.get_output_dict(provider_stack))
                 return CompleteStatus(status.reason)
             else:
                 return status
 
-        LOGGER.debug("%s:resolving stack", stack.fqn)
-        stack.resolve(self.context, self.provider)
+        # only reused once so a stack being re-created is resolved again
+        future = self._resolve_futures.pop(stack.fqn, None)
+        if future and not future.cancelled() and future.result():
+            LOGGER.debug("%s:using stack resolved while waiting to launch", stack.fqn)
+        else:
+            LOGGER.debug("%s:resolving stack", stack.fqn)
+            stack.resolve(self.context, self.provider)
+
+        tags = build_stack_tags(stack)
+        parameters = self.build_parameters(stack, provider_stack)
+        if self._resolved_on_deploy(stack):
+            LOGGER.debug(
+                "%s:template is resolved by CloudFormation; not fingerprinted",
+                stack.fqn,
+            )
+        else:
+            fingerprint = self._stack_fingerprint(
+                stack,
+                parameters,
+                tags,
+                provider=provider,
+                provider_stack=provider_stack,
+            )
+            unchanged_stack = (
+                self._get_unchanged_stack(provider, stack, fingerprint)
+                if provider_stack and not recreate
+                else None
+            )
+            if unchanged_stack:
+                LOGGER.debug("%s:fingerprint matches the last deploy", stack.fqn)
+                stack.set_outputs(provider.get_output_dict(unchanged_stack))
+                return DidNotChangeStatus()
+            self._stack_fingerprints[stack.fqn] = fingerprint
 
         LOGGER.debug("%s:launching stack now", stack.fqn)
         template = self._template(stack.blueprint)
         stack_policy = self._stack_policy(stack)
-        tags = build_stack_tags(stack)
-        parameters = self.build_parameters(stack, provider_stack)
         force_change_set = stack.blueprint.requires_change_set
 
         if recreate:
@@ -481,9 +565,210 @@ class Action(BaseAction):
             stack.set_outputs(provider.get_output_dict(provider_stack))
             return SkippedStatus(reason="canceled execution")
         except StackDidNotChange:
+            self._record_stack_fingerprint(stack, provider_stack)
             stack.set_outputs(provider.get_output_dict(provider_stack))
             return DidNotChangeStatus()
 
+    @staticmethod
+    def _resolved_on_deploy(stack: Stack) -> bool:
+        """Whether the template of a stack uses values resolved on deploy.
+
+        SSM parameter types, dynamic references and transforms can change
+        without anything submitted for the stack changing so the stack must
+        not be skipped based on its fingerprint.
+
+        Args:
+            stack: The stack being launched.
+
+        """
+        rendered = stack.blueprint.rendered
+        return any(reference in rendered for reference in DEPLOY_TIME_REFERENCES)
+
+    @staticmethod
+    def _stack_fingerprint(
+        stack: Stack,
+        parameters: List[ParameterTypeDef],
+        tags: List[TagTypeDef],
+        *,
+        provider: Provider,
+        provider_stack: Optional[StackTypeDef] = None,
+    ) -> str:
+        """Hash everything that is submitted to CloudFormation for a stack.
+
+        Notification ARNs are not submitted but are kept by CloudFormation
+        when a stack is updated so those of the existing stack are included.
+
+        Args:
+            stack: The stack being launched.
+            parameters: Parameters that will be submitted.
+            tags: Tags that will be submitted.
+            provider: The provider the stack is using.
+            provider_stack: The stack as returned by the provider.
+
+        """
+        return hashlib.sha256(
+            json.dumps(
+                {
+                    "capabilities": provider.CAPABILITIES,
+                    "notification_arns": sorted(
+                        (provider_stack or {}).get("NotificationARNs", [])
+                    ),
+                    "parameters": parameters,
+                    "service_role": provider.service_role,
+                    "stack_policy": stack.stack_policy,
+                    "tags": tags,
+                    "template": stack.blueprint.rendered,
+                    "termination_protection": stack.termination_protection,
+                },
+                default=str,
+                sort_keys=True,
+            ).encode()
+        ).hexdigest()
+
+    def _get_unchanged_stack(
+        self, provider: Provider, stack: Stack, fingerprint: str
+    ) -> Optional[StackTypeDef]:
+        """Get a stack if it is unchanged since it was last deployed.
+
+        The stack must not have been updated since its fingerprint was
+        recorded and must be in a completed state. The stack is described
+        again rather than using the cache of the provider as it may have been
+        updated since it was cached.
+
+        Args:
+            provider: The provider the stack is using.
+            stack: The stack being launched.
+            fingerprint: Fingerprint of the stack being launched.
+
+        Returns:
+            The stack as returned by the provider if it is unchanged.
+
+        """
+        recorded = self.context.stack_fingerprints.get(stack.fqn)
+        if not recorded or recorded.get("fingerprint") != fingerprint:
+            return None
+        try:
+            provider_stack = provider.get_stack(stack.fqn, use_cache=False)
+        except StackDoesNotExist:
+            return None
+        if not provider.is_stack_completed(provider_stack) or provider.is_stack_failed(
+            provider_stack
+        ):
+            return None
+        if recorded.get("last_updated") != self._stack_last_updated(provider_stack):
+            return None
+        return provider_stack
+
+    def _record_stack_fingerprint(
+        self, stack: Stack, provider_stack: StackTypeDef
+    ) -> None:
+        """Record the fingerprint of a stack that was deployed.
+
+        Args:
+            stack: The stack that was deployed.
+            provider_stack: The stack as returned by the provider.
+
+        """
+        fingerprint = self._stack_fingerprints.pop(stack.fqn, None)
+        if not fingerprint or not self.context.stack_fingerprints_location:
+            return
+        self.context.stack_fingerprints[stack.fqn] = {
+            "fingerprint": fingerprint,
+            "last_updated": self._stack_last_updated(provider_stack),
+        }
+        self._stack_fingerprints_updated = True
+
+    @staticmethod
+    def _stack_last_updated(provider_stack: StackTypeDef) -> str:
+        """Time a stack was last updated or created."""
+        return str(
+            provider_stack.get("LastUpdatedTime", provider_stack.get("CreationTime"))
+        )
+
+    def _resolve_stacks_early(self, plan: Plan, concurrency: int = 0) -> None:
+        """Start resolving stacks whose variables only use local lookups.
+
+        Stacks that have dependencies in the plan but only use lookups that
+        cannot read remote state (e.g. ``var`` or ``env``) are resolved and
+        their templates rendered in the background while the plan is
+        executed so this is not done after the stacks they wait for have
+        been launched. Any other lookup could read state that is changed by
+        deploying a stack this stack requires (e.g. an SSM parameter).
+        Stacks without dependencies are launched as soon as the plan is
+        executed so they are not resolved early.
+
+        Args:
+            plan: The plan that will be executed.
+            concurrency: The maximum number of stacks resolved at once.
+
+        """
+        stacks = [
+            step.stack
+            for step in plan.steps
+            if step.fn == self._launch_stack
+            and plan.graph.downstream(step.name)
+            and should_submit(step.stack)
+            and should_update(step.stack)
+            and self._uses_local_lookups_only(step.stack)
+        ]
+        if not stacks:
+            return
+        LOGGER.debug(
+            "resolving stacks while waiting for their dependencies: %s",
+            ", ".join(stack.name for stack in stacks),
+        )
+        self._resolve_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=concurrency or None, thread_name_prefix="resolve"
+        )
+        for stack in stacks:
+            self._resolve_futures[stack.fqn] = self._resolve_executor.submit(
+                self._resolve_stack_early, stack
+            )
+
+    def _resolve_stack_early(self, stack: Stack) -> bool:
+        """Resolve and render a stack before it is launched.
+
+        Stacks that fail to resolve are resolved again when they are launched
+        so that errors are reported the same way.
+
+        Args:
+            stack: The stack to resolve.
+
+        Returns:
+            Whether the stack was resolved.
+
+        """
+        if self.cancel.is_set():
+            return False
+        try:
+            stack.resolve(self.context, self.provider)
+            stack.blueprint.rendered  # pylint: disable=pointless-statement
+        except Exception:  # pylint: disable=broad-except
+            LOGGER.debug("%s:unable to resolve stack early", stack.fqn, exc_info=True)
+            return False
+        return True
+
+    def _stop_resolving_stacks(self) -> None:
+        """Cancel stacks that have not been resolved early and wait for the rest."""
+        for future in self._resolve_futures.values():
+            future.cancel()
+        self._resolve_futures.clear()
+        if self._resolve_executor:
+            self._resolve_executor.shutdown(wait=True)
+            self._resolve_executor = None
+
+    @staticmethod
+    def _uses_local_lookups_only(stack: Stack) -> bool:
+        """Whether the variables of a stack only use local lookups.
+
+        Args:
+            stack: The stack to check.
+
+        """
+        return all(
+            variable.lookup_names <= LOCAL_LOOKUPS for variable in stack.variables
+        )
+
     @property
     def _stack_action(self) -> Callable[..., Status]:
         """Run against a step."""
@@ -605,10 +890,19 @@ class Action(BaseAction):
             plan.outline(logging.DEBUG)
             self.context.lock_persistent_graph(plan.lock_code)
             LOGGER.debug("launching stacks: %s", ", ".join(plan.keys()))
-            walker = build_walker(concurrency)
+            walker = build_walker(
+                concurrency,
+                weights=self.context.stack_durations.get(self._stack_action.__name__),
+            )
+            self.prefetch_lookups()
+            self._resolve_stacks_early(plan, concurrency)
             try:
                 plan.execute(walker)
             finally:
+                self._stop_resolving_stacks()
+                self.context.put_stack_durations()
+                if self._stack_fingerprints_updated:
+                    self.context.put_stack_fingerprints()
                 # always unlock the graph at the end
                 self.context.unlock_persistent_graph(plan.lock_code)
         if outline:
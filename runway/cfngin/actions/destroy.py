@@ -4,18 +4,17 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING, Any, Callable, Optional, Union
 
-from ..exceptions import StackDoesNotExist
+from ..exceptions import CancelExecution, StackDoesNotExist
 from ..hooks.utils import handle_hooks
 from ..status import (
     INTERRUPTED,
-    PENDING,
     SUBMITTED,
     CompleteStatus,
     DoesNotExistInCloudFormation,
     FailedStatus,
     SubmittedStatus,
 )
-from .base import STACK_POLL_TIME, BaseAction, build_walker
+from .base import BaseAction, build_walker
 
 if TYPE_CHECKING:
     from ..stack import Stack
@@ -51,14 +50,15 @@ class Action(BaseAction):
     def _destroy_stack(
         self, stack: Stack, *, status: Optional[Status], **_: Any
     ) -> Status:
-        wait_time = 0 if status is PENDING else STACK_POLL_TIME
-        if self.cancel.wait(wait_time):
+        if self.cancel.is_set():
             return INTERRUPTED
 
         provider = self.build_provider()
 
         try:
-            stack_data = provider.get_stack(stack.fqn)
+            stack_data = self._get_provider_stack(provider, stack, status)
+        except CancelExecution:
+            return INTERRUPTED
         except StackDoesNotExist:
             LOGGER.debug("%s:stack does not exist", stack.fqn)
             # Once the stack has been destroyed, it doesn't exist. If the
@@ -125,10 +125,14 @@ class Action(BaseAction):
             # steps to COMPLETE in order to log them
             plan.outline(logging.DEBUG)
             self.context.lock_persistent_graph(plan.lock_code)
-            walker = build_walker(concurrency)
+            walker = build_walker(
+                concurrency,
+                weights=self.context.stack_durations.get(self._stack_action.__name__),
+            )
             try:
                 plan.execute(walker)
             finally:
+                self.context.put_stack_durations()
                 self.context.unlock_persistent_graph(plan.lock_code)
         else:
             plan.outline(message='To execute this plan, run with --force" flag.')
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import logging
 import sys
+import threading
 from operator import attrgetter
 from typing import (
     TYPE_CHECKING,
@@ -11,6 +12,7 @@ from typing import (
     Dict,
     Generic,
     List,
+    Optional,
     Tuple,
     TypeVar,
     Union,
@@ -34,6 +36,9 @@ from .base import build_walker
 
 if TYPE_CHECKING:
     from ..._logging import RunwayLogger
+    from ...context import CfnginContext
+    from ..plan import Plan, Step
+    from ..providers.aws.default import ProviderBuilder
     from ..stack import Stack
     from ..status import Status
 
@@ -185,11 +190,34 @@ class Action(deploy.Action):
     The plan is then used to create a changeset for a stack using a
     generated template based on the current config.
 
+    The changes of each stack are output once every stack has been diffed,
+    in the order of the plan. This lets the change sets of dependent stacks
+    be created as soon as the outputs of their dependencies are known instead
+    of waiting on each change set to be output and deleted.
+
     """
 
     DESCRIPTION = "Diff stacks"
     NAME = "diff"
 
+    def __init__(
+        self,
+        context: CfnginContext,
+        provider_builder: Optional[ProviderBuilder] = None,
+        cancel: Optional[threading.Event] = None,
+    ) -> None:
+        """Instantiate class.
+
+        Args:
+            context: The context for the current run.
+            provider_builder: An object that will build a provider that will be
+                interacted with in order to perform the necessary actions.
+            cancel: Cancel handler.
+
+        """
+        super().__init__(context, provider_builder=provider_builder, cancel=cancel)
+        self._stack_changes: Dict[str, List[Callable[[], None]]] = {}
+
     @property
     def _stack_action(self) -> Callable[..., Status]:
         """Run against a step."""
@@ -217,7 +245,11 @@ class Action(deploy.Action):
             stack.resolve(self.context, provider)
             parameters = self.build_parameters(stack)
             outputs = provider.get_stack_changes(
-                stack, self._template(stack.blueprint), parameters, tags
+                stack,
+                self._template(stack.blueprint),
+                parameters,
+                tags,
+                deferred=self._stack_changes.setdefault(stack.name, []),
             )
             stack.set_outputs(outputs)
         except exceptions.StackDidNotChange:
@@ -270,8 +302,47 @@ class Action(deploy.Action):
             LOGGER.info("diffing stacks: %s", ", ".join(plan.keys()))
         else:
             LOGGER.warning("no stacks detected (error in config?)")
-        walker = build_walker(concurrency)
-        plan.execute(walker)
+        walker = build_walker(
+            concurrency,
+            weights=self.context.stack_durations.get(self._stack_action.__name__),
+        )
+        self.prefetch_lookups()
+        try:
+            plan.execute(walker)
+        finally:
+            failed_steps = self._output_stack_changes(plan)
+            self.context.put_stack_durations()
+        if failed_steps:
+            raise exceptions.PlanFailed(failed_steps)
+
+    def _output_stack_changes(self, plan: Plan) -> List[Step]:
+        """Output the changes of each stack and delete their change sets.
+
+        A failure to output the changes of a stack or delete its change set
+        does not stop the change sets of the remaining stacks from being
+        deleted.
+
+        Args:
+            plan: The plan that was executed.
+
+        Returns:
+            Steps whose changes could not be output or cleaned up.
+
+        """
+        failed_steps: List[Step] = []
+        for step in plan.steps:
+            for func in self._stack_changes.pop(step.name, []):
+                try:
+                    func()
+                except exceptions.CancelExecution:
+                    LOGGER.warning("%s:output of changes canceled", step.name)
+                except Exception:  # pylint: disable=broad-except
+                    LOGGER.exception(
+                        "%s:failed to output changes or delete change set", step.name
+                    )
+                    if step not in failed_steps:
+                        failed_steps.append(step)
+        return failed_steps
 
     def pre_run(
         self,
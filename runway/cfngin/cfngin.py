@@ -16,6 +16,7 @@ from ..context import CfnginContext
 from ..utils import MutableMap, SafeHaven
 from .actions import deploy, destroy, diff, init
 from .environment import parse_environment
+from .plan import Graph, Step
 from .providers.aws.default import ProviderBuilder
 
 if TYPE_CHECKING:
@@ -123,10 +124,17 @@ class CFNgin:
                 logger.notice("deploy (in progress)")
                 with SafeHaven(sys_modules_exclude=["awacs", "troposphere"]):
                     ctx = self.load(config_path)
+                    if not self._select_changed_stacks(ctx):
+                        logger.info(
+                            "skipped; no changes since %s",
+                            self.__ctx.env.changed_since,
+                        )
+                        continue
                     action = deploy.Action(
                         context=ctx,
                         provider_builder=self._get_provider_builder(
-                            ctx.config.service_role
+                            ctx.config.service_role,
+                            stack_output_index=ctx.config.stack_output_index,
                         ),
                     )
                     action.execute(concurrency=self.concurrency, tail=self.tail)
@@ -158,7 +166,8 @@ class CFNgin:
                     action = destroy.Action(
                         context=ctx,
                         provider_builder=self._get_provider_builder(
-                            ctx.config.service_role
+                            ctx.config.service_role,
+                            stack_output_index=ctx.config.stack_output_index,
                         ),
                     )
                     action.execute(
@@ -184,7 +193,8 @@ class CFNgin:
                     action = init.Action(
                         context=ctx,
                         provider_builder=self._get_provider_builder(
-                            ctx.config.service_role
+                            ctx.config.service_role,
+                            stack_output_index=ctx.config.stack_output_index,
                         ),
                     )
                     action.execute(concurrency=self.concurrency, tail=self.tail)
@@ -235,10 +245,17 @@ class CFNgin:
                 logger.notice("plan (in progress)")
                 with SafeHaven():
                     ctx = self.load(config_path)
+                    if not self._select_changed_stacks(ctx):
+                        logger.info(
+                            "skipped; no changes since %s",
+                            self.__ctx.env.changed_since,
+                        )
+                        continue
                     action = diff.Action(
                         context=ctx,
                         provider_builder=self._get_provider_builder(
-                            ctx.config.service_role
+                            ctx.config.service_role,
+                            stack_output_index=ctx.config.stack_output_index,
                         ),
                     )
                     action.execute()
@@ -257,6 +274,42 @@ class CFNgin:
         LOGGER.info("skipped; no parameters and environment file not found")
         return True
 
+    def _select_changed_stacks(self, context: CfnginContext) -> bool:
+        """Limit the stacks of a context to those affected by changed files.
+
+        A stack is affected when a file it is built from has changed or when
+        a stack it depends on is affected. Every stack is affected when the
+        config file or environment file has changed.
+
+        Args:
+            context: CFNgin context object.
+
+        Returns:
+            Whether any stack is affected.
+
+        """
+        changed_files = self.__ctx.env.changed_files
+        if changed_files is None:
+            return True
+        for path in (context.config_path, self._env_file_name):
+            if path and Path(path).resolve() in changed_files:
+                return True
+        stack_names = {
+            stack.name
+            for stack in context.stacks
+            if stack.source_files.intersection(changed_files)
+        }
+        if not stack_names:
+            return False
+        dependants = Graph.from_steps(
+            [Step(stack) for stack in context.stacks]
+        ).transposed()
+        for name in list(stack_names):
+            stack_names.update(dependants.dag.all_downstreams(name))
+        LOGGER.debug("stacks affected by changes: %s", ", ".join(sorted(stack_names)))
+        context.stack_names = sorted(stack_names)
+        return True
+
     def _get_config(self, file_path: Path) -> CfnginConfig:
         """Initialize a CFNgin config object from a file.
 
@@ -285,12 +338,13 @@ class CFNgin:
         )
 
     def _get_provider_builder(
-        self, service_role: Optional[str] = None
+        self, service_role: Optional[str] = None, *, stack_output_index: bool = False
     ) -> ProviderBuilder:
         """Initialize provider builder.
 
         Args:
             service_role: CloudFormation service role.
+            stack_output_index: Index the outputs of every stack in a region.
 
         """
         if self.interactive:
@@ -302,6 +356,7 @@ class CFNgin:
             recreate_failed=self.recreate_failed,
             region=self.region,
             service_role=service_role,
+            stack_output_index=stack_output_index,
         )
 
     def _inject_common_parameters(self) -> None:
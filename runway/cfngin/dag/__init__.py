@@ -2,16 +2,19 @@
 from __future__ import annotations
 
 import collections
+import collections.abc
+import concurrent.futures
+import heapq
 import logging
 from copy import copy, deepcopy
-from threading import Thread
 from typing import (
-    TYPE_CHECKING,
     Any,
     Callable,
     Dict,
     Iterable,
     List,
+    Mapping,
+    Optional,
     OrderedDict,
     Set,
     Tuple,
@@ -19,9 +22,6 @@ from typing import (
     cast,
 )
 
-if TYPE_CHECKING:
-    import threading
-
 LOGGER = logging.getLogger(__name__)
 
 
@@ -315,7 +315,7 @@ class DAG:
         for new_node in graph_dict:
             self.add_node(new_node)
         for ind_node, dep_nodes in graph_dict.items():
-            if not isinstance(dep_nodes, collections.Iterable):
+            if not isinstance(dep_nodes, collections.abc.Iterable):
                 raise TypeError(f"{ind_node}: dict values must be lists")
             for dep_node in dep_nodes:
                 self.add_edge(ind_node, dep_node)
@@ -374,6 +374,38 @@ class DAG:
             return sorted_graph
         raise ValueError("graph is not acyclic")
 
+    def critical_path_lengths(
+        self, weights: Optional[Mapping[str, float]] = None
+    ) -> Dict[str, float]:
+        """Return the length of the longest path from each node to the end of the graph.
+
+        The length of a path is the sum of the weights of each node along it,
+        including the node itself. Nodes that depend on a node come after it
+        in the path.
+
+        Args:
+            weights: Weight of each node (e.g. expected duration in seconds).
+                Nodes without a weight are given the average of the known
+                weights or ``1`` if there are none.
+
+        """
+        weights = weights or {}
+        known = [weights[node] for node in self.graph if node in weights]
+        default = sum(known) / len(known) if known else 1.0
+
+        dependants: Dict[str, List[str]] = {node: [] for node in self.graph}
+        for node, deps in self.graph.items():
+            for dep in deps:
+                dependants[dep].append(node)
+
+        lengths: Dict[str, float] = {}
+        # dependants always come before their dependencies in this order
+        for node in self.topological_sort():
+            lengths[node] = weights.get(node, default) + max(
+                (lengths[dependant] for dependant in dependants[node]), default=0.0
+            )
+        return lengths
+
     def size(self) -> int:
         """Count of nodes in the graph."""
         return len(self)
@@ -388,28 +420,37 @@ def walk(dag: DAG, walk_func: Callable[[str], Any]) -> None:
     return dag.walk(walk_func)
 
 
-class UnlimitedSemaphore:
-    """threading.Semaphore, but acquire always succeeds."""
+class ThreadedWalker:
+    """Walk a DAG as quickly as the graph topology allows, using threads.
 
-    def acquire(self, *args: Any) -> Any:
-        """Do nothing."""
+    Nodes are executed by a fixed size pool of worker threads. Each node
+    tracks the number of direct dependencies that have yet to finish. When
+    that count reaches zero, the node is placed in the ready queue and
+    submitted to the pool as soon as a worker is available.
 
-    def release(self) -> Any:
-        """Do nothing."""
+    Ready nodes are submitted in order of the length of the longest path of
+    nodes that depend on them (the critical path) so that slow chains are
+    started before cheap leaf nodes.
 
+    """
 
-class ThreadedWalker:
-    """Walk a DAG as quickly as the graph topology allows, using threads."""
-
-    def __init__(self, semaphore: Union[threading.Semaphore, UnlimitedSemaphore]):
+    def __init__(
+        self, max_workers: int = 0, weights: Optional[Mapping[str, float]] = None
+    ) -> None:
         """Instantiate class.
 
         Args:
-            semaphore: A semaphore object which can be used to control how many
-                steps are executed in parallel.
+            max_workers: Maximum number of nodes that can be executed in
+                parallel. If ``0``, the size of the pool will be constrained
+                only by the size of the graph.
+            weights: Expected duration of each node used to prioritize ready
+                nodes. If not provided, each node is given an equal weight.
 
         """
-        self.semaphore = semaphore
+        if max_workers < 0:
+            raise ValueError("max_workers must be greater than or equal to 0")
+        self.max_workers = max_workers
+        self.weights = weights or {}
 
     def walk(self, dag: DAG, walk_func: Callable[[str], Any]) -> None:
         """Walk each node of the graph, in parallel if it can.
@@ -418,55 +459,59 @@ class ThreadedWalker:
         satisfied.
 
         """
-        # First, we'll topologically sort all of the nodes, with nodes that
-        # have no dependencies first. We do this to ensure that we don't call
-        # .join on a thread that hasn't yet been started.
-        #
-        # TODO(ejholmes): An alternative would be to ensure that Thread.join
-        # blocks if the thread has not yet been started.
-        nodes = dag.topological_sort()
-        nodes.reverse()
-
-        # This maps a node name to a thread of execution.
-        threads: Dict[str, Any] = {}
-
-        # Blocks until all of the given nodes have completed execution (whether
-        # successfully, or errored). Returns True if all nodes returned True.
-        def wait_for(nodes: List[str]):
-            """Wait for nodes."""
-            for node in nodes:
-                thread = threads[node]
-                while thread.is_alive():
-                    threads[node].join(0.5)
-
-        # For each node in the graph, we're going to allocate a thread to
-        # execute. The thread will block executing walk_func, until all of the
-        # nodes dependencies have executed.
-        for node in nodes:
-
-            def _fn(node_: str, deps: List[str]) -> Any:
-                if deps:
-                    LOGGER.debug(
-                        "%s waiting for %s to complete", node_, ", ".join(deps)
-                    )
-
-                # Wait for all dependencies to complete.
-                wait_for(deps)
-
-                LOGGER.debug("%s starting", node_)
-
-                self.semaphore.acquire()
-                try:
-                    return walk_func(node_)
-                finally:
-                    self.semaphore.release()
-
-            deps = dag.all_downstreams(node)
-            threads[node] = Thread(target=_fn, args=(node, deps), name=node)
-
-        # Start up all of the threads.
-        for node in nodes:
-            threads[node].start()
-
-        # Wait for all threads to complete executing.
-        wait_for(nodes)
+        graph = dag.graph
+        if not graph:
+            return
+
+        # number of direct dependencies that have not finished for each node
+        remaining = {node: len(deps) for node, deps in graph.items()}
+        # nodes that depend directly on each node
+        dependants: Dict[str, List[str]] = {node: [] for node in graph}
+        for node, deps in graph.items():
+            for dep in deps:
+                dependants[dep].append(node)
+
+        # ready nodes are held here rather than in the executor's queue so the
+        # next node to start is always the one with the longest critical path;
+        # ties are broken using topological order
+        order = dag.topological_sort()
+        order.reverse()
+        index = {node: i for i, node in enumerate(order)}
+        priority = {
+            node: (-length, index[node])
+            for node, length in dag.critical_path_lengths(self.weights).items()
+        }
+        ready: List[Tuple[Tuple[float, int], str]] = [
+            (priority[node], node) for node in order if not remaining[node]
+        ]
+        heapq.heapify(ready)
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_workers or len(graph),
+            thread_name_prefix="cfngin-walker",
+        ) as executor:
+            running: Dict[concurrent.futures.Future[Any], str] = {}
+            while ready or running:
+                while ready and (
+                    not self.max_workers or len(running) < self.max_workers
+                ):
+                    _, node = heapq.heappop(ready)
+                    LOGGER.debug("%s starting", node)
+                    running[executor.submit(walk_func, node)] = node
+                done, _ = concurrent.futures.wait(
+                    running, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    node = running.pop(future)
+                    exc = future.exception()
+                    if exc:
+                        LOGGER.error(
+                            "%s raised an unhandled exception",
+                            node,
+                            exc_info=(type(exc), exc, exc.__traceback__),
+                        )
+                    LOGGER.debug("%s complete", node)
+                    for dependant in dependants[node]:
+                        remaining[dependant] -= 1
+                        if not remaining[dependant]:
+                            heapq.heappush(ready, (priority[dependant], dependant))
@@ -373,6 +373,25 @@ class PersistentGraphLockCodeMissmatch(CfnginError):
         super().__init__()
 
 
+class PersistentGraphModified(CfnginError):
+    """Raised when the persistent graph in S3 was modified by another session.
+
+    The persistent graph is only updated if it has not changed since it was
+    last read or written by the current session.
+
+    """
+
+    message: str
+
+    def __init__(self, location: str) -> None:
+        """Instantiate class."""
+        self.message = (
+            f"Persistent graph '{location}' was modified by another session "
+            "since it was last read"
+        )
+        super().__init__()
+
+
 class PersistentGraphUnlocked(CfnginError):
     """Raised when the persistent graph in S3 is unlock.
 
@@ -9,6 +9,7 @@ from pydantic import Extra, Field, validator
 from typing_extensions import Literal, TypedDict
 
 from ....compat import cached_property
+from ....lookups.handlers.base import LOOKUP_CACHE
 from ....utils import BaseModel, JsonEncoder
 from ..utils import TagDataModel
 
@@ -140,6 +141,7 @@ class _Parameter:
         """Delete parameter."""
         try:
             self.client.delete_parameter(Name=self.args.name)
+            LOOKUP_CACHE.invalidate(self.args.name)
             LOGGER.info("deleted SSM Parameter %s", self.args.name)
         except self.client.exceptions.ParameterNotFound:
             LOGGER.info("delete parameter skipped; %s not found", self.args.name)
@@ -205,6 +207,7 @@ class _Parameter:
                         by_alias=True, exclude_none=True, exclude={"force", "tags"}
                     )
                 )
+                LOOKUP_CACHE.invalidate(self.args.name)
             except self.client.exceptions.ParameterAlreadyExists:
                 LOGGER.warning(
                     "parameter %s already exists; to overwrite it's value, "
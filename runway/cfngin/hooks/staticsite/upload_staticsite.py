@@ -62,6 +62,7 @@ def sync(
     *,
     bucket_name: str,
     cf_disabled: bool = False,
+    content_hash: bool = False,
     distribution_domain: str = "undefined",
     distribution_id: str = "undefined",
     distribution_path: str = "/*",
@@ -75,6 +76,8 @@ def sync(
         context: The context instance.
         bucket_name: S3 bucket name.
         cf_disabled: Disable the use of CloudFront.
+        content_hash: Compare the MD5 of local files with the ETag of objects
+            in S3 rather than their size and modification time.
         distribution_domain: Domain of the CloudFront distribution.
         distribution_id: CloudFront distribution ID.
         distribution_path: Path in the CloudFront distribution to invalidate.
@@ -103,6 +106,12 @@ def sync(
         bucket = Bucket(context, bucket_name)
         bucket.sync_from_local(
             build_context["app_directory"],
+            content_hash=content_hash,
+            content_hash_manifest=context.config.cfngin_cache_dir
+            / "staticsite"
+            / f"{bucket_name}.manifest.json"
+            if content_hash
+            else None,
             delete=True,
             exclude=[f["name"] for f in extra_files if "name" in f],
         )
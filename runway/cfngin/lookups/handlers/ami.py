@@ -2,18 +2,28 @@
 # pyright: reportIncompatibleMethodOverride=none
 from __future__ import annotations
 
+import hashlib
+import json
+import logging
 import operator
 import re
-from typing import TYPE_CHECKING, Any, Dict
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-from ....lookups.handlers.base import LookupHandler
+from ....lookups.handlers.base import LOOKUP_CACHE, LookupHandler
 from ...utils import read_value_from_path
 
 if TYPE_CHECKING:
     from ....context import CfnginContext
 
+LOGGER = logging.getLogger(__name__)
 TYPE_NAME = "ami"
 
+#: Keys of an image that are used by the lookup and retained when cached.
+IMAGE_KEYS = ("CreationDate", "ImageId", "Name")
+
 
 class ImageNotFound(Exception):
     """Image not found."""
@@ -32,6 +42,8 @@ class ImageNotFound(Exception):
 class AmiLookup(LookupHandler):
     """AMI lookup."""
 
+    CACHE_TTL = 300.0
+
     @classmethod
     def handle(  # pylint: disable=arguments-differ
         cls, value: str, context: CfnginContext, *__args: Any, **__kwargs: Any
@@ -75,8 +87,6 @@ class AmiLookup(LookupHandler):
         if "@" in value:
             region, value = value.split("@", 1)
 
-        ec2 = context.get_session(region=region).client("ec2")
-
         values: Dict[str, Any] = {}
         describe_args: Dict[str, Any] = {}
 
@@ -88,28 +98,23 @@ class AmiLookup(LookupHandler):
 
         if not values.get("owners"):
             raise Exception("'owners' value required when using ami")
-        owners = values.pop("owners").split(",")
-        describe_args["Owners"] = owners
+        describe_args["Owners"] = sorted(set(values.pop("owners").split(",")))
 
         if not values.get("name_regex"):
             raise Exception("'name_regex' value required when using ami")
         name_regex = values.pop("name_regex")
 
         if values.get("executable_users"):
-            executable_users = values.pop("executable_users").split(",")
-            describe_args["ExecutableUsers"] = executable_users
-
-        filters = [{"Name": k, "Values": v.split(",")} for k, v in values.items()]
-        describe_args["Filters"] = filters
+            describe_args["ExecutableUsers"] = sorted(
+                set(values.pop("executable_users").split(","))
+            )
 
-        result = ec2.describe_images(**describe_args)
+        describe_args["Filters"] = [
+            {"Name": k, "Values": sorted(set(values[k].split(",")))}
+            for k in sorted(values)
+        ]
 
-        images = sorted(
-            result.get("Images", []),
-            key=operator.itemgetter("CreationDate"),
-            reverse=True,
-        )
-        for image in images:
+        for image in cls.describe_images(context, region, describe_args):
             # sometimes we get ARI/AKI in response - these don't have a 'Name'
             if (
                 re.match(f"^{name_regex}$", image.get("Name", ""))
@@ -118,3 +123,95 @@ class AmiLookup(LookupHandler):
                 return image["ImageId"]
 
         raise ImageNotFound(value)
+
+    @classmethod
+    def describe_images(
+        cls, context: CfnginContext, region: Optional[str], args: Dict[str, Any]
+    ) -> List[Dict[str, str]]:
+        """Describe images, newest first.
+
+        Images are cached for the duration of the run by region, credentials
+        and arguments. If :attr:`~cfngin.config.ami_cache_ttl` is set, they
+        are also cached in :attr:`~cfngin.config.cfngin_cache_dir` so they can
+        be reused by subsequent runs.
+
+        Args:
+            context: Context instance.
+            region: Region to describe images in.
+            args: Normalized arguments passed to ``ec2.describe_images``.
+
+        """
+        session = context.get_session(region=region)
+        query = json.dumps(args, sort_keys=True)
+
+        def describe() -> List[Dict[str, str]]:
+            ttl = context.config.ami_cache_ttl
+            cache_file = None
+            if ttl > 0:
+                cache_file = cls._cache_file(context, region, query)
+                images = cls._read_cache_file(cache_file)
+                if images is not None:
+                    return images
+            images = sorted(
+                (
+                    {k: image[k] for k in IMAGE_KEYS if k in image}
+                    for image in session.client("ec2")
+                    .describe_images(**args)
+                    .get("Images", [])
+                ),
+                key=operator.itemgetter("CreationDate"),
+                reverse=True,
+            )
+            if cache_file:
+                cls._write_cache_file(cache_file, images, ttl)
+            return images
+
+        return LOOKUP_CACHE.get(
+            (cls.cache_key(query, context), "images", session.region_name),
+            describe,
+            ttl=cls.CACHE_TTL,
+        )
+
+    @staticmethod
+    def _cache_file(context: CfnginContext, region: Optional[str], query: str) -> Path:
+        """Path of the file used to cache images in the cache directory.
+
+        The account is part of the name as ``self`` and the images that are
+        shared with an account depend on the credentials used.
+
+        """
+        session = context.get_session(region=region)
+        account_id = session.client("sts").get_caller_identity()["Account"]
+        digest = hashlib.sha256(
+            json.dumps([account_id, session.region_name, query]).encode()
+        ).hexdigest()
+        return context.config.cfngin_cache_dir / "ami" / f"{digest}.json"
+
+    @staticmethod
+    def _read_cache_file(cache_file: Path) -> Optional[List[Dict[str, str]]]:
+        """Read images from a cache file if it exists and has not expired."""
+        try:
+            data = json.loads(cache_file.read_text())
+            if data["expires"] > time.time():
+                LOGGER.debug("using images cached in %s", cache_file)
+                return data["images"]
+        except FileNotFoundError:
+            pass
+        except (KeyError, OSError, TypeError, ValueError):
+            LOGGER.debug("unable to read %s", cache_file, exc_info=True)
+        return None
+
+    @staticmethod
+    def _write_cache_file(
+        cache_file: Path, images: List[Dict[str, str]], ttl: int
+    ) -> None:
+        """Write images to a cache file, replacing it atomically."""
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w", dir=cache_file.parent, suffix=".tmp", delete=False
+            ) as tmp_file:
+                json.dump({"expires": time.time() + ttl, "images": images}, tmp_file)
+            Path(tmp_file.name).replace(cache_file)
+        except OSError:
+            LOGGER.debug("unable to write %s", cache_file, exc_info=True)
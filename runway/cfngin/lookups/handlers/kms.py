@@ -3,19 +3,30 @@
 from __future__ import annotations
 
 import codecs
-from typing import TYPE_CHECKING, Any, BinaryIO, Union, cast
+import concurrent.futures
+import logging
+from typing import TYPE_CHECKING, Any, BinaryIO, Optional, Sequence, Tuple, Union, cast
 
-from ....lookups.handlers.base import LookupHandler
+from ....lookups.handlers.base import LOOKUP_CACHE, LookupHandler
 from ...utils import read_value_from_path
 
 if TYPE_CHECKING:
     from ....context import CfnginContext
 
+LOGGER = logging.getLogger(__name__)
 TYPE_NAME = "kms"
 
+#: Maximum number of values decrypted at once by :meth:`KmsLookup.prefetch`.
+DECRYPT_MAX_WORKERS = 10
+
 
 class KmsLookup(LookupHandler):
-    """AWS KMS lookup."""
+    """AWS KMS lookup.
+
+    Decrypted values are kept in memory for the duration of the run so each
+    ciphertext is only decrypted once per region and set of credentials.
+
+    """
 
     @classmethod
     def handle(  # pylint: disable=arguments-differ
@@ -62,22 +73,77 @@ class KmsLookup(LookupHandler):
                 conf_key: PASSWORD
 
         """
+        region, ciphertext = cls._parse_value(value)
+        return cls._decrypt(region, ciphertext, context)
+
+    @classmethod
+    def prefetch(  # pylint: disable=arguments-differ
+        cls, values: Sequence[str], context: CfnginContext
+    ) -> None:
+        """Decrypt the values of multiple lookups concurrently.
+
+        Values that could not be decrypted are decrypted again when the lookup
+        is resolved so that errors are raised as usual.
+
+        Args:
+            values: Parameter(s) given to each lookup.
+            context: Context instance.
+
+        """
+
+        def decrypt(value: str) -> None:
+            try:
+                cls._decrypt(*cls._parse_value(value), context)
+            except Exception as err:  # pylint: disable=broad-except
+                LOGGER.debug("unable to prefetch KMS decrypted value: %s", err)
+
+        if not values:
+            return
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(DECRYPT_MAX_WORKERS, len(values)),
+            thread_name_prefix="kms",
+        ) as executor:
+            list(executor.map(decrypt, values))
+
+    @classmethod
+    def _decrypt(
+        cls, region: Optional[str], ciphertext: bytes, context: CfnginContext
+    ) -> str:
+        """Decrypt a value, reusing the result of a previous decrypt if possible.
+
+        Args:
+            region: Region of the KMS key.
+            ciphertext: Raw encrypted value.
+            context: Context instance.
+
+        """
+        session = context.get_session(region=region)
+
+        def decrypt() -> str:
+            kms = session.client("kms")
+            # decrypt and return the plain text raw value.
+            decrypted = cast(
+                Union[BinaryIO, bytes],
+                kms.decrypt(CiphertextBlob=ciphertext).get("Plaintext", b""),
+            )
+            if isinstance(decrypted, bytes):
+                return decrypted.decode()
+            return decrypted.read().decode()
+
+        return LOOKUP_CACHE.get(
+            (cls.cache_key("", context), ciphertext, session.region_name),
+            decrypt,
+            ttl=float("inf"),
+        )
+
+    @staticmethod
+    def _parse_value(value: str) -> Tuple[Optional[str], bytes]:
+        """Parse the value of the lookup into a region and raw encrypted value."""
         value = read_value_from_path(value)
 
         region = None
         if "@" in value:
             region, value = value.split("@", 1)
 
-        kms = context.get_session(region=region).client("kms")
-
         # get raw but still encrypted value from base64 version.
-        decoded = codecs.decode(value.encode(), "base64")
-
-        # decrypt and return the plain text raw value.
-        decrypted = cast(
-            Union[BinaryIO, bytes],
-            kms.decrypt(CiphertextBlob=decoded).get("Plaintext", b""),
-        )
-        if isinstance(decrypted, bytes):
-            return decrypted.decode()
-        return decrypted.read().decode()
+        return region, codecs.decode(value.encode(), "base64")
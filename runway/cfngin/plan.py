@@ -19,6 +19,7 @@ from typing import (
     Set,
     TypeVar,
     Union,
+    cast,
     overload,
 )
 
@@ -40,6 +41,8 @@ from .ui import ui
 from .utils import stack_template_key_name
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from ..context import CfnginContext
     from .providers.aws.default import Provider
     from .status import Status
@@ -48,6 +51,23 @@ LOGGER = logging.getLogger(__name__)
 
 _T = TypeVar("_T")
 
+#: Seconds that updates to the persistent graph are coalesced before writing.
+PERSISTENT_GRAPH_WRITE_DELAY = 5.0
+
+#: Step being run by the current thread.
+_STEP_LOCAL = threading.local()
+
+
+def count_api_call(**_kwargs: Any) -> None:
+    """Count an AWS API call against the step being run by the current thread.
+
+    Intended to be registered as a botocore ``before-call`` event handler.
+
+    """
+    step: Optional[Step] = getattr(_STEP_LOCAL, "step", None)
+    if step:
+        step.api_calls += 1
+
 
 @overload
 def json_serial(obj: Set[_T]) -> List[_T]:
@@ -94,21 +114,33 @@ class Step:
     """State machine for executing generic actions related to stacks.
 
     Attributes:
+        api_calls: Number of AWS API calls made by the thread running the step.
+        completed_at: Time when the step was done (completed, skipped or failed).
         fn: Function to run to execute the step.
             This function will be ran multiple times until the step is "done".
         last_updated: Time when the step was last updated.
         logger: Logger for logging messages about the step.
+        poll_count: Number of times ``fn`` was run after the step was submitted.
+        queued_at: Time when the dependencies of the step were done.
         stack: the stack associated with this step
+        started_at: Time when the step started running.
         status: The status of step.
+        submitted_at: Time when the step was submitted.
         watch_func: Function that will be called to "tail" the step action.
 
     """
 
+    api_calls: int
+    completed_at: Optional[float]
     fn: Optional[Callable[..., Any]]
     last_updated: float
     logger: PrefixAdaptor
+    poll_count: int
+    queued_at: Optional[float]
     stack: Stack
+    started_at: Optional[float]
     status: Status
+    submitted_at: Optional[float]
     watch_func: Optional[Callable[..., Any]]
 
     def __init__(
@@ -134,9 +166,27 @@ class Step:
         self.logger = PrefixAdaptor(self.stack.name, LOGGER)
         self.fn = fn
         self.watch_func = watch_func
+        self.api_calls = 0
+        self.completed_at = None
+        self.poll_count = 0
+        self.queued_at = None
+        self.started_at = None
+        self.submitted_at = None
+
+    @property
+    def duration(self) -> Optional[float]:
+        """Seconds between when the step started running and when it was done."""
+        if self.started_at is None or self.completed_at is None:
+            return None
+        return self.completed_at - self.started_at
 
     def run(self) -> bool:
         """Run this step until it has completed or been skipped."""
+        if not self.done:
+            self.started_at = time.time()
+            if self.queued_at is None:
+                self.queued_at = self.started_at
+        _STEP_LOCAL.step = self
         stop_watcher = threading.Event()
         watcher = None
         if self.watch_func:
@@ -149,6 +199,7 @@ class Step:
             while not self.done:
                 self._run_once()
         finally:
+            _STEP_LOCAL.step = None
             if watcher:
                 stop_watcher.set()
                 watcher.join()
@@ -158,6 +209,8 @@ class Step:
         """Run a step exactly once."""
         if not self.fn:
             raise TypeError("Step.fn must be type Callable[..., Status] not None")
+        if self.submitted:
+            self.poll_count += 1
         try:
             status = self.fn(self.stack, status=self.status)
         except CancelExecution:
@@ -232,6 +285,10 @@ class Step:
             LOGGER.debug("setting %s state to %s...", self.stack.name, status.name)
             self.status = status
             self.last_updated = time.time()
+            if status == SUBMITTED and self.submitted_at is None:
+                self.submitted_at = self.last_updated
+            if self.done:
+                self.completed_at = self.last_updated
             if self.stack.logging:
                 self.log_step()
 
@@ -575,10 +632,82 @@ class Graph:
         return self.dumps()
 
 
+class _PersistentGraphWriter:
+    """Coalesce updates to the persistent graph into fewer writes to S3.
+
+    Rather than writing the persistent graph each time a step changes it,
+    a write is scheduled to happen after a short delay in a background thread
+    so that steps finishing close together result in a single write.
+    :meth:`flush` must be called once the plan is done being walked to write
+    any update that is still pending.
+
+    """
+
+    def __init__(
+        self,
+        context: CfnginContext,
+        lock_code: str,
+        delay: float = PERSISTENT_GRAPH_WRITE_DELAY,
+    ) -> None:
+        """Instantiate class.
+
+        Args:
+            context: Context object.
+            lock_code: Code used to lock the persistent graph.
+            delay: Seconds to wait for more updates before writing.
+
+        """
+        self.context = context
+        self.delay = delay
+        #: Held while changing or writing the persistent graph.
+        self.lock = threading.RLock()
+        self.lock_code = lock_code
+        self._pending = False
+        self._timer: Optional[threading.Timer] = None
+
+    def schedule(self) -> None:
+        """Schedule the persistent graph to be written."""
+        with self.lock:
+            self._pending = True
+            if self._timer:
+                return
+            self._timer = threading.Timer(self.delay, self._flush_in_background)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self) -> None:
+        """Write the persistent graph now if an update is pending."""
+        with self.lock:
+            if self._timer:
+                self._timer.cancel()
+                self._timer = None
+            if not self._pending:
+                return
+            self.context.put_persistent_graph(self.lock_code)
+            self._pending = False
+
+    def _flush_in_background(self) -> None:
+        """Write the persistent graph from the timer thread.
+
+        The update remains pending if it fails so it is retried by the final
+        call to :meth:`flush`.
+
+        """
+        with self.lock:
+            self._timer = None
+            try:
+                self.flush()
+            except Exception as exc:  # pylint: disable=broad-except
+                LOGGER.warning(
+                    "failed to write persistent graph; it will be retried: %s", exc
+                )
+
+
 class Plan:
     """A convenience class for working on a Graph.
 
     Attributes:
+        completed_at: Time when the plan was last done being walked.
         context: Context object.
         description: Plan description.
         graph: Graph of the plan.
@@ -586,15 +715,18 @@ class Plan:
         reverse: The graph has been transposed for walking in reverse.
         require_unlocked: Require the persistent graph to be unlocked before
             executing steps.
+        started_at: Time when the plan last started being walked.
 
     """
 
+    completed_at: Optional[float]
     context: Optional[CfnginContext]
     description: str
     graph: Graph
     id: uuid.UUID
     require_unlocked: bool
     reverse: bool
+    started_at: Optional[float]
 
     def __init__(
         self,
@@ -615,9 +747,11 @@ class Plan:
                 unlocked before executing steps.
 
         """
+        self.completed_at = None
         self.context = context
         self.description = description
         self.id = uuid.uuid4()
+        self.started_at = None
         self.reverse = reverse
         self.require_unlocked = require_unlocked
 
@@ -715,7 +849,12 @@ class Plan:
         """
         if self.locked and self.require_unlocked:
             raise PersistentGraphLocked
-        self.walk(*args, **kwargs)
+        try:
+            self.walk(*args, **kwargs)
+        finally:
+            if self.context and self.started_at:
+                self.write_report(self.context.run_report_path)
+                self.log_critical_path()
 
         failed_steps = [step for step in self.steps if step.status == FAILED]
         if failed_steps:
@@ -739,40 +878,235 @@ class Plan:
                 step: :class:`Step` to execute.
 
             """
+            dependencies = self.graph.downstream(step.name)
+            step.queued_at = max(
+                (dep.completed_at for dep in dependencies if dep.completed_at),
+                default=self.started_at,
+            )
             # Before we execute the step, we need to ensure that it's
             # transitive dependencies are all in an "ok" state. If not, we
             # won't execute this step.
-            for dep in self.graph.downstream(step.name):
+            for dep in dependencies:
                 if not dep.ok:
                     step.set_status(FailedStatus("dependency has failed"))
                     return step.ok
 
             result = step.run()
 
-            if not self.context or not self.context.persistent_graph:
+            if not self.context or not writer:
+                return result
+
+            fn_name = step.fn.__name__ if callable(step.fn) else str(step.fn)
+            if step.completed:
+                # used to prioritize the critical path of future runs
+                self.context.stack_durations.setdefault(fn_name, {})[step.name] = cast(
+                    float, step.duration
+                )
+
+            if not self.context.persistent_graph:
                 return result
 
             if step.completed or (
                 step.skipped
                 and step.status.reason == ("does not exist in cloudformation")
             ):
-                fn_name = step.fn.__name__ if callable(step.fn) else step.fn
-                if fn_name == "_destroy_stack":
-                    self.context.persistent_graph.pop(step)
-                    LOGGER.debug(
-                        "removed step '%s' from the persistent graph", step.name
-                    )
-                elif fn_name == "_launch_stack":
-                    self.context.persistent_graph.add_step_if_not_exists(
-                        step, add_dependencies=True, add_dependants=True
-                    )
-                    LOGGER.debug("added step '%s' to the persistent graph", step.name)
-                else:
-                    return result
-                self.context.put_persistent_graph(self.lock_code)
+                with writer.lock:
+                    if fn_name == "_destroy_stack":
+                        self.context.persistent_graph.pop(step)
+                        LOGGER.debug(
+                            "removed step '%s' from the persistent graph", step.name
+                        )
+                    elif fn_name == "_launch_stack":
+                        self.context.persistent_graph.add_step_if_not_exists(
+                            step, add_dependencies=True, add_dependants=True
+                        )
+                        LOGGER.debug(
+                            "added step '%s' to the persistent graph", step.name
+                        )
+                    else:
+                        return result
+                writer.schedule()
+            return result
+
+        writer = (
+            _PersistentGraphWriter(self.context, self.lock_code)
+            if self.context
+            else None
+        )
+        self.started_at = time.time()
+        walked = False
+        try:
+            result = self.graph.walk(walker, walk_func)
+            walked = True
             return result
+        finally:
+            self.completed_at = time.time()
+            if writer:
+                try:
+                    writer.flush()
+                except Exception:  # pylint: disable=broad-except
+                    if walked:
+                        raise
+                    # don't hide the error that stopped the walk
+                    LOGGER.error("failed to write persistent graph", exc_info=True)
+
+    def critical_path(self) -> List[Step]:
+        """Return the chain of steps that determined how long the plan took.
+
+        Starting from the step that was done last, each step is preceded by
+        the dependency that was done last (the one it was waiting on).
+
+        """
+        candidates = [step for step in self.steps if step.started_at is not None]
+        path: List[Step] = []
+        while candidates:
+            step = max(candidates, key=lambda i: i.completed_at or 0.0)
+            path.append(step)
+            candidates = [
+                dep
+                for dep in self.graph.downstream(step.name)
+                if dep.started_at is not None
+            ]
+        path.reverse()
+        return path
+
+    def log_critical_path(self, level: int = logging.INFO) -> None:
+        """Log a summary of the critical path of the last walk of the plan.
+
+        Args:
+            level: A valid log level that should be used to log the summary.
+
+        """
+        path = self.critical_path()
+        if not path or self.started_at is None or self.completed_at is None:
+            return
+        LOGGER.log(
+            level,
+            'plan "%s" took %.1fs; critical path:',
+            self.description,
+            self.completed_at - self.started_at,
+        )
+        for step in path:
+            LOGGER.log(
+                level,
+                "  - %s: %.1fs (waited %.1fs; %s api call(s), %s poll(s))",
+                step.name,
+                step.duration or 0.0,
+                (step.started_at or 0.0) - (step.queued_at or step.started_at or 0.0),
+                step.api_calls,
+                step.poll_count,
+            )
+
+    def to_report(self) -> Dict[str, Any]:
+        """Return timing information about the last walk of the plan."""
+        return {
+            "description": self.description,
+            "id": str(self.id),
+            "started_at": self.started_at,
+            "completed_at": self.completed_at,
+            "critical_path": [step.name for step in self.critical_path()],
+            "steps": [
+                {
+                    "name": step.name,
+                    "fn": step.fn.__name__ if callable(step.fn) else step.fn,
+                    "status": step.status.name,
+                    "reason": step.status.reason,
+                    "requires": sorted(
+                        dep.name for dep in self.graph.downstream(step.name)
+                    ),
+                    "queued_at": step.queued_at,
+                    "started_at": step.started_at,
+                    "submitted_at": step.submitted_at,
+                    "completed_at": step.completed_at,
+                    "duration": step.duration,
+                    "api_calls": step.api_calls,
+                    "poll_count": step.poll_count,
+                }
+                for step in self.steps
+            ],
+        }
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Return the last walk of the plan in the Chrome trace event format.
+
+        Each step is given its own row containing the time it spent queued,
+        running until it was submitted and waiting for it to complete.
+        The result can be loaded into ``chrome://tracing`` or
+        https://ui.perfetto.dev.
 
-        return self.graph.walk(walker, walk_func)
+        """
+        origin = self.started_at or 0.0
+        events: List[Dict[str, Any]] = []
+
+        def add_event(tid: int, name: str, start: Optional[float], end: Any) -> None:
+            if start is None or end is None or end < start:
+                return
+            events.append(
+                {
+                    "name": name,
+                    "cat": "cfngin",
+                    "ph": "X",
+                    "pid": 1,
+                    "tid": tid,
+                    "ts": round((start - origin) * 1e6),
+                    "dur": round((end - start) * 1e6),
+                }
+            )
+
+        for tid, step in enumerate(self.steps, start=1):
+            events.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": 1,
+                    "tid": tid,
+                    "args": {"name": step.name},
+                }
+            )
+            add_event(tid, "queued", step.queued_at, step.started_at)
+            add_event(
+                tid, "run", step.started_at, step.submitted_at or step.completed_at
+            )
+            add_event(tid, "wait", step.submitted_at, step.completed_at)
+            if step.completed_at is not None:
+                events.append(
+                    {
+                        "name": step.status.name,
+                        "cat": "cfngin",
+                        "ph": "i",
+                        "s": "t",
+                        "pid": 1,
+                        "tid": tid,
+                        "ts": round((step.completed_at - origin) * 1e6),
+                        "args": {
+                            "reason": step.status.reason,
+                            "api_calls": step.api_calls,
+                            "poll_count": step.poll_count,
+                        },
+                    }
+                )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_report(self, path: Path) -> None:
+        """Write a report of the last walk of the plan.
+
+        The report is written to ``path`` and a Chrome trace is written
+        alongside it with a suffix of ``.trace.json``.
+
+        Args:
+            path: Path of the report file.
+
+        """
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(self.to_report(), indent=4))
+            path.with_suffix(".trace.json").write_text(
+                json.dumps(self.to_chrome_trace())
+            )
+        except OSError as exc:
+            LOGGER.debug("unable to write run report: %s", exc)
+            return
+        LOGGER.debug("run report written to %s", path)
 
     @property
     def lock_code(self) -> str:
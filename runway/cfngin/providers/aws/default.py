@@ -26,10 +26,14 @@ import botocore.exceptions
 import yaml
 from botocore.config import Config
 
+from ....lookups.handlers.base import LOOKUP_CACHE
+from ....lookups.handlers.ssm import TYPE_NAME as SSM_LOOKUP
 from ....utils import DOC_SITE, JsonEncoder
 from ... import exceptions
+from ...actions.base import STACK_POLL_TIME
 from ...actions.diff import DictValue, diff_parameters
 from ...actions.diff import format_params_diff as format_diff
+from ...plan import count_api_call
 from ...session_cache import get_session
 from ...ui import ui
 from ...utils import parse_cloudformation_template
@@ -78,6 +82,11 @@ MAX_ATTEMPTS = 10
 MAX_TAIL_RETRIES = 15
 TAIL_RETRY_SLEEP = 1
 GET_EVENTS_SLEEP = 1
+
+# Number of seconds a stack returned by DescribeStacks is reused before it is
+# described again. Entries are dropped as soon as CFNgin submits a change to
+# the stack so this only needs to account for changes made outside of CFNgin.
+STACK_CACHE_TTL = 300
 DEFAULT_CAPABILITIES = ["CAPABILITY_NAMED_IAM", "CAPABILITY_AUTO_EXPAND"]
 
 
@@ -540,6 +549,201 @@ def generate_stack_policy_args(
     return args
 
 
+class _StackWaiter:
+    """Thread waiting on the status of a stack."""
+
+    __slots__ = ("done", "due", "error", "ready", "stack", "stack_name")
+
+    def __init__(self, stack_name: str, delay: float) -> None:
+        """Instantiate class.
+
+        Args:
+            stack_name: Name of the stack.
+            delay: Number of seconds to wait before refreshing the stack.
+
+        """
+        now = time.time()
+        self.done = False
+        #: time when a sweep must be started for this waiter
+        self.due = now + delay
+        self.error: Optional[Exception] = None
+        #: time after which a sweep started for another waiter can be used
+        self.ready = now + delay / 2
+        self.stack: Optional[StackTypeDef] = None
+        self.stack_name = stack_name
+
+
+class StackStatusPoller:
+    """Shared poller used to refresh the status of in-flight stacks.
+
+    Rather than each step calling DescribeStacks for its own stack, threads
+    waiting on a stack register with the poller. When the wait of any thread
+    is due, one of the waiting threads refreshes every registered stack
+    and the other threads are woken through a condition variable once the
+    result is available.
+
+    Registered stacks are described one at a time unless there are more of
+    them than the number of pages it takes to describe every stack in the
+    region, in which case a single paginated DescribeStacks sweep is used.
+
+    The wait for each stack adapts to how long the stack has been in
+    progress. It starts at ``min_interval`` right after a stack is submitted
+    and backs off to ``interval`` for long running changes. A wait can be
+    ended early with :meth:`wake` (e.g. when a terminal stack event is seen
+    while tailing the stack).
+
+    """
+
+    #: Fraction of the time a stack has been in progress used as the next delay.
+    BACKOFF_FACTOR = 0.25
+
+    #: Number of pages a sweep is assumed to take before one has been made.
+    SWEEP_PAGES = 5
+
+    def __init__(
+        self,
+        provider: Provider,
+        interval: float = STACK_POLL_TIME,
+        min_interval: float = 2.0,
+    ) -> None:
+        """Instantiate class.
+
+        Args:
+            provider: Provider used to describe stacks.
+            interval: Maximum number of seconds to wait before refreshing a stack.
+            min_interval: Minimum number of seconds to wait before refreshing
+                a stack.
+
+        """
+        self.interval = interval
+        self.min_interval = min_interval
+        self.provider = provider
+        #: number of pages taken by the last sweep
+        self.sweep_pages = self.SWEEP_PAGES
+        self._condition = threading.Condition()
+        self._in_progress_since: Dict[str, float] = {}
+        self._sweeping = False
+        self._waiters: List[_StackWaiter] = []
+
+    def get_delay(self, stack_name: str) -> float:
+        """Get the number of seconds to wait before refreshing a stack.
+
+        Args:
+            stack_name: Name of the stack.
+
+        """
+        with self._condition:
+            now = time.time()
+            elapsed = now - self._in_progress_since.setdefault(stack_name, now)
+        return min(self.interval, max(self.min_interval, elapsed * self.BACKOFF_FACTOR))
+
+    def wait(
+        self, stack_name: str, cancel: Optional[threading.Event] = None
+    ) -> StackTypeDef:
+        """Wait for the next refresh of a stack and return its data.
+
+        Args:
+            stack_name: Name of the stack.
+            cancel: Event that will interrupt the wait when set.
+
+        Raises:
+            CancelExecution: The wait was interrupted by ``cancel``.
+            StackDoesNotExist: The stack was not found by the sweep.
+
+        """
+        waiter = _StackWaiter(stack_name, self.get_delay(stack_name))
+        with self._condition:
+            self._waiters.append(waiter)
+            try:
+                while not waiter.done:
+                    if cancel and cancel.is_set():
+                        raise exceptions.CancelExecution
+                    remaining = min(w.due for w in self._waiters) - time.time()
+                    if not self._sweeping and remaining <= 0:
+                        self._sweep()
+                        continue
+                    # wake periodically to check for cancellation
+                    self._condition.wait(
+                        1.0 if self._sweeping else min(max(remaining, 0), 1.0)
+                    )
+            finally:
+                self._waiters.remove(waiter)
+        if waiter.error:
+            raise waiter.error
+        if not waiter.stack:
+            raise exceptions.StackDoesNotExist(stack_name)
+        return waiter.stack
+
+    def wake(self, stack_name: str) -> None:
+        """Refresh a stack now rather than waiting for its next refresh.
+
+        Args:
+            stack_name: Name of the stack.
+
+        """
+        with self._condition:
+            now = time.time()
+            for waiter in self._waiters:
+                if waiter.stack_name == stack_name:
+                    waiter.due = waiter.ready = now
+            self._condition.notify_all()
+
+    def _sweep(self) -> None:
+        """Refresh all registered stacks.
+
+        Must be called while holding the condition's lock. The lock is
+        released while calling the API.
+
+        """
+        self._sweeping = True
+        started = time.time()
+        stack_names = {waiter.stack_name for waiter in self._waiters}
+        waiters = [waiter for waiter in self._waiters if waiter.ready <= started]
+        self._condition.release()
+        stacks: Dict[str, StackTypeDef] = {}
+        error: Optional[Exception] = None
+        try:
+            if len(stack_names) <= self.sweep_pages:
+                for stack_name in sorted(stack_names):
+                    try:
+                        stacks[stack_name] = self.provider.get_stack(
+                            stack_name, use_cache=False
+                        )
+                    except exceptions.StackDoesNotExist:
+                        pass
+            else:
+                paginator = self.provider.cloudformation.get_paginator(
+                    "describe_stacks"
+                )
+                pages = 0
+                for page in paginator.paginate():
+                    pages += 1
+                    for stack in page.get("Stacks", []):
+                        if stack["StackName"] in stack_names:
+                            self.provider.cache_stack(stack)
+                            stacks[stack["StackName"]] = stack
+                self.sweep_pages = pages
+            LOGGER.debug(
+                "refreshed status of %s in-flight stack(s); %s found",
+                len(stack_names),
+                len(stacks),
+            )
+        except Exception as exc:  # pylint: disable=broad-except
+            error = exc
+        finally:
+            self._condition.acquire()
+            for stack_name in stack_names:
+                stack = stacks.get(stack_name)
+                if not stack or not stack["StackStatus"].endswith("_IN_PROGRESS"):
+                    self._in_progress_since.pop(stack_name, None)
+            for waiter in waiters:
+                waiter.done = True
+                waiter.error = error
+                waiter.stack = stacks.get(waiter.stack_name)
+            self._sweeping = False
+            self._condition.notify_all()
+
+
 class ProviderBuilder:
     """Implements a Memorized ProviderBuilder for the AWS provider."""
 
@@ -585,6 +789,8 @@ class ProviderBuilder:
 class Provider(BaseProvider):
     """AWS CloudFormation Provider."""
 
+    #: capabilities submitted when creating or updating a stack
+    CAPABILITIES = DEFAULT_CAPABILITIES
     COMPLETE_STATUSES = (
         "CREATE_COMPLETE",
         "DELETE_COMPLETE",
@@ -625,10 +831,12 @@ class Provider(BaseProvider):
 
     cloudformation: CloudFormationClient
     interactive: bool
+    poller: StackStatusPoller
     recreate_failed: bool
     region: Optional[str]
     replacements_only: bool
     service_role: Optional[str]
+    stack_output_index: bool
 
     def __init__(
         self,
@@ -639,27 +847,155 @@ class Provider(BaseProvider):
         region: Optional[str] = None,
         replacements_only: bool = False,
         service_role: Optional[str] = None,
+        stack_output_index: bool = False,
     ):
         """Instantiate class."""
         self._outputs: Dict[str, Dict[str, str]] = {}
+        #: stacks invalidated while the output index is being built
+        self._outputs_invalidated: Optional[Set[str]] = None
+        self._stack_cache: Dict[str, Tuple[float, StackTypeDef]] = {}
+        # guards the stack cache and the stored outputs of stacks
+        self._stack_cache_lock = threading.Lock()
+        self._stack_output_index_built = False
+        self._stack_output_index_lock = threading.Lock()
         self.cloudformation = get_cloudformation_client(session)
+        self.cloudformation.meta.events.register("before-call", count_api_call)
         self.interactive = interactive
+        self.poller = StackStatusPoller(self)
         self.recreate_failed = interactive or recreate_failed
         self.region = region
         # replacements only is only used in interactive mode
         self.replacements_only = interactive and replacements_only
         self.service_role = service_role
+        self.stack_output_index = stack_output_index
+
+    def get_stack(
+        self, stack_name: str, *_args: Any, use_cache: bool = True, **_kwargs: Any
+    ) -> StackTypeDef:
+        """Get stack.
+
+        Stacks that are not in progress are cached for :data:`STACK_CACHE_TTL`
+        seconds. The cache entry of a stack is dropped when a change to the
+        stack is submitted.
+
+        Args:
+            stack_name: Name of the stack.
+            use_cache: Return the cached stack if one is available.
+
+        Raises:
+            StackDoesNotExist: The stack does not exist.
 
-    def get_stack(self, stack_name: str, *_args: Any, **_kwargs: Any) -> StackTypeDef:
-        """Get stack."""
+        """
+        if use_cache:
+            with self._stack_cache_lock:
+                cached = self._stack_cache.get(stack_name)
+            if cached and time.time() - cached[0] < STACK_CACHE_TTL:
+                return cached[1]
         try:
-            return self.cloudformation.describe_stacks(StackName=stack_name)["Stacks"][
+            stack = self.cloudformation.describe_stacks(StackName=stack_name)["Stacks"][
                 0
             ]
         except botocore.exceptions.ClientError as err:
             if "does not exist" not in str(err):
                 raise
+            self.invalidate_stack_cache(stack_name)
             raise exceptions.StackDoesNotExist(stack_name)
+        self.cache_stack(stack)
+        return stack
+
+    def cache_stack(self, stack: StackTypeDef) -> None:
+        """Add the data of a stack to the cache used by :meth:`get_stack`.
+
+        Stacks that are in progress are not cached since their data is
+        about to change.
+
+        Args:
+            stack: Stack data returned by DescribeStacks.
+
+        """
+        with self._stack_cache_lock:
+            if self.get_stack_status(stack).endswith("_IN_PROGRESS"):
+                self._stack_cache.pop(stack["StackName"], None)
+            else:
+                self._stack_cache[stack["StackName"]] = (time.time(), stack)
+
+    def index_stack_outputs(self) -> None:
+        """Store the outputs of every stack in the region.
+
+        The first time this is called, every stack is described using as few
+        API calls as possible. After that, the outputs of a stack are only
+        retrieved again once it has been removed from the index by
+        :meth:`invalidate_stack_cache`.
+
+        """
+        with self._stack_output_index_lock:
+            if self._stack_output_index_built:
+                return
+            self._stack_output_index_built = True
+            LOGGER.debug(
+                "indexing outputs of all stacks in region %s", self.region or "default"
+            )
+            with self._stack_cache_lock:
+                self._outputs_invalidated = set()
+            try:
+                for page in self.cloudformation.get_paginator(
+                    "describe_stacks"
+                ).paginate():
+                    for stack in page["Stacks"]:
+                        self.cache_stack(stack)
+                        if self.get_stack_status(stack).endswith("_IN_PROGRESS"):
+                            continue
+                        with self._stack_cache_lock:
+                            # described before it was invalidated so may be stale
+                            if stack["StackName"] not in self._outputs_invalidated:
+                                self._outputs.setdefault(
+                                    stack["StackName"], get_output_dict(stack)
+                                )
+            except botocore.exceptions.ClientError as err:
+                LOGGER.debug("unable to index stack outputs: %s", err)
+            finally:
+                with self._stack_cache_lock:
+                    self._outputs_invalidated = None
+
+    def invalidate_stack_cache(self, stack_name: str, outputs: bool = True) -> None:
+        """Remove a stack from the cache used by :meth:`get_stack`.
+
+        Args:
+            stack_name: Name of the stack.
+            outputs: Also remove the outputs of the stack stored by
+                :meth:`get_outputs` and cached lookup results that use them.
+                Cached SSM parameters are removed as well since the stack
+                can manage them.
+
+        """
+        with self._stack_cache_lock:
+            self._stack_cache.pop(stack_name, None)
+            if outputs:
+                self._outputs.pop(stack_name, None)
+                if self._outputs_invalidated is not None:
+                    self._outputs_invalidated.add(stack_name)
+        if outputs:
+            LOOKUP_CACHE.invalidate(stack_name)
+            LOOKUP_CACHE.invalidate(SSM_LOOKUP)
+
+    def poll_stack(
+        self, stack_name: str, cancel: Optional[threading.Event] = None
+    ) -> StackTypeDef:
+        """Wait for the next status refresh of an in-flight stack.
+
+        The status of all stacks being polled at the same time is refreshed
+        together by :class:`StackStatusPoller`.
+
+        Args:
+            stack_name: Name of the stack.
+            cancel: Event that will interrupt the wait when set.
+
+        Raises:
+            CancelExecution: The wait was interrupted by ``cancel``.
+            StackDoesNotExist: The stack does not exist.
+
+        """
+        return self.poller.wait(stack_name, cancel)
 
     @staticmethod
     def get_stack_status(stack: StackTypeDef, *_args: Any, **_kwargs: Any) -> str:
@@ -733,6 +1069,16 @@ class Provider(BaseProvider):
         log_func = log_func or _log_func
         retries = retries or MAX_TAIL_RETRIES
 
+        def _watch_func(event: StackEventTypeDef) -> None:
+            log_func(event)  # type: ignore
+            # stop waiting on the poller as soon as the stack is done
+            if (
+                event.get("ResourceType") == "AWS::CloudFormation::Stack"
+                and event.get("LogicalResourceId") == stack.fqn
+                and not event.get("ResourceStatus", "").endswith("_IN_PROGRESS")
+            ):
+                self.poller.wake(stack.fqn)
+
         LOGGER.debug("%s:tailing stack...", stack.fqn)
 
         attempts = 0
@@ -740,7 +1086,10 @@ class Provider(BaseProvider):
             attempts += 1
             try:
                 self.tail(
-                    stack.fqn, cancel=cancel, log_func=log_func, include_initial=False
+                    stack.fqn,
+                    cancel=cancel,
+                    log_func=_watch_func,
+                    include_initial=False,
                 )
                 break
             except botocore.exceptions.ClientError as err:
@@ -917,7 +1266,11 @@ class Provider(BaseProvider):
             )
 
         destroy_method = self.select_destroy_method(force_interactive)
-        return destroy_method(fqn=fqn, action=action, approval=approval, **kwargs)
+        try:
+            return destroy_method(fqn=fqn, action=action, approval=approval, **kwargs)
+        finally:
+            # outputs inferred by diff are kept when removing its temporary stack
+            self.invalidate_stack_cache(fqn, outputs=action != "diff")
 
     def create_stack(
         self,
@@ -958,6 +1311,7 @@ class Provider(BaseProvider):
         )
         if not template.url:
             LOGGER.debug("no template url; uploading template directly")
+        self.invalidate_stack_cache(fqn)
         if force_change_set:
             LOGGER.debug("force_change_set set to True; creating stack with changeset")
             _changes, change_set_id = create_change_set(
@@ -1146,15 +1500,18 @@ class Provider(BaseProvider):
         update_method = self.select_update_method(force_interactive, force_change_set)
 
         self.update_termination_protection(fqn, termination_protection)
-        return update_method(
-            fqn,
-            template,
-            old_parameters,
-            parameters,
-            stack_policy=stack_policy,
-            tags=tags,
-            **kwargs,
-        )
+        try:
+            return update_method(
+                fqn,
+                template,
+                old_parameters,
+                parameters,
+                stack_policy=stack_policy,
+                tags=tags,
+                **kwargs,
+            )
+        finally:
+            self.invalidate_stack_cache(fqn)
 
     def update_termination_protection(
         self, fqn: str, termination_protection: bool
@@ -1179,6 +1536,7 @@ class Provider(BaseProvider):
             self.cloudformation.update_termination_protection(
                 EnableTerminationProtection=termination_protection, StackName=fqn
             )
+            self.invalidate_stack_cache(fqn, outputs=False)
 
     def deal_with_changeset_stack_policy(
         self, fqn: str, stack_policy: Optional[Template] = None
@@ -1448,11 +1806,21 @@ class Provider(BaseProvider):
     def get_outputs(
         self, stack_name: str, *_args: Any, **_kwargs: Any
     ) -> Dict[str, str]:
-        """Get stack outputs."""
-        if not self._outputs.get(stack_name):
-            stack = self.get_stack(stack_name)
-            self._outputs[stack_name] = get_output_dict(stack)
-        return self._outputs[stack_name]
+        """Get stack outputs.
+
+        When :attr:`stack_output_index` is enabled, the outputs of every
+        stack in the region are indexed the first time this is called.
+
+        """
+        if self.stack_output_index:
+            self.index_stack_outputs()
+        with self._stack_cache_lock:
+            outputs = self._outputs.get(stack_name)
+        if not outputs:
+            outputs = get_output_dict(self.get_stack(stack_name))
+            with self._stack_cache_lock:
+                self._outputs[stack_name] = outputs
+        return outputs
 
     @staticmethod
     def get_output_dict(stack: StackTypeDef) -> Dict[str, str]:
@@ -1488,6 +1856,8 @@ class Provider(BaseProvider):
         template: Template,
         parameters: List[ParameterTypeDef],
         tags: List[TagTypeDef],
+        *,
+        deferred: Optional[List[Callable[[], None]]] = None,
     ) -> Dict[str, str]:
         """Get the changes from a ChangeSet.
 
@@ -1498,6 +1868,10 @@ class Provider(BaseProvider):
                 to be applied to the Cloudformation stack.
             tags: A list of dictionaries that defines the tags that should be
                 applied to the Cloudformation stack.
+            deferred: If provided, outputting the changes and cleaning up the
+                ChangeSet are appended to this list instead of being done
+                before returning. The outputs of the stack can then be used
+                by dependent stacks without waiting on them.
 
         Returns:
             Stack outputs with inferred changes.
@@ -1525,6 +1899,8 @@ class Provider(BaseProvider):
             change_type,
             service_role=self.service_role,
         )
+        # creating a change set for a new stack creates a temporary stack
+        self.invalidate_stack_cache(stack.fqn)
         new_parameters_as_dict = self.params_as_dict(
             [
                 x
@@ -1538,31 +1914,8 @@ class Provider(BaseProvider):
         )
         params_diff = diff_parameters(old_params, new_parameters_as_dict)
 
-        if changes or params_diff:
-            with ui:
-                if self.interactive:
-                    output_summary(
-                        stack.fqn,
-                        "changes",
-                        changes,
-                        params_diff,
-                        replacements_only=self.replacements_only,
-                    )
-                    output_full_changeset(
-                        full_changeset=changes, params_diff=params_diff, fqn=stack.fqn
-                    )
-                else:
-                    output_full_changeset(
-                        full_changeset=changes,
-                        params_diff=params_diff,
-                        answer="y",
-                        fqn=stack.fqn,
-                    )
-
-        self.cloudformation.delete_change_set(ChangeSetName=change_set_id)
-
         # ensure current stack outputs are loaded
-        self.get_outputs(stack.fqn)
+        outputs = self.get_outputs(stack.fqn)
 
         # infer which outputs may have changed
         refs_to_invalidate: List[str] = []
@@ -1590,7 +1943,7 @@ class Provider(BaseProvider):
         if "Outputs" in old_template:
             for output, props in old_template["Outputs"].items():
                 if any(r in str(props["Value"]) for r in refs_to_invalidate):
-                    self._outputs[stack.fqn].pop(output)
+                    outputs.pop(output)
                     LOGGER.debug("%s:removed from the outputs: %s", output, stack.fqn)
 
         # push values for new + invalidated outputs to outputs
@@ -1598,17 +1951,78 @@ class Provider(BaseProvider):
             output_name,
             output_params,
         ) in stack.blueprint.get_output_definitions().items():
-            if output_name not in self._outputs[stack.fqn]:
-                self._outputs[stack.fqn][
+            if output_name not in outputs:
+                outputs[
                     output_name
                 ] = f"<inferred-change: {stack.fqn}.{output_name}={output_params['Value']}>"
 
+        def finalize() -> None:
+            try:
+                self._output_stack_changes(stack.fqn, changes, params_diff)
+            finally:
+                self._delete_stack_changes(stack.fqn, change_set_id, change_type)
+
+        if deferred is None:
+            finalize()
+        else:
+            deferred.append(finalize)
+        return outputs
+
+    def _output_stack_changes(
+        self,
+        fqn: str,
+        changes: List[ChangeTypeDef],
+        params_diff: List[DictValue[Any, Any]],
+    ) -> None:
+        """Output the changes found by :meth:`get_stack_changes`.
+
+        Args:
+            fqn: The fully qualified name of the Cloudformation stack.
+            changes: Changes of the ChangeSet.
+            params_diff: Differences between the old and new parameters.
+
+        """
+        if not (changes or params_diff):
+            return
+        with ui:
+            if self.interactive:
+                output_summary(
+                    fqn,
+                    "changes",
+                    changes,
+                    params_diff,
+                    replacements_only=self.replacements_only,
+                )
+                output_full_changeset(
+                    full_changeset=changes, params_diff=params_diff, fqn=fqn
+                )
+            else:
+                output_full_changeset(
+                    full_changeset=changes,
+                    params_diff=params_diff,
+                    answer="y",
+                    fqn=fqn,
+                )
+
+    def _delete_stack_changes(
+        self, fqn: str, change_set_id: str, change_type: str
+    ) -> None:
+        """Delete the ChangeSet created by :meth:`get_stack_changes`.
+
+        Args:
+            fqn: The fully qualified name of the Cloudformation stack.
+            change_set_id: ID of the ChangeSet.
+            change_type: Type of the ChangeSet.
+
+        """
+        self.cloudformation.delete_change_set(ChangeSetName=change_set_id)
+
         # when creating a changeset for a new stack, CFN creates a temporary
         # stack with a status of REVIEW_IN_PROGRESS. this is only removed if
         # the changeset is executed or it is manually deleted.
         if change_type == "CREATE":
             try:
-                temp_stack = self.get_stack(stack.fqn)
+                temp_stack = self.get_stack(fqn)
                 if self.is_stack_in_review(temp_stack):
                     LOGGER.debug(
                         "removing temporary stack that is created "
@@ -1619,9 +2033,7 @@ class Provider(BaseProvider):
                     self.destroy_stack(temp_stack, action="diff")
             except exceptions.StackDoesNotExist:
                 # not an issue if the stack was already cleaned up
-                LOGGER.debug("%s:stack does not exist", stack.fqn)
-
-        return self.get_outputs(stack.fqn)
+                LOGGER.debug("%s:stack does not exist", fqn)
 
     @staticmethod
     def params_as_dict(
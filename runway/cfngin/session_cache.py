@@ -1,6 +1,9 @@
 """CFNgin session caching."""
+import hashlib
 import logging
-from typing import Optional
+import os
+import threading
+from typing import Any, Dict, Optional, Tuple
 
 import boto3
 
@@ -13,6 +16,70 @@ LOGGER = logging.getLogger(__name__)
 DEFAULT_PROFILE = None
 
 
+class PooledSession(boto3.Session):
+    """boto3 session that can be shared between threads.
+
+    Creating a botocore session loads endpoint and service model data from
+    disk so sessions are pooled by :func:`get_session` rather than being
+    created each time one is needed. Clients created from the session without
+    any customization are reused as boto3 clients are thread-safe.
+
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Instantiate class."""
+        super().__init__(*args, **kwargs)
+        self._clients: Dict[Tuple[str, Optional[str]], Any] = {}
+        # botocore sessions are not thread-safe so creating clients is serialized
+        self._lock = threading.RLock()
+
+    def client(  # type: ignore
+        self, service_name: str, region_name: Optional[str] = None, **kwargs: Any
+    ) -> Any:
+        """Get a client for a service, reusing it if possible.
+
+        Args:
+            service_name: The name of a service, e.g. 's3' or 'ec2'.
+            region_name: The name of the region associated with the client.
+
+        """
+        with self._lock:
+            if any(value is not None for value in kwargs.values()):
+                return super().client(service_name, region_name=region_name, **kwargs)
+            key = (service_name, region_name)
+            if key not in self._clients:
+                self._clients[key] = super().client(
+                    service_name, region_name=region_name
+                )
+            return self._clients[key]
+
+    def resource(self, *args: Any, **kwargs: Any) -> Any:  # type: ignore
+        """Create a resource service client."""
+        with self._lock:
+            return super().resource(*args, **kwargs)
+
+
+_SESSIONS: Dict[Tuple[Optional[str], ...], PooledSession] = {}
+_SESSIONS_LOCK = threading.Lock()
+
+
+def _credentials_identity(*values: Optional[str]) -> str:
+    """Create an identifier for credentials without keeping them in plain text.
+
+    AWS related environment variables are included as they determine the
+    credentials used when none are provided.
+
+    """
+    env = sorted((k, v) for k, v in os.environ.items() if k.startswith("AWS_"))
+    return hashlib.sha256(repr((values, env)).encode()).hexdigest()
+
+
+def clear_session_cache() -> None:
+    """Remove all pooled sessions."""
+    with _SESSIONS_LOCK:
+        _SESSIONS.clear()
+
+
 def get_session(
     region: Optional[str] = None,
     profile: Optional[str] = None,
@@ -20,7 +87,11 @@ def get_session(
     secret_key: Optional[str] = None,
     session_token: Optional[str] = None,
 ) -> boto3.Session:
-    """Create a thread-safe boto3 session.
+    """Get a thread-safe boto3 session.
+
+    Sessions are pooled by profile, credentials and region. Credentials that
+    can be refreshed (e.g. from an assumed role) continue to be refreshed by
+    the pooled session.
 
     Args:
         region: The region for the session.
@@ -33,29 +104,40 @@ def get_session(
         A thread-safe boto3 session.
 
     """
-    if profile:
-        LOGGER.debug(
-            'building session using profile "%s" in region "%s"',
-            profile,
-            region or "default",
-        )
-    elif access_key:
-        LOGGER.debug(
-            'building session with Access Key "%s" in region "%s"',
-            access_key,
-            region or "default",
-        )
-
-    session = boto3.Session(
-        aws_access_key_id=access_key,
-        aws_secret_access_key=secret_key,
-        aws_session_token=session_token,
-        botocore_session=Session(),  # type: ignore
-        region_name=region,
-        profile_name=profile,
+    key = (
+        profile,
+        access_key,
+        _credentials_identity(access_key, secret_key, session_token),
+        region,
     )
-    cred_provider = session._session.get_component("credential_provider")  # type: ignore
-    provider = cred_provider.get_provider("assume-role")  # type: ignore
-    provider.cache = BOTO3_CREDENTIAL_CACHE
-    provider._prompter = ui.getpass
-    return session
+    with _SESSIONS_LOCK:
+        if key in _SESSIONS:
+            return _SESSIONS[key]
+
+        if profile:
+            LOGGER.debug(
+                'building session using profile "%s" in region "%s"',
+                profile,
+                region or "default",
+            )
+        elif access_key:
+            LOGGER.debug(
+                'building session with Access Key "%s" in region "%s"',
+                access_key,
+                region or "default",
+            )
+
+        session = PooledSession(
+            aws_access_key_id=access_key,
+            aws_secret_access_key=secret_key,
+            aws_session_token=session_token,
+            botocore_session=Session(),  # type: ignore
+            region_name=region,
+            profile_name=profile,
+        )
+        cred_provider = session._session.get_component("credential_provider")  # type: ignore
+        provider = cred_provider.get_provider("assume-role")  # type: ignore
+        provider.cache = BOTO3_CREDENTIAL_CACHE
+        provider._prompter = ui.getpass
+        _SESSIONS[key] = session
+        return session
@@ -1,7 +1,12 @@
 """CFNgin stack."""
 from __future__ import annotations
 
+import importlib
+import re
+import sys
+import types
 from copy import deepcopy
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, cast
 
 from typing_extensions import Literal
@@ -9,7 +14,7 @@ from typing_extensions import Literal
 from runway.utils import load_object_from_string
 from runway.variables import Variable, resolve_variables
 
-from .blueprints.raw import RawTemplateBlueprint
+from .blueprints.raw import RawTemplateBlueprint, get_template_path
 
 if TYPE_CHECKING:
     from ..config.models.cfngin import CfnginStackDefinitionModel
@@ -18,6 +23,53 @@ if TYPE_CHECKING:
     from .providers.aws.default import Provider
 
 
+FILE_LOOKUP_REGEX = re.compile(r"file://([^}\s'\"]+)")
+
+#: Directories containing installed packages which are not considered local files.
+_INSTALLED_PATHS = {
+    Path(__file__).resolve().parent.parent,  # runway
+    *(Path(prefix).resolve() for prefix in {sys.base_prefix, sys.prefix}),
+}
+
+
+def _get_local_module_files(module_name: str) -> Set[Path]:
+    """Get the files of a local module and the local modules it imports.
+
+    Args:
+        module_name: Name of the module.
+
+    """
+    try:
+        pending = [importlib.import_module(module_name)]
+    except ImportError:
+        return set()
+    parts = module_name.split(".")
+    pending.extend(
+        sys.modules[".".join(parts[:i])]
+        for i in range(1, len(parts))
+        if ".".join(parts[:i]) in sys.modules
+    )
+    files: Set[Path] = set()
+    seen: Set[str] = set()
+    while pending:
+        module = pending.pop()
+        if module.__name__ in seen:
+            continue
+        seen.add(module.__name__)
+        if not getattr(module, "__file__", None):
+            continue
+        path = Path(module.__file__).resolve()
+        if any(parent in _INSTALLED_PATHS for parent in path.parents):
+            continue
+        files.add(path)
+        for value in vars(module).values():
+            if isinstance(value, types.ModuleType):
+                pending.append(value)
+            elif getattr(value, "__module__", None) in sys.modules:
+                pending.append(sys.modules[value.__module__])
+    return files
+
+
 def _initialize_variables(
     stack_def: CfnginStackDefinitionModel, variables: Optional[Dict[str, Any]] = None
 ) -> List[Variable]:
@@ -188,6 +240,29 @@ class Stack:
             )
         return self._blueprint
 
+    @property
+    def source_files(self) -> Set[Path]:
+        """Return the local files this stack is built from.
+
+        Includes the template, stack policy, files read by lookups in the
+        stack's variables and the local modules used by the blueprint.
+
+        """
+        files: Set[Path] = set()
+        if self.definition.template_path:
+            template_path = get_template_path(self.definition.template_path)
+            if template_path:
+                files.add(template_path.resolve())
+        if self.definition.stack_policy_path:
+            files.add(self.definition.stack_policy_path.resolve())
+        for match in FILE_LOOKUP_REGEX.finditer(str(self.definition.variables)):
+            files.add((Path.cwd() / match.group(1)).resolve())
+        if self.definition.class_path and "." in self.definition.class_path:
+            files.update(
+                _get_local_module_files(self.definition.class_path.rsplit(".", 1)[0])
+            )
+        return files
+
     @property
     def tags(self) -> Dict[str, Any]:
         """Return the tags that should be set on this stack.
@@ -144,6 +144,8 @@ class CfnginConfig(BaseConfig):
     EXCLUDE_REGEX = r"runway(\..*)?\.(yml|yaml)"
     EXCLUDE_LIST = ["bitbucket-pipelines.yml", "buildspec.yml", "docker-compose.yml"]
 
+    #: Seconds results of the ami lookup are cached in the cache directory.
+    ami_cache_ttl: int
     #: Bucket to use for CFNgin resources. (e.g. CloudFormation templates).
     #: May be an empty string.
     cfngin_bucket: Optional[str]
@@ -172,6 +174,7 @@ class CfnginConfig(BaseConfig):
         CfnginHookDefinitionModel
     ]
     service_role: Optional[str]  #: IAM role for CloudFormation to use.
+    stack_output_index: bool  #: Index the outputs of every stack in a region.
     stacks: List[CfnginStackDefinitionModel]  #: Stacks to be processed.
     sys_path: Optional[Path]  #: Relative or absolute path to use as the work directory.
     tags: Optional[Dict[str, str]]  #: Tags to apply to all resources.
@@ -191,6 +194,7 @@ class CfnginConfig(BaseConfig):
         """
         super().__init__(data, path=path)
 
+        self.ami_cache_ttl = self._data.ami_cache_ttl
         self.cfngin_bucket = self._data.cfngin_bucket
         self.cfngin_bucket_region = self._data.cfngin_bucket_region
         self.cfngin_cache_dir = self._data.cfngin_cache_dir
@@ -208,6 +212,7 @@ class CfnginConfig(BaseConfig):
         self.pre_deploy = cast(List[CfnginHookDefinitionModel], self._data.pre_deploy)
         self.pre_destroy = cast(List[CfnginHookDefinitionModel], self._data.pre_destroy)
         self.service_role = self._data.service_role
+        self.stack_output_index = self._data.stack_output_index
         self.stacks = cast(List[CfnginStackDefinitionModel], self._data.stacks)
         self.sys_path = self._data.sys_path
         self.tags = self._data.tags
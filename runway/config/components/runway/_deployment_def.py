@@ -14,6 +14,7 @@ from ._module_def import RunwayModuleDefinition
 from .base import ConfigComponentDefinition
 
 if TYPE_CHECKING:
+    from ....context import RunwayContext
     from ...models.base import ConfigProperty
     from ...models.runway import (
         RunwayAssumeRoleDefinitionModel,
@@ -102,6 +103,17 @@ class RunwayDeploymentDefinition(ConfigComponentDefinition):
             RunwayModuleDefinitionModel.parse_obj(mod.data) for mod in modules
         ]
 
+    def prefetch(self, context: RunwayContext) -> None:
+        """Prefetch data for the lookups used by the deployment and its modules.
+
+        Args:
+            context: Runway context object.
+
+        """
+        super().prefetch(context)
+        for module in self.modules:
+            module.prefetch(context)
+
     def reverse(self):
         """Reverse the order of modules and regions."""
         self._data.modules.reverse()
@@ -9,6 +9,7 @@ from ...models.runway import RunwayModuleDefinitionModel
 from .base import ConfigComponentDefinition
 
 if TYPE_CHECKING:
+    from ....context import RunwayContext
     from ...models.runway import (
         RunwayEnvironmentsType,
         RunwayEnvVarsType,
@@ -93,6 +94,17 @@ class RunwayModuleDefinition(ConfigComponentDefinition):
             )
         return self.name
 
+    def prefetch(self, context: RunwayContext) -> None:
+        """Prefetch data for the lookups used by the module and its children.
+
+        Args:
+            context: Runway context object.
+
+        """
+        super().prefetch(context)
+        for child in self.child_modules:
+            child.prefetch(context)
+
     def reverse(self):
         """Reverse the order of child/parallel modules."""
         self._data.parallel.reverse()
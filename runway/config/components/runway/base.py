@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, cast
 
 from ...._logging import PrefixAdaptor
 from ....exceptions import UnresolvedVariable
-from ....variables import Variable
+from ....variables import Variable, prefetch_lookups
 
 if TYPE_CHECKING:
     from ...._logging import RunwayLogger
@@ -50,6 +50,15 @@ class ConfigComponentDefinition:
         """
         return getattr(self, name, default)
 
+    def prefetch(self, context: RunwayContext) -> None:
+        """Prefetch data for the lookups used by fields that support variables.
+
+        Args:
+            context: Runway context object.
+
+        """
+        prefetch_lookups(self._vars.values(), context)
+
     def resolve(
         self,
         context: RunwayContext,
@@ -188,6 +188,12 @@ class CfnginStackDefinitionModel(ConfigProperty):
 class CfnginConfigDefinitionModel(ConfigProperty):
     """Model for a CFNgin config definition."""
 
+    ami_cache_ttl: int = Field(
+        0,
+        title="AMI Cache TTL",
+        description="Number of seconds the results of the ami lookup are cached "
+        "in the CFNgin cache directory. Set to 0 to disable caching.",
+    )
     cfngin_bucket: Optional[str] = Field(
         None,
         title="CFNgin Bucket",
@@ -258,6 +264,11 @@ class CfnginConfigDefinitionModel(ConfigProperty):
         title="Service Role ARN",
         description="Specify an IAM Role for CloudFormation to use.",
     )
+    stack_output_index: bool = Field(
+        False,
+        description="Retrieve the outputs of every Stack in a region with as few "
+        "API calls as possible the first time an output is needed.",
+    )
     stacks: Union[
         List[CfnginStackDefinitionModel],  # final type after parsing
         Dict[str, CfnginStackDefinitionModel],  # recommended when writing config
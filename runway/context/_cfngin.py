@@ -7,12 +7,15 @@ import logging
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, List, MutableMapping, Optional, Union, cast
 
+from botocore.exceptions import ClientError
+
 from .._logging import PrefixAdaptor, RunwayLogger
 from ..cfngin.exceptions import (
     PersistentGraphCannotLock,
     PersistentGraphCannotUnlock,
     PersistentGraphLockCodeMissmatch,
     PersistentGraphLocked,
+    PersistentGraphModified,
     PersistentGraphUnlocked,
 )
 from ..cfngin.plan import Graph
@@ -67,6 +70,7 @@ class CfnginContext(BaseContext):
 
     """
 
+    _persistent_graph_etag: Optional[str]
     _persistent_graph_lock_code: Optional[str]
     _persistent_graph_lock_tag: str = "cfngin_lock_code"
     _persistent_graph: Optional[Graph]
@@ -115,6 +119,7 @@ class CfnginContext(BaseContext):
                 logger if isinstance(logger, RunwayLogger) else LOGGER,
             ),
         )
+        self._persistent_graph_etag = None
         self._persistent_graph_lock_code = None
         self._persistent_graph = None
         self._s3_bucket_verified = False
@@ -224,26 +229,24 @@ class CfnginContext(BaseContext):
                         "getting persistent graph from s3:\n%s",
                         json.dumps(self.persistent_graph_location, indent=4),
                     )
-                    content = (
-                        self.s3_client.get_object(
-                            ResponseContentType="application/json",
-                            **self.persistent_graph_location,
-                        )["Body"]
-                        .read()
-                        .decode("utf-8")
+                    response = self.s3_client.get_object(
+                        ResponseContentType="application/json",
+                        **self.persistent_graph_location,
                     )
+                    content = response["Body"].read().decode("utf-8")
                 except self.s3_client.exceptions.NoSuchKey:
                     self.logger.info(
                         "persistant graph object does not exist in s3; "
                         "creating one now..."
                     )
-                    self.s3_client.put_object(
+                    response = self.s3_client.put_object(
                         Body=content.encode(),
                         ServerSideEncryption="AES256",
                         ACL="bucket-owner-full-control",
                         ContentType="application/json",
                         **self.persistent_graph_location,
                     )
+                self._persistent_graph_etag = response.get("ETag")
             self.persistent_graph = Graph.from_dict(json.loads(content), self)
 
         return self._persistent_graph
@@ -276,6 +279,17 @@ class CfnginContext(BaseContext):
         """AWS S3 client."""
         return self.get_session(region=self.bucket_region).client("s3")
 
+    @cached_property
+    def _supports_if_match(self) -> bool:
+        """Whether the installed botocore supports ``IfMatch`` for PutObject.
+
+        Older versions of botocore reject the parameter so the persistent
+        graph is replaced unconditionally when using them.
+
+        """
+        operation_model = self.s3_client.meta.service_model.operation_model("PutObject")
+        return "IfMatch" in operation_model.input_shape.members
+
     @cached_property
     def stacks_dict(self) -> Dict[str, Stack]:
         """Construct a dict of ``{stack.fqn: Stack}`` for easy access to stacks."""
@@ -297,6 +311,73 @@ class CfnginContext(BaseContext):
             for stack_def in self.config.stacks
         ]
 
+    @cached_property
+    def stack_fingerprints(self) -> Dict[str, Dict[str, str]]:
+        """Fingerprints of stacks recorded when they were last deployed.
+
+        Stored as ``{<stack fqn>: {"fingerprint": <hash>, "last_updated": <time>}}``.
+        Fingerprints are read from and written to S3 next to the persistent graph.
+
+        """
+        if not self.stack_fingerprints_location:
+            return {}
+        try:
+            return json.loads(
+                self.s3_client.get_object(**self.stack_fingerprints_location)["Body"]
+                .read()
+                .decode("utf-8")
+            )
+        except (ClientError, ValueError) as exc:
+            self.logger.debug("unable to get stack fingerprints: %s", exc)
+            return {}
+
+    @cached_property
+    def stack_fingerprints_location(self) -> PersistentGraphLocation:
+        """Location of stack fingerprints in s3."""
+        if not self.persistent_graph_location:
+            return {}
+        return {
+            "Bucket": self.persistent_graph_location["Bucket"],
+            "Key": self.persistent_graph_location["Key"][: -len(".json")]
+            + ".fingerprints.json",
+        }
+
+    @cached_property
+    def run_report_path(self) -> Path:
+        """Path to the report of the last plan that was executed.
+
+        A Chrome trace of the plan is written alongside it with a suffix of
+        ``.trace.json``.
+
+        """
+        return (
+            self.config.cfngin_cache_dir
+            / "reports"
+            / f"{self.base_fqn or 'default'}.json"
+        )
+
+    @cached_property
+    def stack_durations(self) -> Dict[str, Dict[str, float]]:
+        """Historical duration of steps from previous runs.
+
+        Stored as ``{<step function name>: {<stack name>: <seconds>}}``.
+        Durations are read from and written to ``cfngin_cache_dir``.
+
+        """
+        try:
+            return json.loads(self.stack_durations_path.read_text())
+        except (OSError, ValueError):
+            return {}
+
+    @cached_property
+    def stack_durations_path(self) -> Path:
+        """Path to the file used to store historical stack durations."""
+        return (
+            self.config.cfngin_cache_dir
+            / "stack_durations"
+            / f"{self.base_fqn or 'default'}.json"
+        )
+
     @cached_property
     def tags(self) -> Dict[str, str]:
         """Return ``tags`` from config."""
@@ -409,12 +490,17 @@ class CfnginContext(BaseContext):
     def put_persistent_graph(self, lock_code: str) -> None:
         """Upload persistent graph to s3.
 
+        If the ETag of the S3 object is known from the last time it was read
+        or written, the object is only replaced if it still matches (when
+        supported by the installed version of botocore).
+
         Args:
             lock_code (str): The code that will be used to lock the S3 object.
 
         Raises:
             :class:`runway.cfngin.exceptions.PersistentGraphUnlocked`
             :class:`runway.cfngin.exceptions.PersistentGraphLockCodeMissmatch`
+            :class:`runway.cfngin.exceptions.PersistentGraphModified`
 
         """
         if not self.persistent_graph:
@@ -422,6 +508,7 @@ class CfnginContext(BaseContext):
 
         if not self.persistent_graph.to_dict():
             self.s3_client.delete_object(**self.persistent_graph_location)
+            self._persistent_graph_etag = None
             self.logger.debug("removed empty persistent graph object from S3")
             return
 
@@ -435,17 +522,33 @@ class CfnginContext(BaseContext):
                 lock_code, self.persistent_graph_lock_code
             )
 
-        self.s3_client.put_object(
-            Body=self.persistent_graph.dumps(4).encode(),
-            ServerSideEncryption="AES256",
-            ACL="bucket-owner-full-control",
-            ContentType="application/json",
-            Tagging=f"{self._persistent_graph_lock_tag}={lock_code}",
-            **self.persistent_graph_location,
-        )
-        self.logger.debug(
-            "persistent graph updated:\n%s", self.persistent_graph.dumps(indent=4)
-        )
+        body = self.persistent_graph.dumps(4)
+        try:
+            response = self.s3_client.put_object(
+                Body=body.encode(),
+                ServerSideEncryption="AES256",
+                ACL="bucket-owner-full-control",
+                ContentType="application/json",
+                Tagging=f"{self._persistent_graph_lock_tag}={lock_code}",
+                **(
+                    {"IfMatch": self._persistent_graph_etag}
+                    if self._persistent_graph_etag and self._supports_if_match
+                    else {}
+                ),
+                **self.persistent_graph_location,
+            )
+        except ClientError as exc:
+            if exc.response["Error"]["Code"] in (
+                "ConditionalRequestConflict",
+                "PreconditionFailed",
+            ):
+                raise PersistentGraphModified(
+                    f"{self.persistent_graph_location['Bucket']}/"
+                    f"{self.persistent_graph_location['Key']}"
+                ) from exc
+            raise
+        self._persistent_graph_etag = response.get("ETag")
+        self.logger.debug("persistent graph updated:\n%s", body)
 
     def set_hook_data(self, key: str, data: collections.Mapping[str, Any]) -> None:
         """Set hook data for the given key.
@@ -469,6 +572,33 @@ class CfnginContext(BaseContext):
 
         self.hook_data[key] = data
 
+    def put_stack_durations(self) -> None:
+        """Write historical stack durations to ``cfngin_cache_dir``."""
+        if not self.stack_durations:
+            return
+        try:
+            self.stack_durations_path.parent.mkdir(parents=True, exist_ok=True)
+            self.stack_durations_path.write_text(
+                json.dumps(self.stack_durations, indent=4)
+            )
+        except OSError as exc:
+            self.logger.debug("unable to write stack durations: %s", exc)
+
+    def put_stack_fingerprints(self) -> None:
+        """Upload stack fingerprints to s3."""
+        if not self.stack_fingerprints_location:
+            return
+        try:
+            self.s3_client.put_object(
+                Body=json.dumps(self.stack_fingerprints, indent=4).encode(),
+                ServerSideEncryption="AES256",
+                ACL="bucket-owner-full-control",
+                ContentType="application/json",
+                **self.stack_fingerprints_location,
+            )
+        except ClientError as exc:
+            self.logger.warning("unable to update stack fingerprints: %s", exc)
+
     def unlock_persistent_graph(self, lock_code: str) -> bool:
         """Unlocks the persistent graph in s3.
 
@@ -6,7 +6,7 @@ import logging
 import os
 import sys
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, Optional, cast
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, Optional, cast
 
 import click
 
@@ -16,9 +16,10 @@ from ...utils import AWS_ENV_VARS
 
 try:  # will raise an import error if git is not in the current path
     import git
-    from git.exc import InvalidGitRepositoryError
+    from git.exc import GitCommandError, InvalidGitRepositoryError
 except ImportError:  # cov: ignore
     git = object  # pylint: disable=invalid-name
+    GitCommandError = AttributeError
     InvalidGitRepositoryError = AttributeError
 
 if TYPE_CHECKING:
@@ -31,8 +32,12 @@ class DeployEnvironment:
     """Runway deploy environment."""
 
     __name: Optional[str]
+    _changed_since: Optional[str]
     _ignore_git_branch: bool
 
+    #: Absolute paths of files changed since :attr:`changed_since`.
+    #: ``None`` if everything should be considered changed.
+    changed_files: Optional[FrozenSet[Path]]
     name_derived_from: Optional[str]
     root_dir: Path
 
@@ -55,7 +60,9 @@ class DeployEnvironment:
 
         """
         self.__name = explicit_name
+        self._changed_since = None
         self._ignore_git_branch = ignore_git_branch
+        self.changed_files = None
         self.name_derived_from = "explicit" if self.__name else None
         self.root_dir = root_dir or Path.cwd()
         self.vars = environ or os.environ.copy()
@@ -117,6 +124,21 @@ class DeployEnvironment:
         except InvalidGitRepositoryError:
             return None
 
+    @property
+    def changed_since(self) -> Optional[str]:
+        """Git ref used to limit what is processed to what has changed since."""
+        return self._changed_since
+
+    @changed_since.setter
+    def changed_since(self, ref: Optional[str]) -> None:
+        """Set the value of changed_since.
+
+        :attr:`changed_files` is updated when changing this value.
+
+        """
+        self._changed_since = ref
+        self.changed_files = self._get_changed_files(ref) if ref else None
+
     @property
     def ci(self) -> bool:
         """Return CI status.
@@ -302,8 +324,39 @@ class DeployEnvironment:
             root_dir=self.root_dir,
         )
         obj.name_derived_from = self.name_derived_from
+        # pylint: disable=protected-access
+        obj._changed_since = self._changed_since
+        obj.changed_files = self.changed_files
         return obj
 
+    def _get_changed_files(self, ref: str) -> FrozenSet[Path]:
+        """Get files that have changed since a git ref.
+
+        Includes uncommitted changes and untracked files.
+
+        Args:
+            ref: Git ref to compare the working tree to.
+
+        """
+        if isinstance(git, type):
+            LOGGER.error(
+                "failed to import git; ensure git is your path and "
+                "executable to determine what has changed"
+            )
+            sys.exit(1)
+        try:
+            repo = git.Repo(  # type: ignore
+                str(self.root_dir), search_parent_directories=True
+            )
+            file_names = repo.git.diff("--name-only", ref).splitlines()
+            file_names.extend(repo.untracked_files)
+        except (GitCommandError, InvalidGitRepositoryError) as err:
+            LOGGER.error("unable to determine files changed since %s: %s", ref, err)
+            sys.exit(1)
+        working_tree = Path(repo.working_tree_dir)
+        LOGGER.debug("%s file(s) changed since %s", len(file_names), ref)
+        return frozenset((working_tree / name).resolve() for name in file_names)
+
     def log_name(self) -> None:
         """Output name to log."""
         name = self.name  # resolve if not already resolved
@@ -173,6 +173,7 @@ class Deployment:
         context.env.aws_region = region
 
         with aws.AssumeRole(context, **self.assume_role_config):
+            self.definition.prefetch(context)
             self.definition.resolve(context, variables=self._variables)
             self.validate_account_credentials(context)
             Module.run_list(
@@ -253,6 +254,8 @@ class Deployment:
             futures = [
                 executor.submit(self.run, *[action, region]) for region in self.regions
             ]
+        # results cached by the child processes were not shared with this one
+        Module.invalidate_lookup_cache()
         for job in futures:
             job.result()  # raise exceptions / exit as needed
 
@@ -18,6 +18,8 @@ from ...config.models.runway import (
     RunwayFutureDefinitionModel,
     RunwayVariablesDefinitionModel,
 )
+from ...lookups.handlers import cfn, ssm
+from ...lookups.handlers.base import LOOKUP_CACHE
 from ...utils import change_dir, flatten_path_lists, merge_dicts
 from ..providers import aws
 from ._module_path import ModulePath
@@ -74,6 +76,34 @@ class Module:
         self.name = self.definition.name
         self.logger = PrefixAdaptor(self.fqn, LOGGER)
 
+    @cached_property
+    def changed(self) -> bool:
+        """Whether files of the module have changed.
+
+        Always ``True`` if changes are not being tracked (``--changed-since``
+        was not used), the Runway config file changed, or the module is from
+        a remote source.
+
+        Also always ``True`` for CloudFormation modules as their stacks can be
+        built from files outside of the module (e.g. blueprints added to
+        ``sys_path`` or read by the ``file`` lookup). CFNgin selects the
+        stacks affected by the changed files itself.
+
+        """
+        changed_files = self.ctx.env.changed_files
+        if changed_files is None or self.path.source != "local":
+            return True
+        if self.type.class_path == RunwayModuleType.TYPE_MAP["cloudformation"]:
+            return True
+        root_dir = self.ctx.env.root_dir.resolve()
+        module_root = self.path.module_root.resolve()
+        return any(
+            (path.parent == root_dir and path.name.startswith("runway."))
+            or module_root == path
+            or module_root in path.parents
+            for path in changed_files
+        )
+
     @cached_property
     def child_modules(self) -> List[Module]:
         """Return child modules."""
@@ -232,6 +262,9 @@ class Module:
         self.logger.verbose("module payload: %s", json.dumps(self.payload))
         if self.should_skip:
             return
+        if not self.changed:
+            self.logger.info("skipped; no changes since %s", self.ctx.env.changed_since)
+            return
         with change_dir(self.path.module_root):
             # dynamically load the particular module's class, 'get' the method
             # associated with the command, and call the method.
@@ -239,7 +272,10 @@ class Module:
                 self.ctx, module_root=self.path.module_root, **self.payload
             )
             if hasattr(inst, action):
-                inst[action]()
+                try:
+                    inst[action]()
+                finally:
+                    self.invalidate_lookup_cache()
             else:
                 self.logger.error('"%s" is missing method "%s"', inst, action)
                 sys.exit(1)
@@ -247,6 +283,19 @@ class Module:
             "processing module in %s (complete)", self.ctx.env.aws_region
         )
 
+    @staticmethod
+    def invalidate_lookup_cache() -> None:
+        """Remove cached lookup results that running a module could change.
+
+        Stack outputs and SSM parameters can be changed by any module
+        (e.g. Serverless, CDK, Terraform, or a CFNgin stack that creates an
+        SSM parameter) so results of the ``cfn`` and ``ssm`` lookups are not
+        reused after it has run.
+
+        """
+        LOOKUP_CACHE.invalidate(cfn.TYPE_NAME)
+        LOOKUP_CACHE.invalidate(ssm.TYPE_NAME)
+
     def __async(self, action: RunwayActionTypeDef) -> None:
         """Execute asynchronously.
 
@@ -267,6 +316,8 @@ class Module:
             futures = [
                 executor.submit(child.run, *[action]) for child in self.child_modules
             ]
+        # results cached by the child processes were not shared with this one
+        self.invalidate_lookup_cache()
         for job in futures:
             job.result()  # raise exceptions / exit as needed
 
@@ -12,6 +12,8 @@ from .._response import BaseResponse
 from ._sync_handler import S3SyncHandler
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     import boto3
     from mypy_boto3_s3.client import S3Client
     from mypy_boto3_s3.type_defs import (
@@ -179,6 +181,8 @@ class Bucket:
         self,
         src_directory: str,
         *,
+        content_hash: bool = False,
+        content_hash_manifest: Optional[Path] = None,
         delete: bool = False,
         exclude: Optional[List[str]] = None,
         follow_symlinks: bool = False,
@@ -189,6 +193,10 @@ class Bucket:
 
         Args:
             src_directory: Local directory to sync to S3.
+            content_hash: Compare the MD5 of local files with the ETag of S3
+                objects instead of their last modified time.
+            content_hash_manifest: Path to a file used to store the MD5 of local
+                files so they are not calculated again while unchanged.
             delete: If true, files that exist in the destination but not in the
                 source are deleted.
             exclude: List of patterns for files/objects to exclude.
@@ -198,6 +206,8 @@ class Bucket:
 
         """
         S3SyncHandler(
+            content_hash=content_hash,
+            content_hash_manifest=content_hash_manifest,
             context=self.__ctx,
             delete=delete,
             dest=self.format_bucket_path_uri(prefix=prefix),
@@ -212,6 +222,8 @@ class Bucket:
         self,
         dest_directory: str,
         *,
+        content_hash: bool = False,
+        content_hash_manifest: Optional[Path] = None,
         delete: bool = False,
         exclude: Optional[List[str]] = None,
         follow_symlinks: bool = False,
@@ -222,6 +234,10 @@ class Bucket:
 
         Args:
             dest_directory: Local directory to sync S3 objects to.
+            content_hash: Compare the MD5 of local files with the ETag of S3
+                objects instead of their last modified time.
+            content_hash_manifest: Path to a file used to store the MD5 of local
+                files so they are not calculated again while unchanged.
             delete: If true, files that exist in the destination but not in the
                 source are deleted.
             exclude: List of patterns for files/objects to exclude.
@@ -231,6 +247,8 @@ class Bucket:
 
         """
         S3SyncHandler(
+            content_hash=content_hash,
+            content_hash_manifest=content_hash_manifest,
             context=self.__ctx,
             delete=delete,
             dest=dest_directory,
@@ -179,6 +179,7 @@ class ActionArchitecture:
             page_size=self.parameters.page_size,
             result_queue=result_queue,
             request_parameters=self._get_file_generator_request_parameters_skeleton(),
+            list_concurrency=self._runtime_config["max_concurrent_requests"],
         )
         rev_generator = FileGenerator(
             client=self.client,
@@ -187,6 +188,7 @@ class ActionArchitecture:
             page_size=self.parameters.page_size,
             result_queue=result_queue,
             request_parameters=self._get_file_generator_request_parameters_skeleton(),
+            list_concurrency=self._runtime_config["max_concurrent_requests"],
         )
         file_info_builder = FileInfoBuilder(
             client=self.client, parameters=self.parameters
@@ -214,16 +216,20 @@ class ActionArchitecture:
             raise NotImplementedError("only sync is supported")
 
         files = command_dict["setup"]
-        while self.instructions:
-            instruction = self.instructions.pop(0)
-            file_list = []
-            components = command_dict[instruction]
-            for index, comp in enumerate(components):
-                if len(files) > len(components):
-                    file_list.append(comp.call(*files))  # type: ignore
-                else:
-                    file_list.append(comp.call(files[index]))  # type: ignore
-            files = file_list
+        try:
+            while self.instructions:
+                instruction = self.instructions.pop(0)
+                file_list = []
+                components = command_dict[instruction]
+                for index, comp in enumerate(components):
+                    if len(files) > len(components):
+                        file_list.append(comp.call(*files))  # type: ignore
+                    else:
+                        file_list.append(comp.call(files[index]))  # type: ignore
+                files = file_list
+        finally:
+            for sync_strategy in sync_strategies.values():
+                sync_strategy.close()
         # This is kinda quirky, but each call through the instructions
         # will replaces the files attr with the return value of the
         # file_list.  The very last call is a single list of
@@ -9,6 +9,7 @@ from __future__ import annotations
 import datetime
 import os
 import stat
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from dataclasses import dataclass
 from pathlib import Path
@@ -18,6 +19,7 @@ from typing import (
     Any,
     Dict,
     Generator,
+    Iterator,
     List,
     Optional,
     Tuple,
@@ -33,6 +35,7 @@ from typing_extensions import TypedDict
 from .utils import (
     EPOCH_TIME,
     BucketLister,
+    ShardedBucketLister,
     create_warning,
     find_bucket_key,
     find_dest_path_comp_key,
@@ -40,6 +43,8 @@ from .utils import (
 )
 
 if TYPE_CHECKING:
+    from concurrent.futures import Future
+
     from mypy_boto3_s3.client import S3Client
     from mypy_boto3_s3.type_defs import HeadObjectOutputTypeDef, ObjectTypeDef
 
@@ -162,6 +167,7 @@ class FileGenerator:
         page_size: Optional[int] = None,
         result_queue: Optional["Queue[Any]"] = None,
         request_parameters: Any = None,
+        list_concurrency: int = 1,
     ):
         """Instantiate class.
 
@@ -172,9 +178,14 @@ class FileGenerator:
             page_size: Number of items per page.
             result_queue: Queue used for outputing results.
             request_parameters: Parameters provided with the request.
+            list_concurrency: Maximum number of common prefixes of a bucket
+                listed at the same time. If greater than ``1``, common prefixes
+                are listed concurrently and merged back together when there
+                are no more of them than this number.
 
         """
         self._client = client
+        self.list_concurrency = list_concurrency
         self.operation_name = operation_name
         self.follow_symlinks = follow_symlinks
         self.page_size = page_size
@@ -228,24 +239,108 @@ class FileGenerator:
                 if stats:
                     yield stats
             else:
-                # using os.listdir instead of Path.iterdir so we can sort the list
-                # but not load the entire tree into memory
-                listdir_names = os.listdir(path)
-                names: List[str] = []
-                for name in listdir_names:
-                    if (path / name).is_dir():
-                        name = name + os.path.sep
-                    names.append(name)
-                self.normalize_sort(names, os.sep, "/")
-                for name in names:
-                    file_path = path / name
-                    if file_path.is_dir():
-                        for result in self.list_files(file_path, dir_op):
-                            yield result
+                yield from self.walk_directory(path)
+
+    def walk_directory(
+        self, path: Path
+    ) -> Generator[Tuple[Path, _LastModifiedAndSize], None, None]:
+        """Yield the files under a directory, depth first, in S3 sort order.
+
+        Directories are listed with :func:`os.scandir` so the type of each
+        entry, and the stat of each file, come from the listing instead of
+        additional calls. If ``list_concurrency`` is greater than ``1``,
+        subdirectories are listed ahead of time by a thread pool while the
+        files before them are yielded. Only the listings of the directories
+        being walked, and a limited number of listings fetched ahead of time,
+        are held in memory.
+
+        Subdirectories are skipped when they are symlinks that are not to be
+        followed or when they can't be read, in which case a warning is
+        added to the result queue.
+
+        Args:
+            path: Path to a directory.
+
+        """
+        executor = (
+            ThreadPoolExecutor(max_workers=self.list_concurrency)
+            if self.list_concurrency > 1
+            else None
+        )
+        prefetched: Dict[Path, Future[List[Tuple[str, os.DirEntry[str]]]]] = {}
+
+        def scan(directory: Path) -> Iterator[Tuple[str, os.DirEntry[str]]]:
+            future = prefetched.pop(directory, None)
+            try:
+                entries = future.result() if future else self.scan_directory(directory)
+            except OSError:
+                self.triggers_warning(directory)
+                return iter([])
+            if executor:
+                for name, entry in entries:
+                    if len(prefetched) >= self.list_concurrency * 4:
+                        break
+                    if name.endswith(os.path.sep) and self._should_walk(entry):
+                        child = directory / entry.name
+                        prefetched[child] = executor.submit(self.scan_directory, child)
+            return iter(entries)
+
+        stack = [(path, scan(path))]
+        try:
+            while stack:
+                directory, entries = stack[-1]
+                for name, entry in entries:
+                    if name.endswith(os.path.sep):
+                        if self._should_walk(entry):
+                            child = directory / entry.name
+                            stack.append((child, scan(child)))
+                            break
                     else:
-                        stats = self.safely_get_file_stats(file_path)
+                        stats = self.safely_get_file_stats(
+                            directory / entry.name, entry
+                        )
                         if stats:
                             yield stats
+                else:
+                    stack.pop()
+        finally:
+            if executor:
+                for future in prefetched.values():
+                    future.cancel()
+                executor.shutdown()
+
+    def scan_directory(self, path: Path) -> List[Tuple[str, os.DirEntry[str]]]:
+        """List the entries of a directory in S3 sort order.
+
+        The names of directories end with a path separator. Each file is
+        stat'd while it is listed so the result is cached by its entry, which
+        moves the stat to the thread listing the directory when prefetching.
+
+        Args:
+            path: Path to a directory.
+
+        Returns:
+            Sorted pairs of name and entry.
+
+        Raises:
+            OSError: The directory can't be read.
+
+        """
+        entries: Dict[str, os.DirEntry[str]] = {}
+        with os.scandir(path) as iterator:
+            for entry in iterator:
+                name = entry.name
+                try:
+                    if entry.is_dir():
+                        name = name + os.path.sep
+                    else:
+                        entry.stat()
+                except OSError:
+                    pass
+                entries[name] = entry
+        names = list(entries)
+        self.normalize_sort(names, os.sep, "/")
+        return [(name, entries[name]) for name in names]
 
     @staticmethod
     def normalize_sort(names: List[str], os_sep: str, character: str) -> None:
@@ -263,16 +358,19 @@ class FileGenerator:
         names.sort(key=lambda item: item.replace(os_sep, character))
 
     def safely_get_file_stats(
-        self, path: Path
+        self, path: Path, entry: Optional[os.DirEntry[str]] = None
     ) -> Optional[Tuple[Path, _LastModifiedAndSize]]:
         """Get file stats with handling for some common errors.
 
         Args:
             path: Path to a file.
+            entry: Directory entry of the file that provides its stat.
 
         """
         try:
-            size, last_update = get_file_stat(path)
+            size, last_update = (
+                get_file_stat(path, entry.stat()) if entry else get_file_stat(path)
+            )
         except (OSError, ValueError):
             self.triggers_warning(path)
         else:
@@ -295,6 +393,18 @@ class FileGenerator:
             return EPOCH_TIME
         return update_time
 
+    def _should_walk(self, entry: os.DirEntry[str]) -> bool:
+        """Check whether a subdirectory found by a listing should be walked.
+
+        The equivalent of :meth:`should_ignore_file` for a directory entry,
+        excluding its readability which is checked when it is listed.
+
+        """
+        try:
+            return self.follow_symlinks or not entry.is_symlink()
+        except OSError:
+            return False
+
     def should_ignore_file(self, path: Path) -> bool:
         """Check whether a file should be ignored in the file generation process.
 
@@ -363,7 +473,11 @@ class FileGenerator:
         if not dir_op and prefix:
             yield self._list_single_object(s3_path)
         else:
-            lister = BucketLister(self._client)
+            lister = (
+                ShardedBucketLister(self._client, max_workers=self.list_concurrency)
+                if self.list_concurrency > 1
+                else BucketLister(self._client)
+            )
             extra_args: Any = self.request_parameters.get("ListObjectsV2", {})
             for obj in lister.list_objects(
                 bucket=bucket,
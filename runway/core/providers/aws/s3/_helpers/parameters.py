@@ -19,6 +19,11 @@ class ParametersDataModel(BaseModel):
     Attributes:
         dest: File/object destination.
         src: File/object source.
+        content_hash: When comparing local files with S3 objects, compare the
+            MD5 of the file with the ETag of the object instead of the last
+            modified time.
+        content_hash_manifest: Path to a file used to store the MD5 of local
+            files so they are not calculated again while unchanged.
         content_type: Explicitly provided content type.
         delete: Whether or not to delete files at the destination that are
             missing from the source location.
@@ -48,6 +53,8 @@ class ParametersDataModel(BaseModel):
     dest: str
     src: str
     # these need to be set after dest & src so their validators can access the value if needed
+    content_hash: bool = False
+    content_hash_manifest: Optional[Path] = None
     content_type: Optional[str] = None
     delete: bool = False
     dir_op: bool = False
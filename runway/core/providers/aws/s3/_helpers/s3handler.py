@@ -9,6 +9,7 @@ from __future__ import annotations
 import logging
 import os
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -23,12 +24,12 @@ from typing import (
     cast,
 )
 
+from botocore.exceptions import ClientError
 from s3transfer.manager import TransferManager
 
 from .results import (
     CommandResultRecorder,
     CopyResultSubscriber,
-    DeleteResultSubscriber,
     DownloadResultSubscriber,
     DownloadStreamResultSubscriber,
     DryRunResult,
@@ -233,6 +234,8 @@ class S3TransferHandler:
                             if submitter.submit(fileinfo):
                                 total_submissions += 1
                             break
+                for submitter in self._submitters:
+                    submitter.flush()
                 self._result_command_recorder.notify_total_submissions(
                     total_submissions
                 )
@@ -308,6 +311,9 @@ class BaseTransferRequestSubmitter:
         """
         raise NotImplementedError("can_submit()")
 
+    def flush(self) -> None:
+        """Submit any requests that were deferred and wait for them to finish."""
+
     def _do_submit(self, fileinfo: FileInfo) -> Optional[TransferFuture]:
         """Do submit."""
         extra_args: Dict[Any, Any] = {}
@@ -748,14 +754,44 @@ class DownloadStreamRequestSubmitter(DownloadRequestSubmitter):
 
 
 class DeleteRequestSubmitter(BaseTransferRequestSubmitter):
-    """Delete request submitter."""
+    """Delete request submitter.
+
+    Instead of deleting each object with the TransferManager, keys are
+    grouped by bucket and deleted in batches using DeleteObjects.
+    Batches are deleted concurrently as they fill up and any remaining keys
+    are deleted when the submitter is flushed.
+
+    """
 
+    #: Maximum number of keys deleted by a single DeleteObjects request.
+    MAX_BATCH_SIZE: ClassVar[int] = 1000
+    #: Maximum number of DeleteObjects requests made at the same time.
+    MAX_CONCURRENT_BATCHES: ClassVar[int] = 4
     REQUEST_MAPPER_METHOD: ClassVar[
         Callable[[Dict[Any, Any], Dict[Any, Any]], Any]
     ] = RequestParamsMapper.map_delete_object_params
-    RESULT_SUBSCRIBER_CLASS: ClassVar[
-        Type[DeleteResultSubscriber]
-    ] = DeleteResultSubscriber
+    RESULT_SUBSCRIBER_CLASS: ClassVar[Optional[Type[BaseSubscriber]]] = None
+
+    def __init__(
+        self,
+        transfer_manager: TransferManager,
+        result_queue: "Queue[Any]",
+        config_params: ParametersDataModel,
+    ):
+        """Instantiate class.
+
+        Args:
+            transfer_manager: The underlying transfer manager.
+            result_queue: The result queue to use.
+            config_params: The associated CLI parameters passed in to the
+                command as a dictionary.
+
+        """
+        super().__init__(transfer_manager, result_queue, config_params)
+        self._batches: Dict[str, List[Tuple[str, Dict[str, Any]]]] = {}
+        self._batch_futures: List[Future[None]] = []
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._extra_args: Dict[str, Any] = {}
 
     def can_submit(self, fileinfo: FileInfo) -> bool:
         """Check whether it can submit a particular FileInfo.
@@ -771,18 +807,89 @@ class DeleteRequestSubmitter(BaseTransferRequestSubmitter):
         """
         return fileinfo.operation_name == "delete" and fileinfo.src_type == "s3"
 
-    def _submit_transfer_request(
+    def flush(self) -> None:
+        """Delete any remaining keys and wait for all batches to finish."""
+        for bucket in list(self._batches):
+            self._submit_batch(bucket)
+        try:
+            for future in self._batch_futures:
+                future.result()
+        finally:
+            self._batch_futures.clear()
+            if self._executor:
+                self._executor.shutdown()
+                self._executor = None
+
+    # pylint: disable=unused-argument
+    def _submit_transfer_request(  # type: ignore
         self,
         fileinfo: FileInfo,
         extra_args: Dict[str, Any],
         subscribers: List[BaseSubscriber],
-    ) -> TransferFuture:
-        """Submit transfer request."""
+    ) -> bool:
+        """Submit transfer request.
+
+        The key is added to the batch of its bucket, which is submitted
+        once it is full.
+
+        """
         bucket, key = find_bucket_key(str(fileinfo.src))
-        return self._transfer_manager.delete(
-            bucket=bucket, key=key, extra_args=extra_args, subscribers=subscribers
+        src, dest = self._format_src_dest(fileinfo)
+        result_kwargs = {"transfer_type": "delete", "src": src, "dest": dest}
+        self._result_queue.put(QueuedResult(total_transfer_size=0, **result_kwargs))
+        self._extra_args = extra_args
+        batch = self._batches.setdefault(bucket, [])
+        batch.append((key, result_kwargs))
+        if len(batch) >= self.MAX_BATCH_SIZE:
+            self._submit_batch(bucket)
+        return True
+
+    def _submit_batch(self, bucket: str) -> None:
+        """Submit the batch of keys of a bucket to be deleted."""
+        batch = self._batches.pop(bucket)
+        if not self._executor:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.MAX_CONCURRENT_BATCHES,
+                thread_name_prefix="s3-delete",
+            )
+        self._batch_futures.append(
+            self._executor.submit(self._delete_batch, bucket, batch)
         )
 
+    def _delete_batch(
+        self, bucket: str, batch: List[Tuple[str, Dict[str, Any]]]
+    ) -> None:
+        """Delete a batch of keys, reporting the result of each one."""
+        try:
+            response = self._transfer_manager.client.delete_objects(
+                Bucket=bucket,
+                Delete={"Objects": [{"Key": key} for key, _ in batch], "Quiet": True},
+                **self._extra_args,
+            )
+        except Exception as exc:  # pylint: disable=broad-except
+            for _, result_kwargs in batch:
+                self._result_queue.put(FailureResult(exception=exc, **result_kwargs))
+            return
+        errors = {error["Key"]: error for error in response.get("Errors", [])}
+        for key, result_kwargs in batch:
+            if key in errors:
+                self._result_queue.put(
+                    FailureResult(
+                        exception=ClientError(
+                            {
+                                "Error": {
+                                    "Code": errors[key].get("Code", "Unknown"),
+                                    "Message": errors[key].get("Message", ""),
+                                }
+                            },
+                            "DeleteObjects",
+                        ),
+                        **result_kwargs,
+                    )
+                )
+            else:
+                self._result_queue.put(SuccessResult(**result_kwargs))
+
     def _format_src_dest(
         self, fileinfo: FileInfo
     ) -> Tuple[Optional[str], Optional[str]]:
@@ -5,6 +5,7 @@
 
 """
 from .base import BaseSync, MissingFileSync, NeverSync, SizeAndLastModifiedSync
+from .content_hash import ContentHashSync
 from .delete import DeleteSync
 from .exact_timestamps import ExactTimestampsSync
 from .register import register_sync_strategies
@@ -12,6 +13,7 @@ from .size_only import SizeOnlySync
 
 __all__ = [
     "BaseSync",
+    "ContentHashSync",
     "DeleteSync",
     "ExactTimestampsSync",
     "MissingFileSync",
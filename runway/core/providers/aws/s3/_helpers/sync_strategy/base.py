@@ -66,6 +66,9 @@ class BaseSync:
         """Register the sync strategy class to the given session."""
         session.register("choosing-s3-sync-strategy", self.use_sync_strategy)
 
+    def close(self) -> None:
+        """Release any resources once the sync has finished."""
+
     def determine_should_sync(
         self, src_file: Optional[FileStats], dest_file: Optional[FileStats]
     ) -> bool:
@@ -0,0 +1,245 @@
+"""Content hash sync strategy."""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import math
+import os
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, Optional, Set
+
+from typing_extensions import Literal
+
+from .base import SizeAndLastModifiedSync
+
+if TYPE_CHECKING:
+    from ..file_generator import FileStats
+    from ..parameters import ParametersDataModel
+
+LOGGER = logging.getLogger(__name__.replace("._", "."))
+
+MIB = 1024 * 1024
+#: Part sizes tried when comparing a file to the ETag of a multipart upload.
+#: The first is the default ``multipart_chunksize``.
+MULTIPART_CHUNK_SIZES = tuple(
+    size * MIB for size in (8, 5, 16, 15, 32, 50, 64, 100, 128, 256, 512, 1024)
+)
+#: Number of bytes read from a file at a time when calculating its digest.
+READ_SIZE = MIB
+
+
+def calculate_etag(path: str, chunk_size: Optional[int] = None) -> str:
+    """Calculate the ETag S3 would assign to a file when it is uploaded.
+
+    Args:
+        path: Path to a local file.
+        chunk_size: Part size if the file is uploaded using a multipart upload.
+
+    Returns:
+        The MD5 of the file if ``chunk_size`` is not provided, otherwise the
+        MD5 of the MD5 of each part followed by the number of parts.
+
+    """
+    if not chunk_size:
+        digest = hashlib.md5()
+        with open(path, "rb") as file_obj:
+            for chunk in iter(lambda: file_obj.read(READ_SIZE), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    part_digests = b""
+    parts = 0
+    with open(path, "rb") as file_obj:
+        while True:
+            part = hashlib.md5()
+            remaining = chunk_size
+            while remaining:
+                chunk = file_obj.read(min(READ_SIZE, remaining))
+                if not chunk:
+                    break
+                part.update(chunk)
+                remaining -= len(chunk)
+            if remaining == chunk_size:
+                break
+            part_digests += part.digest()
+            parts += 1
+    return f"{hashlib.md5(part_digests).hexdigest()}-{parts}"
+
+
+class DigestManifest:
+    """Digests of local files that are reused while the files are unchanged.
+
+    Digests are stored by the absolute path of a file along with its size,
+    modification time and inode. A digest is calculated again if any of these
+    change. If a path is provided, the manifest is loaded from and saved to
+    a JSON file so digests can be reused by subsequent syncs.
+
+    """
+
+    def __init__(self, path: Optional[Path] = None) -> None:
+        """Instantiate class.
+
+        Args:
+            path: Path to the file used to persist the manifest.
+
+        """
+        self.path = path
+        self._changed = False
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._used: Set[str] = set()
+        if path:
+            self._load(path)
+
+    def get_etag(self, file_path: str, chunk_size: Optional[int] = None) -> str:
+        """Get the ETag of a local file, calculating it if needed.
+
+        Args:
+            file_path: Path to a local file.
+            chunk_size: Part size if the file is uploaded using a multipart
+                upload.
+
+        """
+        name = os.path.abspath(file_path)
+        stat = os.stat(name)
+        identity = [stat.st_size, stat.st_mtime_ns, stat.st_ino]
+        entry = self._entries.get(name)
+        if not entry or entry.get("identity") != identity:
+            entry = self._entries[name] = {"identity": identity, "etags": {}}
+        self._used.add(name)
+        key = str(chunk_size or 0)
+        if key not in entry["etags"]:
+            entry["etags"][key] = calculate_etag(name, chunk_size)
+            self._changed = True
+        return entry["etags"][key]
+
+    def save(self) -> None:
+        """Save the digests of the files used during the sync."""
+        if not self.path or not (self._changed or set(self._entries) - self._used):
+            return
+        data = {
+            "files": {name: self._entries[name] for name in sorted(self._used)},
+            "version": 1,
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w", dir=self.path.parent, suffix=".tmp", delete=False
+            ) as tmp_file:
+                json.dump(data, tmp_file)
+            Path(tmp_file.name).replace(self.path)
+        except OSError:
+            LOGGER.debug("unable to write %s", self.path, exc_info=True)
+
+    def _load(self, path: Path) -> None:
+        """Load digests from a file."""
+        try:
+            data = json.loads(path.read_text())
+            if data.get("version") == 1:
+                self._entries = data["files"]
+        except FileNotFoundError:
+            pass
+        except (AttributeError, KeyError, OSError, ValueError):
+            LOGGER.debug("unable to read %s", path, exc_info=True)
+
+
+class ContentHashSync(SizeAndLastModifiedSync):
+    """Compare the content of local files with the ETag of S3 objects.
+
+    Files that are the same size are only synced if the MD5 (or multipart
+    ETag) of the local file does not match the ETag of the S3 object,
+    regardless of when they were modified. Objects without an ETag that can
+    be compared (e.g. when copying between buckets) fall back to size and
+    last modified time.
+
+    """
+
+    NAME: ClassVar[Literal["content_hash"]] = "content_hash"
+
+    def __init__(
+        self,
+        sync_type: Literal["file_at_src_and_dest"] = "file_at_src_and_dest",
+    ) -> None:
+        """Instantiate class.
+
+        Args:
+            sync_type: This determines where the sync strategy will be
+                used. There are three strings to choose from.
+
+        """
+        super().__init__(sync_type)
+        self.manifest = DigestManifest()
+
+    def close(self) -> None:
+        """Save the manifest of local file digests."""
+        self.manifest.save()
+
+    def determine_should_sync(
+        self, src_file: Optional[FileStats], dest_file: Optional[FileStats]
+    ) -> bool:
+        """Determine if file should sync."""
+        if not (src_file and dest_file):
+            raise ValueError("src_file and dest_file must not be None")
+        if src_file.src_type == "local" and dest_file.src_type == "s3":
+            local_file, s3_object = src_file, dest_file
+        elif src_file.src_type == "s3" and dest_file.src_type == "local":
+            local_file, s3_object = dest_file, src_file
+        else:
+            return super().determine_should_sync(src_file, dest_file)
+        etag = (s3_object.response_data or {}).get("ETag", "").strip('"')
+        if not etag:
+            return super().determine_should_sync(src_file, dest_file)
+
+        should_sync = not self.compare_size(src_file, dest_file)
+        if not should_sync:
+            try:
+                should_sync = not self.compare_etag(local_file, etag)
+            except OSError:
+                should_sync = True
+        if should_sync:
+            LOGGER.debug(
+                "syncing: %s -> %s, content changed",
+                src_file.src,
+                src_file.dest,
+            )
+        return should_sync
+
+    def compare_etag(self, local_file: FileStats, etag: str) -> bool:
+        """Compare a local file with the ETag of an S3 object.
+
+        Args:
+            local_file: A local file.
+            etag: ETag of an S3 object without quotes.
+
+        Returns:
+            True if the content of the file matches the ETag.
+
+        """
+        if "-" not in etag:
+            return self.manifest.get_etag(str(local_file.src)) == etag
+        parts = int(etag.rsplit("-", 1)[1])
+        size = local_file.size or 0
+        for chunk_size in MULTIPART_CHUNK_SIZES:
+            if math.ceil(size / chunk_size) == parts and (
+                self.manifest.get_etag(str(local_file.src), chunk_size) == etag
+            ):
+                return True
+        return False
+
+    def use_sync_strategy(
+        self, params: ParametersDataModel, **kwargs: Any
+    ) -> Optional[ContentHashSync]:
+        """Determine which sync strategy to use.
+
+        The manifest is loaded from ``content_hash_manifest`` when this
+        strategy is chosen.
+
+        Args:
+            params: All arguments that a sync strategy is able to process.
+
+        """
+        if super().use_sync_strategy(params, **kwargs):
+            self.manifest = DigestManifest(params.content_hash_manifest)
+            return self
+        return None
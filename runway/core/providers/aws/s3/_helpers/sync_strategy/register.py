@@ -8,6 +8,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, Type
 
+from .content_hash import ContentHashSync
 from .delete import DeleteSync
 from .exact_timestamps import ExactTimestampsSync
 from .size_only import SizeOnlySync
@@ -44,5 +45,8 @@ def register_sync_strategies(session: Session, **_: Any) -> None:
     # Register the exact timestamps sync strategy.
     register_sync_strategy(session, ExactTimestampsSync)
 
+    # Register the content hash sync strategy.
+    register_sync_strategy(session, ContentHashSync)
+
     # Register the delete sync strategy.
     register_sync_strategy(session, DeleteSync, "file_not_at_src")
@@ -8,6 +8,7 @@
 from __future__ import annotations
 
 import errno
+import heapq
 import logging
 import mimetypes
 import os
@@ -15,15 +16,21 @@ import os.path
 import re
 import sys
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
 from typing import (
     TYPE_CHECKING,
     Any,
     BinaryIO,
     Callable,
+    ClassVar,
     Dict,
     Generator,
+    Iterator,
+    List,
     NamedTuple,
     Optional,
     TextIO,
@@ -37,6 +44,7 @@ from dateutil.tz import tzlocal, tzutc
 from s3transfer.subscribers import BaseSubscriber
 
 if TYPE_CHECKING:
+    from concurrent.futures import Future
     from queue import Queue
 
     from mypy_boto3_s3.client import S3Client
@@ -142,12 +150,193 @@ class BucketLister:
         paginator = self._client.get_paginator("list_objects_v2")
         pages = paginator.paginate(**kwargs)  # type: ignore
         for page in pages:
-            contents = page.get("Contents", [])
-            for content in contents:
-                source_path = bucket + "/" + content.get("Key", "")
-                if "LastModified" in content:
-                    content["LastModified"] = self._date_parser(content["LastModified"])
-                yield source_path, content
+            yield from self._parse_page(bucket, page)
+
+    def _parse_page(
+        self, bucket: str, page: Any
+    ) -> Generator[Tuple[str, ObjectTypeDef], None, None]:
+        """Yield the source path and content of each object in a page."""
+        contents = page.get("Contents", [])
+        for content in contents:
+            source_path = bucket + "/" + content.get("Key", "")
+            if "LastModified" in content:
+                content["LastModified"] = self._date_parser(content["LastModified"])
+            yield source_path, content
+
+
+class ShardedBucketLister(BucketLister):
+    """List keys in a bucket by listing common prefixes concurrently.
+
+    A listing using a delimiter finds the common prefixes (shards) below the
+    prefix being listed. Shards are paged through in separate threads and
+    merged with the objects found above them so keys are yielded in the
+    same order as a single listing.
+
+    If more than :attr:`MAX_BUFFERED_OBJECTS` objects are found above the
+    shards (e.g. a flat prefix), the prefix is listed without sharding so
+    that its objects are not held in memory. It is also listed without
+    sharding if there are more shards than ``max_workers`` as many shards
+    are likely to be small (e.g. ``posts/<slug>/index.html``) and listing
+    each of them would take more requests than a single listing.
+
+    """
+
+    MAX_BUFFERED_OBJECTS: ClassVar[int] = 10000
+
+    def __init__(
+        self,
+        client: S3Client,
+        date_parser: Callable[[Union[datetime, str]], datetime] = _date_parser,
+        max_workers: int = 10,
+        delimiter: str = "/",
+    ) -> None:
+        """Instantiate class.
+
+        Args:
+            client: boto3 S3 client.
+            date_parser: Parser for date string.
+            max_workers: Maximum number of shards listed at the same time.
+            delimiter: Character used to find common prefixes.
+
+        """
+        super().__init__(client, date_parser)
+        self.delimiter = delimiter
+        self.max_workers = max_workers
+
+    def list_objects(
+        self,
+        bucket: str,
+        prefix: Optional[str] = None,
+        page_size: Optional[int] = None,
+        extra_args: Any = None,
+    ) -> Generator[Tuple[str, ObjectTypeDef], None, None]:
+        """List objects in S3 bucket.
+
+        Args:
+            bucket: Bucket name.
+            prefix: Object prefix.
+            page_size: Number of items per page
+            extra_args: Additional arguments to pass to list call.
+
+        """
+        found = self.find_shards(bucket, prefix, page_size, extra_args)
+        if found is None:
+            yield from super().list_objects(bucket, prefix, page_size, extra_args)
+            return
+        contents, shards = found
+        # shards do not overlap and are sorted so listing them one after the
+        # other produces sorted keys that only need to be merged with contents
+        yield from heapq.merge(
+            contents,
+            self._list_shards(bucket, shards, page_size, extra_args),
+            key=lambda obj: obj[0],
+        )
+
+    def find_shards(
+        self,
+        bucket: str,
+        prefix: Optional[str] = None,
+        page_size: Optional[int] = None,
+        extra_args: Any = None,
+    ) -> Optional[Tuple[List[Tuple[str, ObjectTypeDef]], List[str]]]:
+        """Find the common prefixes that can be listed separately.
+
+        If only a single common prefix is found, the common prefixes below
+        it are used instead.
+
+        Args:
+            bucket: Bucket name.
+            prefix: Object prefix.
+            page_size: Number of items per page
+            extra_args: Additional arguments to pass to list call.
+
+        Returns:
+            Objects that are not below a common prefix and the common prefixes.
+            None if more than :attr:`MAX_BUFFERED_OBJECTS` objects are not
+            below a common prefix or more than ``max_workers`` common prefixes
+            are found.
+
+        """
+        contents: List[Tuple[str, ObjectTypeDef]] = []
+        while True:
+            kwargs: Dict[str, Any] = {
+                "Bucket": bucket,
+                "Delimiter": self.delimiter,
+                "PaginationConfig": {"PageSize": page_size},
+            }
+            if prefix is not None:
+                kwargs["Prefix"] = prefix
+            if extra_args is not None:
+                kwargs.update(extra_args)
+            shards: List[str] = []
+            paginator = self._client.get_paginator("list_objects_v2")
+            for page in paginator.paginate(**kwargs):  # type: ignore
+                contents.extend(self._parse_page(bucket, page))
+                if len(contents) > self.MAX_BUFFERED_OBJECTS:
+                    LOGGER.debug(
+                        "too many objects above common prefixes in s3://%s/%s; "
+                        "listing without sharding",
+                        bucket,
+                        prefix or "",
+                    )
+                    return None
+                shards.extend(
+                    common_prefix["Prefix"]
+                    for common_prefix in page.get("CommonPrefixes", [])
+                    if "Prefix" in common_prefix
+                )
+                if len(shards) > self.max_workers:
+                    LOGGER.debug(
+                        "too many common prefixes in s3://%s/%s; "
+                        "listing without sharding",
+                        bucket,
+                        prefix or "",
+                    )
+                    return None
+            if len(shards) != 1:
+                contents.sort(key=lambda obj: obj[0])
+                return contents, sorted(shards)
+            prefix = shards[0]
+
+    def _list_shards(
+        self,
+        bucket: str,
+        shards: List[str],
+        page_size: Optional[int] = None,
+        extra_args: Any = None,
+    ) -> Iterator[Tuple[str, ObjectTypeDef]]:
+        """List shards concurrently, yielding their objects in order.
+
+        A shard is submitted as the results of an earlier shard are consumed
+        so no more than ``max_workers`` shards are held in memory at a time.
+
+        """
+        if len(shards) < 2 or self.max_workers < 2:
+            for shard in shards:
+                yield from super().list_objects(bucket, shard, page_size, extra_args)
+            return
+
+        def list_shard(shard: str) -> List[Tuple[str, ObjectTypeDef]]:
+            return list(
+                super(ShardedBucketLister, self).list_objects(
+                    bucket, shard, page_size, extra_args
+                )
+            )
+
+        remaining = iter(shards)
+        futures: "deque[Future[List[Tuple[str, ObjectTypeDef]]]]" = deque()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            try:
+                for shard in islice(remaining, self.max_workers):
+                    futures.append(executor.submit(list_shard, shard))
+                while futures:
+                    objects = futures.popleft().result()
+                    for shard in islice(remaining, 1):
+                        futures.append(executor.submit(list_shard, shard))
+                    yield from objects
+            finally:
+                for future in futures:
+                    future.cancel()
 
 
 class OnDoneFilteredSubscriber(BaseSubscriber):
@@ -765,12 +954,22 @@ def find_dest_path_comp_key(
     return dest_path, compare_key
 
 
-def get_file_stat(path: Path) -> Tuple[int, Optional[datetime]]:
-    """Get size of file in bytes and last modified time stamp."""
-    try:
-        stats = path.stat()
-    except IOError as exc:
-        raise ValueError(f"Could not retrieve file stat of {path}: {exc}") from exc
+def get_file_stat(
+    path: Path, stats: Optional[os.stat_result] = None
+) -> Tuple[int, Optional[datetime]]:
+    """Get size of file in bytes and last modified time stamp.
+
+    Args:
+        path: Path to a file.
+        stats: Result of a previous stat of the file (e.g. from
+            :meth:`os.DirEntry.stat`) that is used instead of calling stat again.
+
+    """
+    if stats is None:
+        try:
+            stats = path.stat()
+        except IOError as exc:
+            raise ValueError(f"Could not retrieve file stat of {path}: {exc}") from exc
 
     try:
         update_time = datetime.fromtimestamp(stats.st_mtime, tzlocal())
@@ -10,6 +10,8 @@ from ._helpers.sync_strategy.register import register_sync_strategies
 from ._helpers.transfer_config import RuntimeConfig
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     import boto3
     from mypy_boto3_s3.client import S3Client
 
@@ -24,6 +26,8 @@ class S3SyncHandler:
         self,
         context: Union[CfnginContext, RunwayContext],
         *,
+        content_hash: bool = False,
+        content_hash_manifest: Optional[Path] = None,
         delete: bool = False,
         dest: str,
         exclude: Optional[List[str]] = None,
@@ -36,6 +40,10 @@ class S3SyncHandler:
         """Instantiate class.
 
         Args:
+            content_hash: Compare the MD5 of local files with the ETag of S3
+                objects instead of their last modified time.
+            content_hash_manifest: Path to a file used to store the MD5 of local
+                files so they are not calculated again while unchanged.
             context: Runway or CFNgin context object.
             delete: If true, files that exist in the destination but not in the
                 source are deleted.
@@ -60,6 +68,8 @@ class S3SyncHandler:
         self.parameters = Parameters(
             "sync",
             ParametersDataModel(
+                content_hash=content_hash,
+                content_hash_manifest=content_hash_manifest,
                 delete=delete,
                 dest=dest,
                 exclude=exclude or [],
@@ -1,10 +1,29 @@
 """Base class for lookup handlers."""
 from __future__ import annotations
 
+import collections
+import copy
 import json
 import logging
+import threading
+import time
+from concurrent.futures import Future
 from distutils.util import strtobool
-from typing import TYPE_CHECKING, Any, Dict, Optional, Sequence, Set, Tuple, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Hashable,
+    Iterable,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
 
 import yaml
 from troposphere import BaseAWSObject
@@ -23,8 +42,172 @@ LOGGER = logging.getLogger(__name__)
 TransformToTypeLiteral = Literal["bool", "str"]
 
 
+class LookupCache:
+    """Thread-safe cache of lookup results.
+
+    Concurrent requests for the same key are de-duplicated so that only one
+    of them performs the lookup while the others wait for its result.
+    Entries expire after a TTL and the least recently used entries are
+    evicted once the cache is full.
+
+    """
+
+    def __init__(self, max_size: int = 1024) -> None:
+        """Instantiate class.
+
+        Args:
+            max_size: Maximum number of results to store.
+
+        """
+        self.max_size = max_size
+        self._entries: collections.OrderedDict[
+            Hashable, Tuple[float, Set[str], Any]
+        ] = collections.OrderedDict()
+        self._in_flight: Dict[Hashable, Tuple[Future[Any], Set[str]]] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        key: Hashable,
+        func: Callable[[], Any],
+        *,
+        ttl: Union[float, Callable[[Any], float]],
+        tags: Iterable[str] = (),
+    ) -> Any:
+        """Get a cached result or call a function to create it.
+
+        Exceptions raised by the function are not cached.
+
+        Args:
+            key: Key of the result.
+            func: Function that returns the result if it is not cached.
+            ttl: Number of seconds the result is cached for or a function that
+                calculates it from the result (e.g. when the result expires).
+            tags: Tags that can be used to invalidate the result.
+
+        """
+        tags = set(tags)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                return copy.deepcopy(entry[2])
+            if key in self._in_flight:
+                future = self._in_flight[key][0]
+                owner = False
+            else:
+                future = Future()
+                self._in_flight[key] = (future, tags)
+                owner = True
+        if not owner:
+            return copy.deepcopy(future.result())
+
+        try:
+            result = func()
+            expires_in = ttl(result) if callable(ttl) else ttl
+        except BaseException as exc:
+            with self._lock:
+                if self._in_flight.get(key, (None,))[0] is future:
+                    del self._in_flight[key]
+            future.set_exception(exc)
+            raise
+        with self._lock:
+            # if invalidated while in flight, the result may already be stale
+            if self._in_flight.get(key, (None,))[0] is future:
+                del self._in_flight[key]
+                self._entries[key] = (time.monotonic() + expires_in, tags, result)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+        future.set_result(result)
+        return copy.deepcopy(result)
+
+    def set(
+        self, key: Hashable, value: Any, *, ttl: float, tags: Iterable[str] = ()
+    ) -> None:
+        """Store a result that was retrieved ahead of time.
+
+        Args:
+            key: Key of the result.
+            value: The result.
+            ttl: Number of seconds the result is cached for.
+            tags: Tags that can be used to invalidate the result.
+
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, set(tags), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, tag: Optional[str] = None) -> None:
+        """Remove results from the cache.
+
+        Args:
+            tag: Only remove results with this tag. All results are removed
+                if not provided.
+
+        """
+        with self._lock:
+            if tag is None:
+                self._entries.clear()
+                self._in_flight.clear()
+                return
+            for key in [k for k, v in self._entries.items() if tag in v[1]]:
+                del self._entries[key]
+            for key in [k for k, v in self._in_flight.items() if tag in v[1]]:
+                del self._in_flight[key]
+
+
+#: Results of lookups that support caching, shared for the duration of a run.
+LOOKUP_CACHE = LookupCache()
+
+
 class LookupHandler:
-    """Base class for lookup handlers."""
+    """Base class for lookup handlers.
+
+    Attributes:
+        CACHE_TTL: Number of seconds the result of the lookup is cached for.
+            Lookups that make API calls can opt into caching by setting this
+            to a value greater than ``0``.
+
+    """
+
+    CACHE_TTL: ClassVar[float] = 0
+
+    @classmethod
+    def cache_key(
+        cls,
+        value: str,
+        context: Union[CfnginContext, RunwayContext],
+        provider: Optional[Provider] = None,
+    ) -> Hashable:
+        """Key used to cache the result of the lookup.
+
+        Args:
+            value: Parameter(s) given to the lookup.
+            context: The current context object.
+            provider: CFNgin AWS provider.
+
+        """
+        return (
+            cls,
+            value,
+            context.env.aws_profile,
+            context.env.aws_region,
+            tuple(sorted(context.env.aws_credentials.items())),
+            getattr(provider, "region", None),
+        )
+
+    @classmethod
+    def cache_tags(cls, __value: str) -> Set[str]:
+        """Tags used to invalidate the cached result of the lookup.
+
+        Args:
+            __value: Parameter(s) given to the lookup.
+
+        """
+        return set()
 
     @classmethod
     def dependencies(cls, __lookup_query: VariableValue) -> Set[str]:
@@ -111,6 +294,56 @@ class LookupHandler:
         """
         raise NotImplementedError
 
+    @classmethod
+    def prefetch(
+        cls,
+        __values: Sequence[str],
+        __context: Union[CfnginContext, RunwayContext],
+    ) -> None:
+        """Retrieve data for multiple lookups before they are resolved.
+
+        Lookups that can retrieve data in bulk can override this to populate
+        :data:`LOOKUP_CACHE` ahead of time. Failures should not be raised as
+        each lookup is still resolved individually.
+
+        Args:
+            __values: Parameter(s) given to each lookup.
+            __context: The current context object.
+
+        """
+
+    @classmethod
+    def resolve(
+        cls,
+        value: str,
+        context: Union[CfnginContext, RunwayContext],
+        *args: Any,
+        provider: Optional[Provider] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Perform the lookup, using a cached result if caching is enabled.
+
+        Args:
+            value: Parameter(s) given to the lookup.
+            context: The current context object.
+            provider: CFNgin AWS provider.
+
+        """
+
+        def handle() -> Any:
+            return cls.handle(
+                value, *args, context=context, provider=provider, **kwargs
+            )
+
+        if cls.CACHE_TTL <= 0:
+            return handle()
+        return LOOKUP_CACHE.get(
+            cls.cache_key(value, context, provider),
+            handle,
+            ttl=cls.CACHE_TTL,
+            tags=cls.cache_tags(value),
+        )
+
     @classmethod
     def parse(cls, value: str) -> Tuple[str, Dict[str, str]]:
         """Parse the value passed to a lookup in a standardized way.
@@ -9,7 +9,7 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import TYPE_CHECKING, Any, Dict, NamedTuple, Optional, Union, cast
+from typing import TYPE_CHECKING, Any, Dict, NamedTuple, Optional, Set, Union, cast
 
 from botocore.exceptions import ClientError
 
@@ -37,6 +37,13 @@ class OutputQuery(NamedTuple):
 class CfnLookup(LookupHandler):
     """CloudFormation Stack Output lookup."""
 
+    CACHE_TTL = 300.0
+
+    @classmethod
+    def cache_tags(cls, value: str) -> Set[str]:  # pylint: disable=arguments-differ
+        """Tag the cached result with the name of the Stack and the lookup."""
+        return {cls.parse(value)[0].split(".")[0], TYPE_NAME}
+
     @staticmethod
     def should_use_provider(args: Dict[str, str], provider: Optional[Provider]) -> bool:
         """Determine if the provider should be used for the lookup.
@@ -2,13 +2,15 @@
 from __future__ import annotations
 
 import base64
+import datetime
 import logging
-from typing import TYPE_CHECKING, Any, Union  # pylint: disable=W
+from typing import TYPE_CHECKING, Any, Optional, Union  # pylint: disable=W
 
-from ...lookups.handlers.base import LookupHandler
+from ...lookups.handlers.base import LOOKUP_CACHE, LookupHandler
 
 if TYPE_CHECKING:
     from mypy_boto3_ecr.client import ECRClient
+    from mypy_boto3_ecr.type_defs import AuthorizationDataTypeDef
 
     from ...context import CfnginContext, RunwayContext
 
@@ -16,20 +18,67 @@ LOGGER = logging.getLogger(__name__)
 
 TYPE_NAME = "ecr"
 
+#: Number of seconds before an authorization token expires that it is renewed.
+TOKEN_EXPIRATION_MARGIN = 300.0
+
 
 class EcrLookup(LookupHandler):
     """ECR Lookup."""
 
-    @staticmethod
-    def get_login_password(client: ECRClient) -> str:
+    @classmethod
+    def get_authorization_data(
+        cls,
+        context: Union[CfnginContext, RunwayContext],
+        region: Optional[str] = None,
+    ) -> AuthorizationDataTypeDef:
+        """Get authorization data for the ECR registry of an account.
+
+        The authorization token is reused for the account, region and
+        credentials until shortly before it expires.
+
+        Args:
+            context: The current context object.
+            region: AWS region of the registry.
+
+        """
+        session = context.get_session(region=region)
+        return LOOKUP_CACHE.get(
+            (cls.cache_key("authorization-token", context), session.region_name),
+            lambda: cls._get_authorization_data(session.client("ecr")),
+            ttl=cls._get_token_ttl,
+        )
+
+    @classmethod
+    def get_login_password(cls, client: ECRClient) -> str:
         """Get a password to login to ECR registry."""
-        auth = client.get_authorization_token().get("authorizationData", [None])[0]
-        if not auth:
-            raise ValueError("get_authorization_token did not return authorizationData")
+        return cls._decode_password(cls._get_authorization_data(client))
+
+    @staticmethod
+    def _decode_password(auth: AuthorizationDataTypeDef) -> str:
+        """Get the password from the authorization token."""
         auth_token = base64.b64decode(auth["authorizationToken"]).decode()
         _, password = auth_token.split(":")
         return password
 
+    @staticmethod
+    def _get_authorization_data(client: ECRClient) -> AuthorizationDataTypeDef:
+        """Get authorization data from ECR."""
+        auth = client.get_authorization_token().get("authorizationData", [None])[0]
+        if not auth:
+            raise ValueError("get_authorization_token did not return authorizationData")
+        return auth
+
+    @staticmethod
+    def _get_token_ttl(auth: AuthorizationDataTypeDef) -> float:
+        """Number of seconds an authorization token can be reused for."""
+        expires_at = auth.get("expiresAt")
+        if not expires_at:
+            return 0
+        if not expires_at.tzinfo:
+            expires_at = expires_at.replace(tzinfo=datetime.timezone.utc)
+        now = datetime.datetime.now(datetime.timezone.utc)
+        return (expires_at - now).total_seconds() - TOKEN_EXPIRATION_MARGIN
+
     @classmethod
     def handle(  # pylint: disable=arguments-differ
         cls,
@@ -47,11 +96,10 @@ class EcrLookup(LookupHandler):
         """
         query, args = cls.parse(value)
 
-        session = context.get_session(region=args.get("region"))
-        client = session.client("ecr")
-
         if query == "login-password":
-            result = cls.get_login_password(client)
+            result = cls._decode_password(
+                cls.get_authorization_data(context, args.get("region"))
+            )
         else:
             raise ValueError(f"ecr lookup does not support '{query}'")
         return cls.format_results(result, **args)
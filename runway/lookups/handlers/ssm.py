@@ -2,9 +2,11 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Any, Union
+from typing import TYPE_CHECKING, Any, Dict, Hashable, Optional, Sequence, Set, Union
 
-from ...lookups.handlers.base import LookupHandler
+from botocore.exceptions import BotoCoreError, ClientError
+
+from ...lookups.handlers.base import LOOKUP_CACHE, LookupHandler
 
 if TYPE_CHECKING:
     from ...context import CfnginContext, RunwayContext
@@ -12,10 +14,30 @@ if TYPE_CHECKING:
 LOGGER = logging.getLogger(__name__)
 TYPE_NAME = "ssm"
 
+#: Maximum number of parameters that can be retrieved by one GetParameters call.
+GET_PARAMETERS_MAX_NAMES = 10
+
 
 class SsmLookup(LookupHandler):
     """SSM Parameter Store Lookup."""
 
+    CACHE_TTL = 300.0
+
+    @classmethod
+    def cache_tags(cls, value: str) -> Set[str]:  # pylint: disable=arguments-differ
+        """Tag the cached result with the name of the parameter."""
+        return {cls.parse(value)[0]}
+
+    @classmethod
+    def _parameter_cache_key(
+        cls,
+        name: str,
+        region: Optional[str],
+        context: Union[CfnginContext, RunwayContext],
+    ) -> Hashable:
+        """Key used to cache a parameter retrieved from SSM Parameter Store."""
+        return (cls.cache_key(name, context), "parameter", region)
+
     @classmethod
     def handle(  # pylint: disable=arguments-differ
         cls,
@@ -41,9 +63,14 @@ class SsmLookup(LookupHandler):
         client = session.client("ssm")
 
         try:
-            response = client.get_parameter(Name=query, WithDecryption=True)[
-                "Parameter"
-            ]
+            response = LOOKUP_CACHE.get(
+                cls._parameter_cache_key(query, args.get("region"), context),
+                lambda: client.get_parameter(Name=query, WithDecryption=True)[
+                    "Parameter"
+                ],
+                ttl=cls.CACHE_TTL,
+                tags={query, TYPE_NAME},
+            )
             return cls.format_results(
                 response["Value"].split(",")
                 if response["Type"] == "StringList"
@@ -55,3 +82,49 @@ class SsmLookup(LookupHandler):
                 args.pop("load", None)  # don't load a default value
                 return cls.format_results(args.pop("default"), **args)
             raise
+
+    @classmethod
+    def prefetch(  # pylint: disable=arguments-differ
+        cls,
+        values: Sequence[str],
+        context: Union[CfnginContext, RunwayContext],
+    ) -> None:
+        """Retrieve the parameters of multiple lookups using GetParameters.
+
+        Parameters are grouped by region and retrieved in batches. Parameters
+        referenced with a version, label or ARN are skipped and, like any
+        parameter that could not be retrieved, are retrieved individually
+        when the lookup is resolved.
+
+        Args:
+            values: Parameter(s) given to each lookup.
+            context: The current context object.
+
+        """
+        names_by_region: Dict[Optional[str], Set[str]] = {}
+        for value in values:
+            query, args = cls.parse(value)
+            if ":" not in query:
+                names_by_region.setdefault(args.get("region"), set()).add(query)
+
+        for region, names in names_by_region.items():
+            client = context.get_session(region=region).client("ssm")
+            sorted_names = sorted(names)
+            for index in range(0, len(sorted_names), GET_PARAMETERS_MAX_NAMES):
+                batch = sorted_names[index : index + GET_PARAMETERS_MAX_NAMES]
+                try:
+                    response = client.get_parameters(Names=batch, WithDecryption=True)
+                except (BotoCoreError, ClientError) as err:
+                    LOGGER.debug(
+                        "unable to prefetch SSM parameters in region %s: %s",
+                        region or "default",
+                        err,
+                    )
+                    break
+                for param in response.get("Parameters", []):
+                    LOOKUP_CACHE.set(
+                        cls._parameter_cache_key(param["Name"], region, context),
+                        param,
+                        ttl=cls.CACHE_TTL,
+                        tags={param["Name"], TYPE_NAME},
+                    )
@@ -292,6 +292,7 @@ class StaticSite(RunwayModule):
                     "::default=undefined}}",
                     "extra_files": [i.dict() for i in self.options.extra_files],
                     "cf_disabled": site_stack_variables["DisableCloudFront"],
+                    "content_hash": self.options.content_hash,
                     "distribution_id": f"${{cfn ${{namespace}}-{self.name}.CFDistributionId"
                     "::default=undefined}",
                     "distribution_domain": f"${{cfn ${{namespace}}-{self.name}."
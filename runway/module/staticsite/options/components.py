@@ -12,6 +12,9 @@ class StaticSiteOptions(ModuleOptions):
         build_output: Directory where build output is placed. Defaults to current
             working directory.
         build_steps: List of commands to run to build the static site.
+        content_hash: Compare the MD5 of files with the ETag of objects in S3
+            rather than their size and modification time when uploading the
+            build output.
         data: Options parsed into a data model.
         extra_files: List of files that should be uploaded to S3 after the build.
             Used to dynamically create or select file.
@@ -24,6 +27,7 @@ class StaticSiteOptions(ModuleOptions):
         """Instantiate class."""
         self.build_output = data.build_output
         self.build_steps = data.build_steps
+        self.content_hash = data.content_hash
         self.data = data
         self.extra_files = data.extra_files
         self.pre_build_steps = data.pre_build_steps
@@ -135,6 +135,9 @@ class RunwayStaticSiteModuleOptionsDataModel(ConfigProperty):
         build_output: Directory where build output is placed. Defaults to current
             working directory.
         build_steps: List of commands to run to build the static site.
+        content_hash: Compare the MD5 of files with the ETag of objects in S3
+            rather than their size and modification time when uploading the
+            build output.
         extra_files: List of files that should be uploaded to S3 after the build.
             Used to dynamically create or select file.
         pre_build_steps: Commands to be run prior to the build process.
@@ -144,6 +147,7 @@ class RunwayStaticSiteModuleOptionsDataModel(ConfigProperty):
 
     build_output: str = "./"
     build_steps: List[str] = []
+    content_hash: bool = False
     extra_files: List[RunwayStaticSiteExtraFileDataModel] = []
     pre_build_steps: List[RunwayStaticSitePreBuildStepDataModel] = []
     source_hashing: RunwayStaticSiteSourceHashingDataModel = (
@@ -1,8 +1,11 @@
 """Runway variables."""
 from __future__ import annotations
 
+import concurrent.futures
+import functools
 import logging
 import re
+from contextlib import contextmanager
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -13,12 +16,13 @@ from typing import (
     List,
     MutableMapping,
     MutableSequence,
+    NamedTuple,
     Optional,
     Set,
+    Tuple,
     Type,
     TypeVar,
     Union,
-    cast,
     overload,
 )
 
@@ -43,6 +47,9 @@ if TYPE_CHECKING:
 
 LOGGER = logging.getLogger(__name__)
 
+#: Maximum number of lookups that are resolved concurrently.
+LOOKUP_MAX_WORKERS = 10
+
 _LiteralValue = TypeVar("_LiteralValue", int, str)
 VariableTypeLiteralTypeDef = Literal["cfngin", "runway"]
 
@@ -81,6 +88,16 @@ class Variable:
         """
         return self._value.dependencies
 
+    @property
+    def lookup_names(self) -> Set[str]:
+        """Names of the lookups used by this variable.
+
+        Returns:
+            Set[str]: Names of the lookups used by this variable.
+
+        """
+        return {lookup.lookup_name.value for lookup in _iter_lookups(self._value)}
+
     @property
     def resolved(self) -> bool:
         """Boolean for whether the Variable has been resolved.
@@ -122,9 +139,16 @@ class Variable:
 
         """
         try:
-            self._value.resolve(
-                context, provider=provider, variables=variables, **kwargs
-            )
+            with _resolve_lookups_concurrently(
+                [self._value],
+                context,
+                provider=provider,
+                variables=variables,
+                **kwargs,
+            ):
+                self._value.resolve(
+                    context, provider=provider, variables=variables, **kwargs
+                )
         except FailedLookup as err:
             raise FailedVariableLookup(self, err) from err.cause
 
@@ -156,8 +180,38 @@ def resolve_variables(
         provider: Subclass of the base provider.
 
     """
+    with _resolve_lookups_concurrently(
+        [variable._value for variable in variables],  # pylint: disable=protected-access
+        context,
+        provider=provider,
+    ):
+        for variable in variables:
+            variable.resolve(context=context, provider=provider)
+
+
+def prefetch_lookups(
+    variables: Iterable[Variable], context: Union[CfnginContext, RunwayContext]
+) -> None:
+    """Prefetch data for the lookups used by variables before resolving them.
+
+    Lookups are grouped by handler so that handlers that support retrieving
+    data in bulk can do so with as few API calls as possible.
+    Only lookups with a query that does not contain an unresolved lookup are
+    included as the query must be known ahead of time.
+
+    Args:
+        variables: List of variables.
+        context: The current context object.
+
+    """
+    queries: Dict[Type[LookupHandler], Set[str]] = {}
     for variable in variables:
-        variable.resolve(context=context, provider=provider)
+        value = variable._value  # pylint: disable=protected-access
+        for lookup in _iter_lookups(value):
+            if lookup.lookup_query.resolved:
+                queries.setdefault(lookup.handler, set()).add(lookup.lookup_query.value)
+    for handler, values in queries.items():
+        handler.prefetch(sorted(values), context)
 
 
 _VariableValue = TypeVar("_VariableValue", bound="VariableValue")
@@ -281,46 +335,9 @@ class VariableValue:
         if not isinstance(obj, str):
             return VariableValueLiteral(obj, variable_type=variable_type)  # type: ignore
 
-        tokens: VariableValueConcatenation[
-            Union[VariableValueLiteral[str], VariableValueLookup]
-        ] = VariableValueConcatenation(
-            # pyright 1.1.138 is having issues properly inferring the type from comprehension
-            [  # type: ignore
-                VariableValueLiteral(cast(str, t), variable_type=variable_type)
-                for t in re.split(r"(\$\{|\}|\s+)", obj)  # ${ or space or }
-            ]
-        )
-
-        opener = "${"
-        closer = "}"
-
-        while True:
-            last_open = None
-            next_close = None
-            for i, tok in enumerate(tokens):
-                if not isinstance(tok, VariableValueLiteral):
-                    continue
-                if tok.value == opener:
-                    last_open = i
-                    next_close = None
-                if last_open is not None and tok.value == closer and next_close is None:
-                    next_close = i
-
-            if next_close is not None:
-                lookup_query = VariableValueConcatenation(
-                    tokens[(cast(int, last_open) + len(opener) + 1) : next_close],
-                    variable_type=variable_type,
-                )
-                lookup = VariableValueLookup(
-                    lookup_name=tokens[cast(int, last_open) + 1],  # type: ignore
-                    lookup_query=lookup_query,
-                    variable_type=variable_type,
-                )
-                tokens[last_open : (next_close + 1)] = [lookup]  # type: ignore
-            else:
-                break  # cov: ignore
-
-        return tokens.simplified
+        return VariableValueConcatenation(
+            _build_parsed_items(_parse_str(obj), variable_type)
+        ).simplified
 
     def __iter__(self) -> Iterator[Any]:
         """How the object is iterated.
@@ -752,6 +769,8 @@ class VariableValueLookup(VariableValue):
     lookup_name: VariableValueLiteral[str]
     lookup_query: VariableValue
 
+    _prefailed: Optional[Exception]
+    _preresolved: bool
     _resolved: bool
 
     def __init__(
@@ -774,6 +793,8 @@ class VariableValueLookup(VariableValue):
             ValueError: Invalid value for variable_type.
 
         """
+        self._prefailed = None
+        self._preresolved = False
         self._resolved = False
         self._data = None
 
@@ -851,11 +872,17 @@ class VariableValueLookup(VariableValue):
             FailedLookup: A lookup failed for any reason.
 
         """
+        if self._preresolved:  # resolved concurrently with other lookups
+            self._preresolved = False
+            return None
+        if self._prefailed:  # failed while resolved concurrently
+            err, self._prefailed = self._prefailed, None
+            raise err
         self.lookup_query.resolve(
             context=context, provider=provider, variables=variables, **kwargs
         )
         try:
-            result = self.handler.handle(
+            result = self.handler.resolve(
                 self.lookup_query.value,
                 context=context,
                 provider=provider,
@@ -881,3 +908,171 @@ class VariableValueLookup(VariableValue):
     def __str__(self) -> str:
         """Object displayed as a string."""
         return f"${{{self.lookup_name.value} {self.lookup_query.value}}}"
+
+
+def _iter_lookups(value: VariableValue) -> Iterator[VariableValueLookup]:
+    """Iterate over the lookups contained in a variable value.
+
+    Args:
+        value: The variable value to search.
+
+    """
+    if isinstance(value, VariableValueLookup):
+        yield value
+        yield from _iter_lookups(value.lookup_query)
+    elif isinstance(value, VariableValueDict):
+        for item in value.values():
+            yield from _iter_lookups(item)
+    elif isinstance(value, (VariableValueConcatenation, VariableValueList)):
+        for item in value:  # type: ignore
+            yield from _iter_lookups(item)
+
+
+@contextmanager
+def _resolve_lookups_concurrently(
+    values: Iterable[VariableValue],
+    context: Union[CfnginContext, RunwayContext],
+    **kwargs: Any,
+) -> Iterator[None]:
+    """Resolve independent lookups concurrently before resolving variable values.
+
+    Lookups with a query that does not contain another lookup are resolved
+    using a pool of threads. The next time each of these lookups is resolved
+    within the context, the result is reused instead of resolving it again.
+    Errors of lookups that fail are recorded and raised when the lookup is
+    resolved in order so that they are raised the same way as they would be
+    without this. Failed lookups are not resolved again by nested pools.
+
+    Args:
+        values: Variable values containing lookups.
+        context: The current context object.
+        **kwargs: Arguments passed to :meth:`VariableValueLookup.resolve`.
+
+    """
+    lookups = [
+        lookup
+        for value in values
+        for lookup in _iter_lookups(value)
+        if not lookup._preresolved  # pylint: disable=protected-access
+        and not lookup._prefailed  # pylint: disable=protected-access
+        and not any(_iter_lookups(lookup.lookup_query))
+    ]
+    if len(lookups) < 2:
+        yield
+        return
+
+    def resolve(lookup: VariableValueLookup) -> None:
+        try:
+            lookup.resolve(context, **kwargs)
+        except Exception as err:  # pylint: disable=broad-except
+            # raised when the lookup is resolved in order
+            lookup._prefailed = err  # pylint: disable=protected-access
+            return
+        lookup._preresolved = True  # pylint: disable=protected-access
+
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=min(LOOKUP_MAX_WORKERS, len(lookups)),
+        thread_name_prefix="lookup",
+    ) as executor:
+        list(executor.map(resolve, lookups))
+    try:
+        yield
+    finally:
+        for lookup in lookups:
+            lookup._prefailed = None  # pylint: disable=protected-access
+            lookup._preresolved = False  # pylint: disable=protected-access
+
+
+class _ParsedLookup(NamedTuple):
+    """Lookup parsed from a string, used as a template to create the lookup."""
+
+    name: Union[str, _ParsedLookup]
+    #: Item between the name and the query that is not part of the query.
+    separator: Tuple[Union[str, _ParsedLookup], ...]
+    query: Tuple[Union[str, _ParsedLookup], ...]
+
+
+_TOKEN_SEPARATOR = re.compile(r"(\$\{|\}|\s+)")  # ${ or space or }
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_str(value: str) -> Tuple[Union[str, _ParsedLookup], ...]:
+    """Parse a string containing lookups into an immutable template.
+
+    The string is tokenized once and each ``}`` closes the most recent
+    unclosed ``${``. If a ``${`` is never closed, it and anything before it
+    is left as is.
+
+    Args:
+        value: String to parse.
+
+    Returns:
+        Tokens and lookups found in the string. Templates are cached so each
+        distinct string is only parsed once.
+
+    """
+    tokens = _TOKEN_SEPARATOR.split(value)
+    parsed: List[Union[str, _ParsedLookup]] = []
+    # index in parsed and index in tokens of each unclosed "${"
+    opened: List[Tuple[int, int]] = []
+    for index, token in enumerate(tokens):
+        if token == "${":
+            opened.append((len(parsed), index))
+            parsed.append(token)
+        elif token == "}" and opened:
+            start = opened.pop()[0]
+            contents = parsed[start + 1 :]
+            parsed[start:] = [
+                _ParsedLookup(
+                    contents[0] if contents else token,
+                    tuple(contents[1:2]),
+                    tuple(contents[2:]),
+                )
+            ]
+        else:
+            parsed.append(token)
+    if opened:
+        start, index = opened[-1]
+        return (*tokens[:index], *parsed[start:])
+    return tuple(parsed)
+
+
+def _build_parsed(
+    item: Union[str, _ParsedLookup], variable_type: VariableTypeLiteralTypeDef
+) -> Union[VariableValueLiteral[str], VariableValueLookup]:
+    """Create a variable value from an item returned by :func:`_parse_str`.
+
+    Args:
+        item: Token or lookup parsed from a string.
+        variable_type: Type of variable (cfngin|runway).
+
+    """
+    if isinstance(item, _ParsedLookup):
+        lookup_query = VariableValueConcatenation(
+            _build_parsed_items(item.query, variable_type),
+            variable_type=variable_type,
+        )
+        _build_parsed_items(item.separator, variable_type)  # raise if invalid
+        return VariableValueLookup(
+            lookup_name=_build_parsed(item.name, variable_type),  # type: ignore
+            lookup_query=lookup_query,
+            variable_type=variable_type,
+        )
+    return VariableValueLiteral(item, variable_type=variable_type)
+
+
+def _build_parsed_items(
+    items: Tuple[Union[str, _ParsedLookup], ...],
+    variable_type: VariableTypeLiteralTypeDef,
+) -> List[Union[VariableValueLiteral[str], VariableValueLookup]]:
+    """Create variable values from items returned by :func:`_parse_str`.
+
+    Items are created from last to first so that the first invalid lookup
+    found when reading the string from the end is the one that is raised.
+
+    Args:
+        items: Tokens and lookups parsed from a string.
+        variable_type: Type of variable (cfngin|runway).
+
+    """
+    return [_build_parsed(item, variable_type) for item in reversed(items)][::-1]
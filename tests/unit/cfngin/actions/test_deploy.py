@@ -39,6 +39,7 @@ from runway.cfngin.status import (
 )
 from runway.config import CfnginConfig
 from runway.context import CfnginContext
+from runway.lookups.handlers.base import LOOKUP_CACHE
 
 from ..factories import MockProviderBuilder, MockThreadingEvent
 
@@ -109,6 +110,25 @@ class MockStack:
 class TestAction:
     """Test Action."""
 
+    @pytest.mark.parametrize(
+        "rendered, expected",
+        [
+            ('{"Resources": {}}', False),
+            (
+                '{"Parameters": {"Ami": {"Type": "AWS::SSM::Parameter::Value<String>"}}}',
+                True,
+            ),
+            ('{"Value": "{{resolve:ssm:/param}}"}', True),
+            ('{"Transform": "AWS::Serverless-2016-10-31"}', True),
+            ('{"Fn::Transform": {"Name": "AWS::Include"}}', True),
+        ],
+    )
+    def test_resolved_on_deploy(self, rendered: str, expected: bool) -> None:
+        """Test _resolved_on_deploy."""
+        stack = MagicMock()
+        stack.blueprint.rendered = rendered
+        assert Action._resolved_on_deploy(stack) is expected
+
     @pytest.mark.parametrize(
         "bucket_name, explicit, expected",
         [
@@ -428,6 +448,7 @@ class TestLaunchStack(TestBuildAction):  # TODO: refactor tests to be pytest tes
         self.context = self._get_context()
         self.session = get_session(region=None)
         self.provider = Provider(self.session, interactive=False, recreate_failed=False)
+        self.provider.poller.interval = 0
         provider_builder = MockProviderBuilder(provider=self.provider)
         self.deploy_action = deploy.Action(
             self.context,
@@ -595,9 +616,172 @@ class TestLaunchStack(TestBuildAction):  # TODO: refactor tests to be pytest tes
 
         # update should continue as SUBMITTED
         self._advance("UPDATE_IN_PROGRESS", SUBMITTED, "updating existing stack")
+        LOOKUP_CACHE.get("/param", lambda: "val", ttl=60, tags=["/param", "ssm"])
 
         # update should finish with success
         self._advance("UPDATE_COMPLETE", COMPLETE, "updating existing stack")
+        # parameters read while the stack was updating are not reused
+        assert LOOKUP_CACHE.get("/param", lambda: "new", ttl=60) == "new"
+
+    def test_launch_stack_update_fingerprint(self) -> None:
+        """Test launch stack update skipped when the fingerprint matches."""
+        self.context.stack_fingerprints_location = {"Bucket": "test", "Key": "test"}
+        self.context.stack_fingerprints = {}
+
+        self._advance("CREATE_COMPLETE", SUBMITTED, "updating existing stack")
+        self._advance("UPDATE_COMPLETE", COMPLETE, "updating existing stack")
+        assert self.context.stack_fingerprints["vpc"]["last_updated"] == "None"
+        assert self.deploy_action._stack_fingerprints_updated
+
+        self.step.set_status(PENDING)
+        self._advance("UPDATE_COMPLETE", SKIPPED, "nochange")
+        self.provider.update_stack.assert_called_once()  # type: ignore
+
+        # a change to the template is submitted
+        self.step.set_status(PENDING)
+        self.stack.blueprint.rendered = '{"Resources": {}}'
+        self._advance("UPDATE_COMPLETE", SUBMITTED, "updating existing stack")
+        assert self.provider.update_stack.call_count == 2  # type: ignore
+
+    def test_launch_stack_update_fingerprint_resolved_on_deploy(self) -> None:
+        """Test launch stack update not fingerprinted when resolved on deploy."""
+        self.context.stack_fingerprints_location = {"Bucket": "test", "Key": "test"}
+        self.context.stack_fingerprints = {}
+        self.stack.blueprint.rendered = (
+            '{"Parameters": {"Ami": {"Type": '
+            '"AWS::SSM::Parameter::Value<AWS::EC2::Image::Id>"}}}'
+        )
+
+        self._advance("CREATE_COMPLETE", SUBMITTED, "updating existing stack")
+        self._advance("UPDATE_COMPLETE", COMPLETE, "updating existing stack")
+        assert not self.context.stack_fingerprints
+
+        self.step.set_status(PENDING)
+        self._advance("UPDATE_COMPLETE", SUBMITTED, "updating existing stack")
+        assert self.provider.update_stack.call_count == 2  # type: ignore
+
+    def test_launch_stack_update_fingerprint_stale_cache(self) -> None:
+        """Test launch stack update not skipped when the cached stack is stale."""
+        self.context.stack_fingerprints_location = {"Bucket": "test", "Key": "test"}
+        self.context.stack_fingerprints = {}
+
+        self._advance("CREATE_COMPLETE", SUBMITTED, "updating existing stack")
+        self._advance("UPDATE_COMPLETE", COMPLETE, "updating existing stack")
+
+        # the stack was updated since it was cached
+        fresh_stack = {
+            "StackName": "vpc",
+            "StackStatus": "UPDATE_COMPLETE",
+            "LastUpdatedTime": "2021-01-01",
+        }
+        self.step.set_status(PENDING)
+        with patch.object(
+            self.deploy_action,
+            "_get_provider_stack",
+            return_value={"StackName": "vpc", "StackStatus": "UPDATE_COMPLETE"},
+        ), patch.object(
+            self.provider, "get_stack", return_value=fresh_stack
+        ) as mock_get_stack:
+            self._advance("UPDATE_COMPLETE", SUBMITTED, "updating existing stack")
+        mock_get_stack.assert_called_once_with("vpc", use_cache=False)
+
+    def test_stack_fingerprint(self) -> None:
+        """Test _stack_fingerprint."""
+        fingerprint = self.deploy_action._stack_fingerprint(
+            self.stack, [], [], provider=self.provider
+        )
+        assert fingerprint == self.deploy_action._stack_fingerprint(
+            self.stack, [], [], provider=self.provider, provider_stack={}
+        )
+        assert fingerprint != self.deploy_action._stack_fingerprint(
+            self.stack,
+            [],
+            [],
+            provider=self.provider,
+            provider_stack={"NotificationARNs": ["arn"]},  # type: ignore
+        )
+        self.provider.service_role = "role"
+        assert fingerprint != self.deploy_action._stack_fingerprint(
+            self.stack, [], [], provider=self.provider
+        )
+        self.provider.service_role = None
+        with patch.object(self.provider, "CAPABILITIES", ["CAPABILITY_IAM"]):
+            assert fingerprint != self.deploy_action._stack_fingerprint(
+                self.stack, [], [], provider=self.provider
+            )
+
+    def test_launch_stack_resolved_early(self) -> None:
+        """Test launch stack using a stack resolved while waiting to launch.
+
+        Only stacks with dependencies that use local lookups are resolved early.
+
+        """
+        context = self._get_context(
+            extra_config_args={
+                "stacks": [
+                    {"name": "vpc", "template_path": "."},
+                    {
+                        "name": "app",
+                        "template_path": ".",
+                        "requires": ["vpc"],
+                        "variables": {"test": "${default ${envvar NAME}::val}"},
+                    },
+                    {
+                        "name": "bastion",
+                        "template_path": ".",
+                        "variables": {"test": "${output vpc::something}"},
+                    },
+                    {
+                        "name": "db",
+                        "template_path": ".",
+                        "requires": ["vpc"],
+                        "variables": {"test": "${ssm /vpc/something}"},
+                    },
+                    {"name": "other", "template_path": ".", "requires": ["vpc"]},
+                ]
+            }
+        )
+        deploy_action = deploy.Action(
+            context,
+            provider_builder=MockProviderBuilder(provider=self.provider),
+            cancel=MockThreadingEvent(),  # type: ignore
+        )
+        plan = cast(Plan, deploy_action._Action__generate_plan())  # type: ignore
+        stacks: Dict[str, MagicMock] = {}
+        for step in plan.steps:
+            name = step.name
+            stack = MagicMock(fqn=name, locked=False, variables=step.stack.variables)
+            step.stack = stacks[name] = stack
+            step.stack.name = name
+        stacks["other"].resolve.side_effect = ValueError
+
+        deploy_action._resolve_stacks_early(plan, 2)
+        assert set(deploy_action._resolve_futures) == {"app", "other"}
+        assert deploy_action._resolve_futures["app"].result()
+        assert not deploy_action._resolve_futures["other"].result()
+        stacks["app"].resolve.assert_called_once_with(context, self.provider)
+        stacks["other"].resolve.assert_called_once_with(context, self.provider)
+        for name in ["bastion", "db", "vpc"]:
+            stacks[name].resolve.assert_not_called()
+
+        self.stack_status = None
+        with patch.object(deploy_action, "s3_stack_push"):
+            assert (
+                deploy_action._launch_stack(stacks["app"], status=PENDING) == SUBMITTED
+            )
+        stacks["app"].resolve.assert_called_once()
+        assert set(deploy_action._resolve_futures) == {"other"}
+
+        deploy_action._stop_resolving_stacks()
+        assert not deploy_action._resolve_futures
+        assert not deploy_action._resolve_executor
+
+    def test_resolve_stacks_early_cancel(self) -> None:
+        """Test stacks are not resolved early after the action is cancelled."""
+        patch.object(self.deploy_action.cancel, "is_set", return_value=True).start()
+        self.addCleanup(patch.stopall)
+        assert not self.deploy_action._resolve_stack_early(self.stack)
+        self.stack.resolve.assert_not_called()
 
 
 class TestFunctions(unittest.TestCase):  # TODO: refactor tests to be pytest tests
@@ -6,7 +6,7 @@ from __future__ import annotations
 import logging
 import unittest
 from operator import attrgetter
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, List, Optional
 
 import pytest
 from botocore.exceptions import ClientError
@@ -18,6 +18,7 @@ from runway.cfngin.actions.diff import (
     diff_dictionaries,
     diff_parameters,
 )
+from runway.cfngin.exceptions import CancelExecution, PlanFailed
 from runway.cfngin.providers.aws.default import Provider
 from runway.cfngin.status import SkippedStatus
 
@@ -25,6 +26,7 @@ from ..factories import MockProviderBuilder, MockThreadingEvent
 
 if TYPE_CHECKING:
     from pytest import LogCaptureFixture, MonkeyPatch
+    from pytest_mock import MockerFixture
 
     from ...factories import MockCFNginContext
 
@@ -82,6 +84,72 @@ class TestAction:
 
         assert action.bucket_name == bucket_name
 
+    def test_output_stack_changes(
+        self, caplog: LogCaptureFixture, cfngin_context: MockCFNginContext
+    ) -> None:
+        """Test _output_stack_changes."""
+        caplog.set_level(logging.WARNING, logger=MODULE)
+        calls: List[str] = []
+        action = Action(context=cfngin_context)
+        action._stack_changes = {
+            "stack1": [lambda: calls.append("stack1")],
+            "stack2": [MagicMock(side_effect=CancelExecution)],
+            "stack3": [lambda: calls.append("stack3")],
+        }
+        plan = MagicMock(steps=[MagicMock() for _ in range(4)])
+        for step, name in zip(plan.steps, ["stack3", "stack2", "stack1", "stack0"]):
+            step.name = name
+
+        assert not action._output_stack_changes(plan)
+        assert calls == ["stack3", "stack1"]
+        assert action._stack_changes == {}
+        assert "stack2:output of changes canceled" in caplog.messages
+
+    def test_output_stack_changes_error(
+        self, caplog: LogCaptureFixture, cfngin_context: MockCFNginContext
+    ) -> None:
+        """Test _output_stack_changes continues cleaning up after an error."""
+        caplog.set_level(logging.ERROR, logger=MODULE)
+        calls: List[str] = []
+        action = Action(context=cfngin_context)
+        action._stack_changes = {
+            "stack1": [lambda: calls.append("stack1")],
+            "stack2": [
+                MagicMock(side_effect=ValueError),
+                MagicMock(side_effect=ValueError),
+            ],
+            "stack3": [lambda: calls.append("stack3")],
+        }
+        plan = MagicMock(steps=[MagicMock() for _ in range(3)])
+        for step, name in zip(plan.steps, ["stack3", "stack2", "stack1"]):
+            step.name = name
+
+        assert action._output_stack_changes(plan) == [plan.steps[1]]
+        assert calls == ["stack3", "stack1"]
+        assert action._stack_changes == {}
+        assert (
+            caplog.messages
+            == ["stack2:failed to output changes or delete change set"] * 2
+        )
+
+    def test_run_output_stack_changes_error(
+        self, cfngin_context: MockCFNginContext, mocker: MockerFixture
+    ) -> None:
+        """Test run raises PlanFailed if changes could not be cleaned up."""
+        mocker.patch.object(Action, "_generate_plan")
+        mocker.patch.object(Action, "prefetch_lookups")
+        step = MagicMock()
+        step.name = "stack1"
+        mock_output = mocker.patch.object(
+            Action, "_output_stack_changes", return_value=[step]
+        )
+        mocker.patch.object(cfngin_context, "put_stack_durations")
+        action = Action(context=cfngin_context)
+        with pytest.raises(PlanFailed) as excinfo:
+            action.run()
+        assert excinfo.value.failed_steps == [step]
+        mock_output.assert_called_once()
+
     def test_diff_stack_validationerror_template_too_large(
         self,
         caplog: LogCaptureFixture,
@@ -26,6 +26,10 @@ class Lookup(NamedTuple):
 class MockThreadingEvent:
     """Mock thread events."""
 
+    def is_set(self) -> bool:
+        """Mock is_set method."""
+        return False
+
     def wait(self, timeout: Optional[int] = None) -> bool:
         """Mock wait method."""
         return False
@@ -15,14 +15,19 @@ from runway.cfngin.hooks.staticsite.upload_staticsite import (
     calculate_hash_of_extra_files,
     get_content,
     get_content_type,
+    sync,
     sync_extra_files,
 )
 
 if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
     from runway.cfngin.hooks.staticsite.upload_staticsite import ExtraFileTypeDef
 
     from ....factories import MockCFNginContext
 
+MODULE = "runway.cfngin.hooks.staticsite.upload_staticsite"
+
 
 class TestAutoDetectContentType:
     """Test runway.cfngin.hooks.staticsite.upload_staticsite.auto_detect_content_type."""
@@ -319,3 +324,41 @@ class TestSyncExtraFiles:
             )
             s3_stub.assert_no_pending_responses()
             ssm_stub.assert_no_pending_responses()
+
+
+class TestSync:
+    """Test runway.cfngin.hooks.staticsite.upload_staticsite.sync."""
+
+    @pytest.mark.parametrize("content_hash", [False, True])
+    def test_sync(
+        self,
+        cfngin_context: MockCFNginContext,
+        content_hash: bool,
+        mocker: MockerFixture,
+    ) -> None:
+        """Test sync."""
+        mock_bucket = mocker.patch(f"{MODULE}.Bucket")
+        mocker.patch(f"{MODULE}.sync_extra_files", return_value=[])
+        mocker.patch(f"{MODULE}.prune_archives")
+        mocker.patch(f"{MODULE}.update_ssm_hash")
+        cfngin_context.hook_data["staticsite"] = {
+            "app_directory": "dist",
+            "deploy_is_current": False,
+        }
+        assert sync(
+            cfngin_context,
+            bucket_name="bucket",
+            cf_disabled=True,
+            content_hash=content_hash,
+        )
+        mock_bucket.return_value.sync_from_local.assert_called_once_with(
+            "dist",
+            content_hash=content_hash,
+            content_hash_manifest=cfngin_context.config.cfngin_cache_dir
+            / "staticsite"
+            / "bucket.manifest.json"
+            if content_hash
+            else None,
+            delete=True,
+            exclude=[],
+        )
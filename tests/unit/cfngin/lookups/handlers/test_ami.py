@@ -3,13 +3,19 @@
 # pyright: basic
 from __future__ import annotations
 
+import json
+import time
 from typing import TYPE_CHECKING
 
 import pytest
+from mock import patch
 
 from runway.cfngin.lookups.handlers.ami import AmiLookup, ImageNotFound
+from runway.lookups.handlers.base import LOOKUP_CACHE
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from ....factories import MockCFNginContext
 
 REGION = "us-east-1"
@@ -209,3 +215,100 @@ class TestAMILookup:
             AmiLookup.handle(
                 value=r"owners:self name_regex:MyImage\s\d", context=cfngin_context
             )
+
+    def test_describe_images_cached(self, cfngin_context: MockCFNginContext) -> None:
+        """Test images are described once for the same owners and filters."""
+        stubber = cfngin_context.add_stubber("ec2")
+        stubber.add_response(
+            "describe_images",
+            {
+                "Images": [
+                    {
+                        "CreationDate": "2011-02-13T01:17:44.000Z",
+                        "ImageId": "ami-1",
+                        "Name": "server-1",
+                    },
+                    {
+                        "CreationDate": "2011-02-14T01:17:44.000Z",
+                        "ImageId": "ami-2",
+                        "Name": "server-2",
+                    },
+                ]
+            },
+            {
+                "Owners": ["amazon", "self"],
+                "Filters": [
+                    {"Name": "architecture", "Values": ["i386", "x86_64"]},
+                    {"Name": "state", "Values": ["available"]},
+                ],
+            },
+        )
+
+        with stubber:
+            assert (
+                AmiLookup.handle(
+                    value="owners:self,amazon name_regex:server-[0-9] "
+                    "state:available architecture:x86_64,i386",
+                    context=cfngin_context,
+                )
+                == "ami-2"
+            )
+            assert (
+                AmiLookup.handle(
+                    value="owners:amazon,self name_regex:server-1 "
+                    "architecture:i386,x86_64 state:available",
+                    context=cfngin_context,
+                )
+                == "ami-1"
+            )
+        stubber.assert_no_pending_responses()
+
+    def test_describe_images_cache_file(
+        self, cfngin_context: MockCFNginContext, tmp_path: Path
+    ) -> None:
+        """Test images are cached in the cache directory."""
+        cfngin_context.config.ami_cache_ttl = 60
+        cfngin_context.config.cfngin_cache_dir = tmp_path
+        ec2_stubber = cfngin_context.add_stubber("ec2")
+        sts_stubber = cfngin_context.add_stubber("sts")
+        for _ in range(3):
+            sts_stubber.add_response(
+                "get_caller_identity",
+                {"Account": "123456789012"},
+            )
+        for image_id in ["ami-1", "ami-2"]:
+            ec2_stubber.add_response(
+                "describe_images",
+                {
+                    "Images": [
+                        {
+                            "CreationDate": "2011-02-13T01:17:44.000Z",
+                            "ImageId": image_id,
+                            "Name": "server-1",
+                        }
+                    ]
+                },
+            )
+
+        with ec2_stubber, sts_stubber:
+            args = ("owners:self name_regex:server-[0-9]", cfngin_context)
+            assert AmiLookup.handle(*args) == "ami-1"
+            (cache_file,) = (tmp_path / "ami").iterdir()
+            assert json.loads(cache_file.read_text())["images"] == [
+                {
+                    "CreationDate": "2011-02-13T01:17:44.000Z",
+                    "ImageId": "ami-1",
+                    "Name": "server-1",
+                }
+            ]
+
+            LOOKUP_CACHE.invalidate()
+            assert AmiLookup.handle(*args) == "ami-1"
+
+            # expired
+            LOOKUP_CACHE.invalidate()
+            cfngin_context.config.ami_cache_ttl = 1
+            with patch("time.time", return_value=time.time() + 120):
+                assert AmiLookup.handle(*args) == "ami-2"
+        ec2_stubber.assert_no_pending_responses()
+        sts_stubber.assert_no_pending_responses()
@@ -4,11 +4,14 @@
 from __future__ import annotations
 
 import codecs
+import threading
 from typing import TYPE_CHECKING
 
 from runway.cfngin.lookups.handlers.kms import KmsLookup
 
 if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
     from ....factories import MockCFNginContext
 
 SECRET = "my secret"
@@ -46,3 +49,48 @@ class TestKMSHandler:
                 KmsLookup.handle(f"{region}@{SECRET}", context=cfngin_context) == SECRET
             )
             stubber.assert_no_pending_responses()
+
+    def test_kms_handler_cached(self, cfngin_context: MockCFNginContext) -> None:
+        """Test kms handler only decrypts a value once."""
+        stubber = cfngin_context.add_stubber("kms")
+        stubber.add_response(
+            "decrypt",
+            {"Plaintext": SECRET.encode()},
+            {"CiphertextBlob": codecs.decode(SECRET.encode(), "base64")},
+        )
+
+        with stubber:
+            assert KmsLookup.handle(SECRET, context=cfngin_context) == SECRET
+            assert KmsLookup.handle(SECRET, context=cfngin_context) == SECRET
+            stubber.assert_no_pending_responses()
+
+    def test_prefetch(self, cfngin_context: MockCFNginContext) -> None:
+        """Test prefetch."""
+        stubber = cfngin_context.add_stubber("kms")
+        stubber.add_client_error("decrypt", "AccessDeniedException")
+        stubber.add_response(
+            "decrypt",
+            {"Plaintext": SECRET.encode()},
+            {"CiphertextBlob": codecs.decode(SECRET.encode(), "base64")},
+        )
+
+        with stubber:
+            KmsLookup.prefetch([SECRET], cfngin_context)
+            assert KmsLookup.handle(SECRET, context=cfngin_context) == SECRET
+            KmsLookup.prefetch([SECRET], cfngin_context)
+            assert KmsLookup.handle(SECRET, context=cfngin_context) == SECRET
+            stubber.assert_no_pending_responses()
+
+    def test_prefetch_concurrent(
+        self, cfngin_context: MockCFNginContext, mocker: MockerFixture
+    ) -> None:
+        """Test prefetch decrypts values concurrently."""
+        barrier = threading.Barrier(2, timeout=5)
+        mock_decrypt = mocker.patch.object(
+            KmsLookup, "_decrypt", side_effect=lambda *_: barrier.wait()
+        )
+        KmsLookup.prefetch(
+            ["us-east-1@" + SECRET, "us-west-2@" + SECRET], cfngin_context
+        )
+        assert mock_decrypt.call_count == 2
+        assert not barrier.broken
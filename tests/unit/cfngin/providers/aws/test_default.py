@@ -27,6 +27,7 @@ from runway.cfngin.providers.aws.default import (
     DEFAULT_CAPABILITIES,
     MAX_TAIL_RETRIES,
     Provider,
+    StackStatusPoller,
     ask_for_approval,
     create_change_set,
     generate_cloudformation_args,
@@ -38,6 +39,7 @@ from runway.cfngin.providers.aws.default import (
 from runway.cfngin.providers.base import Template
 from runway.cfngin.session_cache import get_session
 from runway.cfngin.stack import Stack
+from runway.lookups.handlers.base import LOOKUP_CACHE
 from runway.utils import MutableMap
 
 if TYPE_CHECKING:
@@ -595,6 +597,196 @@ class TestProvider:
             is expected
         )
 
+    def test_tail_stack_wake_poller(self, mocker: MockerFixture) -> None:
+        """Test tail_stack wakes the poller on a terminal stack event."""
+        events = [
+            {
+                "LogicalResourceId": "test",
+                "ResourceType": "AWS::CloudFormation::Stack",
+                "ResourceStatus": "UPDATE_IN_PROGRESS",
+            },
+            {
+                "LogicalResourceId": "resource",
+                "ResourceType": "AWS::S3::Bucket",
+                "ResourceStatus": "UPDATE_COMPLETE",
+            },
+            {
+                "LogicalResourceId": "test",
+                "ResourceType": "AWS::CloudFormation::Stack",
+                "ResourceStatus": "UPDATE_COMPLETE",
+            },
+        ]
+
+        def _tail(*_args: Any, log_func: Any, **_kwargs: Any) -> None:
+            for event in events:
+                log_func(event)
+
+        mocker.patch.object(Provider, "tail", side_effect=_tail)
+        stack = MagicMock(fqn="test")
+        log_func = MagicMock()
+        obj = Provider(MagicMock())
+        mock_wake = mocker.patch.object(obj.poller, "wake")
+        obj.tail_stack(stack, threading.Event(), log_func=log_func)
+        assert log_func.call_count == 3
+        mock_wake.assert_called_once_with("test")
+
+
+class TestStackStatusPoller:
+    """Test StackStatusPoller."""
+
+    def test_get_delay(self, mocker: MockerFixture) -> None:
+        """Test get_delay."""
+        mock_time = mocker.patch(f"{default.__name__}.time.time", return_value=100.0)
+        obj = StackStatusPoller(MagicMock(), interval=30, min_interval=2)
+        assert obj.get_delay("test") == 2
+        mock_time.return_value = 140.0
+        assert obj.get_delay("test") == 10
+        mock_time.return_value = 1000.0
+        assert obj.get_delay("test") == 30
+        assert obj.get_delay("other") == 2
+
+    def test_wait_resets_delay(self) -> None:
+        """Test wait resets the delay once a stack is no longer in progress."""
+        provider = MagicMock()
+        provider.get_stack.return_value = generate_describe_stacks_stack(
+            "test", stack_status="UPDATE_IN_PROGRESS"
+        )
+        obj = StackStatusPoller(provider, interval=0, min_interval=0)
+        obj.wait("test")
+        assert "test" in obj._in_progress_since
+        provider.get_stack.return_value = generate_describe_stacks_stack("test")
+        obj.wait("test")
+        assert "test" not in obj._in_progress_since
+
+    def test_wait(self) -> None:
+        """Test wait for a single stack."""
+        provider = MagicMock()
+        provider.get_stack.return_value = generate_describe_stacks_stack("test")
+        obj = StackStatusPoller(provider, interval=0)
+        assert obj.wait("test") == provider.get_stack.return_value
+        provider.get_stack.assert_called_once_with("test", use_cache=False)
+        provider.cloudformation.get_paginator.assert_not_called()
+
+    def test_wait_cancel(self) -> None:
+        """Test wait canceled."""
+        provider = MagicMock()
+        cancel = threading.Event()
+        cancel.set()
+        obj = StackStatusPoller(provider, interval=0)
+        with pytest.raises(exceptions.CancelExecution):
+            obj.wait("test", cancel)
+        provider.get_stack.assert_not_called()
+
+    def test_wait_error(self) -> None:
+        """Test wait with an error raised by the sweep."""
+        provider = MagicMock()
+        provider.get_stack.side_effect = ValueError("test")
+        obj = StackStatusPoller(provider, interval=0)
+        with pytest.raises(ValueError):
+            obj.wait("test")
+
+    def test_wait_multiple(self) -> None:
+        """Test wait for multiple stacks described one at a time."""
+        provider = Provider(get_session(region="us-east-1"), region="us-east-1")
+        stubber = Stubber(provider.cloudformation)
+        stubber.add_response(
+            "describe_stacks",
+            {"Stacks": [generate_describe_stacks_stack("stack0")]},
+            {"StackName": "stack0"},
+        )
+        stubber.add_client_error(
+            "describe_stacks",
+            service_message="Stack with id stack1 does not exist",
+            expected_params={"StackName": "stack1"},
+        )
+        obj = StackStatusPoller(provider, interval=0.2, min_interval=0.2)
+        results: Dict[str, Any] = {}
+
+        def _wait(stack_name: str) -> None:
+            try:
+                results[stack_name] = obj.wait(stack_name)["StackStatus"]
+            except exceptions.StackDoesNotExist:
+                results[stack_name] = None
+
+        threads = [
+            threading.Thread(target=_wait, args=(name,))
+            for name in ["stack0", "stack1"]
+        ]
+        with stubber:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        stubber.assert_no_pending_responses()
+        assert results == {"stack0": "CREATE_COMPLETE", "stack1": None}
+
+    def test_wait_multiple_sweep(self) -> None:
+        """Test wait for multiple stacks uses a single sweep."""
+        provider = Provider(get_session(region="us-east-1"), region="us-east-1")
+        stubber = Stubber(provider.cloudformation)
+        stubber.add_response(
+            "describe_stacks",
+            {
+                "Stacks": [
+                    generate_describe_stacks_stack("stack0"),
+                    generate_describe_stacks_stack("other"),
+                    generate_describe_stacks_stack(
+                        "stack1", stack_status="UPDATE_IN_PROGRESS"
+                    ),
+                ]
+            },
+            {},
+        )
+        obj = StackStatusPoller(provider, interval=0.2, min_interval=0.2)
+        obj.sweep_pages = 2
+        results: Dict[str, Any] = {}
+
+        def _wait(stack_name: str) -> None:
+            try:
+                results[stack_name] = obj.wait(stack_name)["StackStatus"]
+            except exceptions.StackDoesNotExist:
+                results[stack_name] = None
+
+        threads = [
+            threading.Thread(target=_wait, args=(name,))
+            for name in ["stack0", "stack1", "stack2"]
+        ]
+        with stubber:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        stubber.assert_no_pending_responses()
+        assert results == {
+            "stack0": "CREATE_COMPLETE",
+            "stack1": "UPDATE_IN_PROGRESS",
+            "stack2": None,
+        }
+        assert obj.sweep_pages == 1
+
+    def test_wait_stack_does_not_exist(self) -> None:
+        """Test wait for a stack that does not exist."""
+        provider = MagicMock()
+        provider.get_stack.side_effect = exceptions.StackDoesNotExist("test")
+        obj = StackStatusPoller(provider, interval=0)
+        with pytest.raises(exceptions.StackDoesNotExist):
+            obj.wait("test")
+
+    def test_wake(self) -> None:
+        """Test wake ends a wait early."""
+        provider = MagicMock()
+        provider.get_stack.return_value = generate_describe_stacks_stack("test")
+        obj = StackStatusPoller(provider, interval=60, min_interval=60)
+        result: List[Any] = []
+        thread = threading.Thread(target=lambda: result.append(obj.wait("test")))
+        thread.start()
+        while not obj._waiters:
+            default.time.sleep(0.01)
+        obj.wake("test")
+        thread.join(5)
+        assert not thread.is_alive()
+        assert result == [provider.get_stack.return_value]
+
 
 class TestProviderDefaultMode(unittest.TestCase):
     """Tests for runway.cfngin.providers.aws.default default mode."""
@@ -708,6 +900,193 @@ class TestProviderDefaultMode(unittest.TestCase):
 
         self.assertEqual(response["StackName"], stack_name)
 
+    def test_get_stack_cached(self) -> None:
+        """Test get stack returns the cached stack."""
+        stack_name = "MockStack"
+        stack_response = {"Stacks": [generate_describe_stacks_stack(stack_name)]}
+        self.stubber.add_response(
+            "describe_stacks", stack_response, expected_params={"StackName": stack_name}
+        )
+
+        with self.stubber:
+            response = self.provider.get_stack(stack_name)
+            assert self.provider.get_stack(stack_name) is response
+            assert self.provider.get_outputs(stack_name) == {}
+        self.stubber.assert_no_pending_responses()
+
+    def test_get_stack_cache_expired(self) -> None:
+        """Test get stack describes the stack again when the cache expired."""
+        stack_name = "MockStack"
+        stack_response = {"Stacks": [generate_describe_stacks_stack(stack_name)]}
+        for _ in range(2):
+            self.stubber.add_response(
+                "describe_stacks",
+                stack_response,
+                expected_params={"StackName": stack_name},
+            )
+
+        with self.stubber, patch(f"{default.__name__}.time.time") as mock_time:
+            mock_time.return_value = 100.0
+            self.provider.get_stack(stack_name)
+            mock_time.return_value += default.STACK_CACHE_TTL
+            self.provider.get_stack(stack_name)
+        self.stubber.assert_no_pending_responses()
+
+    def test_get_stack_in_progress_not_cached(self) -> None:
+        """Test get stack does not cache stacks that are in progress."""
+        stack_name = "MockStack"
+        self.stubber.add_response(
+            "describe_stacks",
+            {
+                "Stacks": [
+                    generate_describe_stacks_stack(
+                        stack_name, stack_status="UPDATE_IN_PROGRESS"
+                    )
+                ]
+            },
+            expected_params={"StackName": stack_name},
+        )
+        self.stubber.add_response(
+            "describe_stacks",
+            {"Stacks": [generate_describe_stacks_stack(stack_name)]},
+            expected_params={"StackName": stack_name},
+        )
+
+        with self.stubber:
+            self.provider.get_stack(stack_name)
+            self.provider.get_stack(stack_name)
+        self.stubber.assert_no_pending_responses()
+
+    def test_get_stack_use_cache_false(self) -> None:
+        """Test get stack bypassing the cache."""
+        stack_name = "MockStack"
+        stack_response = {"Stacks": [generate_describe_stacks_stack(stack_name)]}
+        for _ in range(2):
+            self.stubber.add_response(
+                "describe_stacks",
+                stack_response,
+                expected_params={"StackName": stack_name},
+            )
+
+        with self.stubber:
+            self.provider.get_stack(stack_name)
+            self.provider.get_stack(stack_name, use_cache=False)
+        self.stubber.assert_no_pending_responses()
+
+    def test_get_outputs_stack_output_index(self) -> None:
+        """Test get_outputs with stack_output_index enabled."""
+        self.provider.stack_output_index = True
+        stack0 = generate_describe_stacks_stack("stack0")
+        stack0["Outputs"] = [{"OutputKey": "Key", "OutputValue": "stack0-val"}]
+        stack1 = generate_describe_stacks_stack("stack1")
+        stack1["Outputs"] = [{"OutputKey": "Key", "OutputValue": "stack1-val"}]
+        stack2 = generate_describe_stacks_stack(
+            "stack2", stack_status="UPDATE_IN_PROGRESS"
+        )
+        self.stubber.add_response(
+            "describe_stacks", {"Stacks": [stack0], "NextToken": "token"}, {}
+        )
+        self.stubber.add_response(
+            "describe_stacks", {"Stacks": [stack1, stack2]}, {"NextToken": "token"}
+        )
+        self.stubber.add_response(
+            "describe_stacks", {"Stacks": [stack1]}, {"StackName": "stack1"}
+        )
+        self.stubber.add_response(
+            "describe_stacks",
+            {"Stacks": [generate_describe_stacks_stack("stack2")]},
+            {"StackName": "stack2"},
+        )
+
+        with self.stubber:
+            assert self.provider.get_output("stack1", "Key") == "stack1-val"
+            assert self.provider.get_output("stack0", "Key") == "stack0-val"
+            self.provider.invalidate_stack_cache("stack1")
+            assert self.provider.get_output("stack1", "Key") == "stack1-val"
+            assert self.provider.get_outputs("stack2") == {}
+        self.stubber.assert_no_pending_responses()
+
+    def test_index_stack_outputs_invalidated(self) -> None:
+        """Test index_stack_outputs skips stacks invalidated while indexing."""
+        stack0 = generate_describe_stacks_stack("stack0")
+        stack0["Outputs"] = [{"OutputKey": "Key", "OutputValue": "stack0-val"}]
+        stack1 = generate_describe_stacks_stack("stack1")
+        self.stubber.add_response(
+            "describe_stacks", {"Stacks": [stack0], "NextToken": "token"}, {}
+        )
+        self.stubber.add_response(
+            "describe_stacks", {"Stacks": [stack1]}, {"NextToken": "token"}
+        )
+        cache_stack = self.provider.cache_stack
+
+        def invalidate_while_indexing(stack: Any) -> None:
+            cache_stack(stack)
+            # another thread submits a change to the stack
+            self.provider.invalidate_stack_cache(stack["StackName"])
+
+        with self.stubber, patch.object(
+            self.provider, "cache_stack", side_effect=invalidate_while_indexing
+        ):
+            self.provider.index_stack_outputs()
+        self.stubber.assert_no_pending_responses()
+        assert not self.provider._outputs
+        assert self.provider._outputs_invalidated is None
+
+    def test_index_stack_outputs_error(self) -> None:
+        """Test index_stack_outputs falls back to describing each stack."""
+        self.provider.stack_output_index = True
+        self.stubber.add_client_error("describe_stacks", "AccessDenied")
+        self.stubber.add_response(
+            "describe_stacks",
+            {"Stacks": [generate_describe_stacks_stack("stack0")]},
+            {"StackName": "stack0"},
+        )
+
+        with self.stubber:
+            assert self.provider.get_outputs("stack0") == {}
+            self.provider.index_stack_outputs()  # only attempted once
+        self.stubber.assert_no_pending_responses()
+
+    def test_invalidate_stack_cache(self) -> None:
+        """Test invalidate_stack_cache."""
+        stack_name = "MockStack"
+        stack = generate_describe_stacks_stack(stack_name)
+        self.provider.cache_stack(stack)
+        self.provider._outputs[stack_name] = {"key": "val"}
+
+        LOOKUP_CACHE.get("lookup", lambda: "val", ttl=60, tags=[stack_name])
+        LOOKUP_CACHE.get("/param", lambda: "val", ttl=60, tags=["/param", "ssm"])
+
+        self.provider.invalidate_stack_cache(stack_name, outputs=False)
+        assert stack_name not in self.provider._stack_cache
+        assert self.provider._outputs[stack_name] == {"key": "val"}
+        assert LOOKUP_CACHE.get("lookup", lambda: "new", ttl=60) == "val"
+        assert LOOKUP_CACHE.get("/param", lambda: "new", ttl=60) == "val"
+
+        self.provider.cache_stack(stack)
+        self.provider.invalidate_stack_cache(stack_name)
+        assert stack_name not in self.provider._stack_cache
+        assert stack_name not in self.provider._outputs
+        assert LOOKUP_CACHE.get("lookup", lambda: "new", ttl=60) == "new"
+        assert LOOKUP_CACHE.get("/param", lambda: "new", ttl=60) == "new"
+
+    def test_update_stack_invalidates_cache(self) -> None:
+        """Test update_stack invalidates the cached stack."""
+        stack_name = "MockStack"
+        stack = generate_describe_stacks_stack(stack_name)
+        self.provider.cache_stack(stack)
+        self.provider._outputs[stack_name] = {"key": "val"}
+
+        with patch.object(
+            self.provider, "select_update_method"
+        ) as mock_select, patch.object(self.provider, "update_termination_protection"):
+            self.provider.update_stack(
+                stack_name, Template(url="http://fake.template.url.com/"), [], [], []
+            )
+        mock_select.return_value.assert_called_once()
+        assert stack_name not in self.provider._stack_cache
+        assert stack_name not in self.provider._outputs
+
     def test_select_destroy_method(self) -> None:
         """Test select destroy method."""
         for i in [
@@ -908,10 +1287,10 @@ class TestProviderDefaultMode(unittest.TestCase):
                 status="CREATE_COMPLETE", execution_status="AVAILABLE", changes=changes
             ),
         )
-        self.stubber.add_response("delete_change_set", {})
         self.stubber.add_response(
             "describe_stacks", {"Stacks": [generate_describe_stacks_stack(stack_name)]}
         )
+        self.stubber.add_response("delete_change_set", {})
 
         with self.stubber:
             result = self.provider.get_stack_changes(
@@ -956,7 +1335,6 @@ class TestProviderDefaultMode(unittest.TestCase):
                 status="CREATE_COMPLETE", execution_status="AVAILABLE", changes=changes
             ),
         )
-        self.stubber.add_response("delete_change_set", {})
         self.stubber.add_response(
             "describe_stacks",
             {
@@ -967,6 +1345,7 @@ class TestProviderDefaultMode(unittest.TestCase):
                 ]
             },
         )
+        self.stubber.add_response("delete_change_set", {})
         self.stubber.add_response(
             "describe_stacks",
             {
@@ -992,6 +1371,58 @@ class TestProviderDefaultMode(unittest.TestCase):
             full_changeset=changes, params_diff=[], fqn=stack_name, answer="y"
         )
 
+    @patch("runway.cfngin.providers.aws.default.output_full_changeset")
+    def test_get_stack_changes_deferred(self, mock_output_full_cs: MagicMock) -> None:
+        """Test get stack changes with output and cleanup deferred."""
+        stack_name = "MockStack"
+        mock_stack = generate_stack_object(stack_name)
+        deferred: List[Any] = []
+
+        self.stubber.add_response(
+            "describe_stacks", {"Stacks": [generate_describe_stacks_stack(stack_name)]}
+        )
+        self.stubber.add_response(
+            "get_template", generate_get_template("cfn_template.yaml")
+        )
+        self.stubber.add_response(
+            "create_change_set", {"Id": "CHANGESETID", "StackId": stack_name}
+        )
+        changes = [generate_change()]
+        self.stubber.add_response(
+            "describe_change_set",
+            generate_change_set_response(
+                status="CREATE_COMPLETE", execution_status="AVAILABLE", changes=changes
+            ),
+        )
+        self.stubber.add_response(
+            "describe_stacks", {"Stacks": [generate_describe_stacks_stack(stack_name)]}
+        )
+
+        with self.stubber:
+            result = self.provider.get_stack_changes(
+                stack=mock_stack,
+                template=Template(url="http://fake.template.url.com/"),
+                parameters=[],
+                tags=[],
+                deferred=deferred,
+            )
+        self.stubber.assert_no_pending_responses()
+        mock_output_full_cs.assert_not_called()
+        assert result == {
+            "FakeOutput": "<inferred-change: MockStack.FakeOutput={'Ref': 'FakeResource'}>"
+        }
+        assert len(deferred) == 1
+
+        self.stubber.add_response(
+            "delete_change_set", {}, {"ChangeSetName": "CHANGESETID"}
+        )
+        with self.stubber:
+            deferred[0]()
+        self.stubber.assert_no_pending_responses()
+        mock_output_full_cs.assert_called_once_with(
+            full_changeset=changes, params_diff=[], fqn=stack_name, answer="y"
+        )
+
     def test_tail_stack_retry_on_missing_stack(self) -> None:
         """Test tail stack retry on missing stack."""
         stack_name = "SlowToCreateStack"
@@ -1089,6 +1520,7 @@ class TestProviderDefaultMode(unittest.TestCase):
         ]
 
         for test in test_cases:
+            self.provider.invalidate_stack_cache(stack_name)
             self.stubber.add_response(
                 "describe_stacks",
                 {
@@ -1309,10 +1741,10 @@ class TestProviderInteractiveMode(unittest.TestCase):
                 status="CREATE_COMPLETE", execution_status="AVAILABLE", changes=changes
             ),
         )
-        self.stubber.add_response("delete_change_set", {})
         self.stubber.add_response(
             "describe_stacks", {"Stacks": [generate_describe_stacks_stack(stack_name)]}
         )
+        self.stubber.add_response("delete_change_set", {})
 
         with self.stubber:
             self.provider.get_stack_changes(
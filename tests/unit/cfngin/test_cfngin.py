@@ -10,6 +10,8 @@ from mock import Mock, call
 from yaml.constructor import ConstructorError
 
 from runway.cfngin.cfngin import CFNgin
+from runway.config import CfnginConfig
+from runway.context import CfnginContext
 from runway.core.components import DeployEnvironment
 
 from ..factories import MockRunwayContext
@@ -341,6 +343,42 @@ class TestCFNgin:
         should_skip.assert_called_once_with(False)
         patch_safehaven.assert_not_called()
 
+    def test_select_changed_stacks(self, cd_tmp_path: Path) -> None:
+        """Test _select_changed_stacks."""
+        for name in ["a", "b", "c"]:
+            (cd_tmp_path / f"{name}.yml").write_text("Resources: {}")
+        config_path = cd_tmp_path / "cfngin.yml"
+        ctx = CfnginContext(
+            config=CfnginConfig.parse_obj(
+                {
+                    "namespace": "test",
+                    "stacks": [
+                        {"name": "a", "template_path": "a.yml"},
+                        {"name": "b", "template_path": "b.yml", "requires": ["a"]},
+                        {"name": "c", "template_path": "c.yml"},
+                    ],
+                }
+            ),
+            config_path=config_path,
+        )
+        context = self.get_context()
+        cfngin = CFNgin(ctx=context, sys_path=cd_tmp_path)
+
+        assert cfngin._select_changed_stacks(ctx)
+        assert not ctx.stack_names
+
+        context.env.changed_files = frozenset()
+        assert not cfngin._select_changed_stacks(ctx)
+
+        context.env.changed_files = frozenset([(cd_tmp_path / "a.yml").resolve()])
+        assert cfngin._select_changed_stacks(ctx)
+        assert ctx.stack_names == ["a", "b"]
+
+        ctx.stack_names = []
+        context.env.changed_files = frozenset([config_path.resolve()])
+        assert cfngin._select_changed_stacks(ctx)
+        assert not ctx.stack_names
+
     def test_should_skip(self, cfngin_fixtures: Path, tmp_path: Path) -> None:
         """Test should_skip."""
         cfngin = CFNgin(ctx=self.get_context(), sys_path=tmp_path)
@@ -1,16 +1,12 @@
 """Tests for runway.cfngin.dag."""
 # pyright: basic
 import threading
+import time
 from typing import Any, List
 
 import pytest
 
-from runway.cfngin.dag import (
-    DAG,
-    DAGValidationError,
-    ThreadedWalker,
-    UnlimitedSemaphore,
-)
+from runway.cfngin.dag import DAG, DAGValidationError, ThreadedWalker
 
 
 def test_add_node(empty_dag: DAG) -> None:
@@ -143,6 +139,19 @@ def test_filter(basic_dag: DAG) -> None:
     assert dag2.graph == {"b": set("d"), "c": set("d"), "d": set()}
 
 
+def test_critical_path_lengths(basic_dag: DAG) -> None:
+    """Test critical_path_lengths."""
+    dag = basic_dag
+
+    assert dag.critical_path_lengths() == {"a": 1, "b": 2, "c": 2, "d": 3}
+    assert dag.critical_path_lengths({"a": 10, "b": 1, "c": 100}) == {
+        "a": 10,
+        "b": 11,
+        "c": 110,
+        "d": 147,
+    }
+
+
 def test_all_leaves(basic_dag: DAG) -> None:
     """Test all leaves."""
     dag = basic_dag
@@ -199,7 +208,7 @@ def test_threaded_walker(empty_dag: DAG) -> None:
     """Test threaded walker."""
     dag = empty_dag
 
-    walker = ThreadedWalker(UnlimitedSemaphore())
+    walker = ThreadedWalker()
 
     # b and c should be executed at the same time.
     dag.from_dict({"a": ["b", "c"], "b": ["d"], "c": ["d"], "d": []})
@@ -214,3 +223,72 @@ def test_threaded_walker(empty_dag: DAG) -> None:
 
     walker.walk(dag, walk_func)
     assert nodes in [["d", "c", "b", "a"], ["d", "b", "c", "a"]]
+
+
+def test_threaded_walker_max_workers(empty_dag: DAG) -> None:
+    """Test threaded walker max_workers."""
+    dag = empty_dag
+    dag.from_dict({"a": [], "b": [], "c": [], "d": [], "e": ["a", "b", "c", "d"]})
+
+    lock = threading.Lock()
+    active: List[int] = [0]
+    peak: List[int] = [0]
+    threads = set()
+    nodes: List[Any] = []
+
+    def walk_func(node: Any) -> bool:
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+            threads.add(threading.current_thread().name)
+            nodes.append(node)
+        time.sleep(0.01)
+        with lock:
+            active[0] -= 1
+        return True
+
+    ThreadedWalker(2).walk(dag, walk_func)
+    assert peak[0] <= 2
+    assert len(threads) <= 2
+    assert nodes[-1] == "e"
+    assert len(nodes) == 5
+
+
+def test_threaded_walker_exception(empty_dag: DAG) -> None:
+    """Test threaded walker continues when walk_func raises."""
+    dag = empty_dag
+    dag.from_dict({"a": ["b"], "b": [], "c": []})
+    nodes: List[Any] = []
+
+    def walk_func(node: Any) -> bool:
+        nodes.append(node)
+        if node == "b":
+            raise ValueError("fail")
+        return True
+
+    ThreadedWalker(1).walk(dag, walk_func)
+    assert sorted(nodes) == ["a", "b", "c"]
+
+
+def test_threaded_walker_max_workers_value_error() -> None:
+    """Test threaded walker with invalid max_workers."""
+    with pytest.raises(ValueError):
+        ThreadedWalker(-1)
+
+
+def test_threaded_walker_critical_path(empty_dag: DAG) -> None:
+    """Test threaded walker starts the critical path first."""
+    dag = empty_dag
+    dag.from_dict({"a": [], "b": [], "c": ["b"], "d": ["c"]})
+    nodes: List[Any] = []
+
+    def walk_func(node: Any) -> bool:
+        nodes.append(node)
+        return True
+
+    ThreadedWalker(1).walk(dag, walk_func)
+    assert nodes == ["b", "c", "d", "a"]
+
+    nodes.clear()
+    ThreadedWalker(1, weights={"a": 100, "b": 1, "c": 1, "d": 1}).walk(dag, walk_func)
+    assert nodes[0] == "a"
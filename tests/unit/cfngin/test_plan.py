@@ -7,6 +7,7 @@ import json
 import os
 import shutil
 import tempfile
+import threading
 import unittest
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
@@ -17,13 +18,20 @@ from runway.cfngin.exceptions import (
     CancelExecution,
     GraphError,
     PersistentGraphLocked,
+    PersistentGraphModified,
     PlanFailed,
 )
 from runway.cfngin.lookups.registry import (
     register_lookup_handler,
     unregister_lookup_handler,
 )
-from runway.cfngin.plan import Graph, Plan, Step
+from runway.cfngin.plan import (
+    Graph,
+    Plan,
+    Step,
+    _PersistentGraphWriter,
+    count_api_call,
+)
 from runway.cfngin.stack import Stack
 from runway.cfngin.status import COMPLETE, FAILED, SKIPPED, SUBMITTED
 from runway.cfngin.utils import stack_template_key_name
@@ -67,6 +75,27 @@ class TestStep(unittest.TestCase):
         self.assertNotEqual(self.step.status, False)
         self.assertNotEqual(self.step.status, "banana")
 
+    def test_run(self) -> None:
+        """Test run records timing information."""
+        statuses = [SUBMITTED, SUBMITTED, COMPLETE]
+
+        def _fn(stack: Stack, status: Optional[Status] = None) -> Status:
+            count_api_call()
+            return statuses.pop(0)
+
+        self.step.fn = _fn
+        self.assertTrue(self.step.run())
+        self.assertEqual(self.step.api_calls, 3)
+        self.assertEqual(self.step.poll_count, 2)
+        self.assertIsNotNone(self.step.started_at)
+        self.assertEqual(self.step.queued_at, self.step.started_at)
+        self.assertGreaterEqual(self.step.submitted_at, self.step.started_at)
+        self.assertGreaterEqual(self.step.completed_at, self.step.submitted_at)
+        self.assertGreaterEqual(self.step.duration, 0)
+
+        count_api_call()  # not running a step
+        self.assertEqual(self.step.api_calls, 3)
+
     def test_from_stack_name(self) -> None:
         """Return step from step name."""
         context = mock_context()
@@ -143,13 +172,62 @@ class TestGraph(unittest.TestCase):
         self.assertEqual(self.graph_dict_expected, graph.to_dict())
 
 
+class TestPersistentGraphWriter(unittest.TestCase):
+    """Tests for runway.cfngin.plan._PersistentGraphWriter."""
+
+    def test_flush(self) -> None:
+        """Test flush."""
+        context = mock.MagicMock()
+        writer = _PersistentGraphWriter(context, "123", delay=60)
+        writer.flush()
+        context.put_persistent_graph.assert_not_called()
+
+        writer.schedule()
+        writer.schedule()
+        writer.flush()
+        context.put_persistent_graph.assert_called_once_with("123")
+        writer.flush()
+        context.put_persistent_graph.assert_called_once_with("123")
+
+    def test_schedule(self) -> None:
+        """Test schedule writes in the background."""
+        context = mock.MagicMock()
+        written = threading.Event()
+        context.put_persistent_graph.side_effect = lambda _: written.set()
+        writer = _PersistentGraphWriter(context, "123", delay=0)
+        writer.schedule()
+        self.assertTrue(written.wait(5))
+        writer.flush()
+        context.put_persistent_graph.assert_called_once_with("123")
+
+    def test_schedule_error(self) -> None:
+        """Test schedule leaves errors to be raised by flush."""
+        context = mock.MagicMock()
+        attempted = threading.Event()
+
+        def put_persistent_graph(_: str) -> None:
+            attempted.set()
+            raise PersistentGraphModified("bucket/key")
+
+        context.put_persistent_graph.side_effect = put_persistent_graph
+        writer = _PersistentGraphWriter(context, "123", delay=0)
+        writer.schedule()
+        self.assertTrue(attempted.wait(5))
+        with self.assertRaises(PersistentGraphModified):
+            writer.flush()
+
+
 class TestPlan(unittest.TestCase):
     """Tests for runway.cfngin.plan.Plan."""
 
     def setUp(self) -> None:
         """Run before tests."""
         self.count = 0
-        self.config = CfnginConfig.parse_obj({"namespace": "namespace"})
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        self.config = CfnginConfig.parse_obj(
+            {"namespace": "namespace", "cfngin_cache_dir": cache_dir}
+        )
         self.context = CfnginContext(config=self.config)
 
         class FakeLookup(LookupHandler):
@@ -180,6 +258,26 @@ class TestPlan(unittest.TestCase):
 
         self.assertEqual(plan.graph.to_dict(), {"bastion.1": {"vpc.1"}, "vpc.1": set()})
 
+    def test_walk_flush_error(self) -> None:
+        """Test walk raises flush errors only if the walk succeeded."""
+        vpc = Stack(definition=generate_definition("vpc", 1), context=self.context)
+        plan = Plan(
+            description="Test",
+            graph=Graph.from_steps([Step(vpc, fn=None)]),
+            context=self.context,
+        )
+        with mock.patch.object(
+            _PersistentGraphWriter,
+            "flush",
+            side_effect=PersistentGraphModified("bucket/key"),
+        ), mock.patch.object(Graph, "walk", return_value=True) as mock_walk:
+            with self.assertRaises(PersistentGraphModified):
+                plan.walk(walk)
+            mock_walk.side_effect = ValueError("walk failed")
+            with self.assertLogs("runway.cfngin.plan", "ERROR"):
+                with self.assertRaises(ValueError):
+                    plan.walk(walk)
+
     def test_plan_reverse(self) -> None:
         """Test plan reverse."""
         vpc = Stack(definition=generate_definition("vpc", 1), context=self.context)
@@ -248,7 +346,8 @@ class TestPlan(unittest.TestCase):
         self.assertIn("namespace-vpc.1", calls)
         self.assertIn("namespace-bastion.1", calls)
         self.assertIn("namespace-removed.1", calls)
-        context.put_persistent_graph.assert_called()
+        # updates are coalesced into a single write
+        context.put_persistent_graph.assert_called_once_with(plan.lock_code)
 
         # order is different between python2/3 so can't compare dicts
         result_graph_dict = context.persistent_graph.to_dict()  # type: ignore
@@ -257,6 +356,71 @@ class TestPlan(unittest.TestCase):
         self.assertEqual({"vpc.1"}, result_graph_dict.get("bastion.1"))
         self.assertIsNone(result_graph_dict.get("namespace-removed.1"))
 
+        self.assertEqual(
+            {"vpc.1", "bastion.1"}, set(context.stack_durations["_launch_stack"])
+        )
+        self.assertEqual({"removed.1"}, set(context.stack_durations["_destroy_stack"]))
+
+    def test_execute_plan_report(self) -> None:
+        """Test execute plan writes a report."""
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        context = CfnginContext(
+            config=CfnginConfig.parse_obj(
+                {"namespace": "namespace", "cfngin_cache_dir": tmp_dir}
+            )
+        )
+        vpc = Stack(definition=generate_definition("vpc", 1), context=context)
+        bastion = Stack(
+            definition=generate_definition("bastion", 1, requires=[vpc.name]),
+            context=context,
+        )
+        other = Stack(definition=generate_definition("other", 1), context=context)
+
+        def _launch_stack(stack: Stack, status: Optional[Status] = None) -> Status:
+            return COMPLETE if status == SUBMITTED else SUBMITTED
+
+        graph = Graph.from_steps(
+            [
+                Step(vpc, fn=_launch_stack),
+                Step(bastion, fn=_launch_stack),
+                Step(other, fn=None),
+            ]
+        )
+        graph.steps["other.1"].complete()
+        plan = Plan(description="Test", graph=graph, context=context)
+        plan.execute(walk)
+
+        self.assertEqual(
+            [step.name for step in plan.critical_path()], ["vpc.1", "bastion.1"]
+        )
+        self.assertEqual(
+            graph.steps["bastion.1"].queued_at, graph.steps["vpc.1"].completed_at
+        )
+
+        report = json.loads(context.run_report_path.read_text())
+        self.assertEqual(report["critical_path"], ["vpc.1", "bastion.1"])
+        steps = {step["name"]: step for step in report["steps"]}
+        self.assertEqual(steps["bastion.1"]["requires"], ["vpc.1"])
+        self.assertEqual(steps["bastion.1"]["poll_count"], 1)
+        self.assertEqual(steps["bastion.1"]["status"], "complete")
+
+        trace = json.loads(
+            context.run_report_path.with_suffix(".trace.json").read_text()
+        )
+        self.assertEqual(
+            {
+                event["args"]["name"]
+                for event in trace["traceEvents"]
+                if event["ph"] == "M"
+            },
+            {"vpc.1", "bastion.1", "other.1"},
+        )
+        self.assertEqual(
+            {event["name"] for event in trace["traceEvents"] if event["ph"] == "X"},
+            {"queued", "run", "wait"},
+        )
+
     def test_execute_plan_no_persist(self) -> None:
         """Test execute plan with no persistent graph."""
         context = CfnginContext(config=self.config)
@@ -0,0 +1,64 @@
+"""Tests for runway.cfngin.session_cache."""
+# pyright: basic
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from runway.cfngin.session_cache import PooledSession, get_session
+
+if TYPE_CHECKING:
+    from pytest import MonkeyPatch
+
+
+def test_get_session() -> None:
+    """Test get_session."""
+    session = get_session(region="us-east-1")
+    assert isinstance(session, PooledSession)
+    assert session.region_name == "us-east-1"
+    assert get_session(region="us-east-1") is session
+    assert get_session(region="us-west-2") is not session
+    assert get_session(region="us-east-1", access_key="foo") is not session
+    provider = session._session.get_component(  # type: ignore
+        "credential_provider"
+    ).get_provider("assume-role")
+    assert provider.cache == {}
+
+
+def test_get_session_credentials() -> None:
+    """Test get_session with different credentials."""
+    session = get_session(access_key="foo", secret_key="bar")
+    assert get_session(access_key="foo", secret_key="bar") is session
+    assert get_session(access_key="foo", secret_key="baz") is not session
+    assert (
+        get_session(access_key="foo", secret_key="bar", session_token="token")
+        is not session
+    )
+
+
+def test_get_session_environment(monkeypatch: MonkeyPatch) -> None:
+    """Test get_session when AWS environment variables change."""
+    session = get_session()
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "changed")
+    assert get_session() is not session
+    monkeypatch.setenv("UNRELATED", "x")
+    other = get_session()
+    monkeypatch.setenv("UNRELATED", "y")
+    assert get_session() is other
+
+
+class TestPooledSession:
+    """Test PooledSession."""
+
+    def test_client(self) -> None:
+        """Test client."""
+        session = get_session(region="us-east-1")
+        client = session.client("s3")
+        assert session.client("s3") is client
+        assert session.client("s3", region_name="us-west-2") is not client
+        assert session.client("s3", endpoint_url="http://localhost") is not client
+        assert session.client("ec2") is not client
+
+    def test_resource(self) -> None:
+        """Test resource."""
+        session = get_session(region="us-east-1")
+        assert session.resource("s3").meta.client is not session.client("s3")
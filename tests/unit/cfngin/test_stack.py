@@ -1,6 +1,8 @@
 """Tests for runway.cfngin.stack."""
 # pyright: basic
+import tempfile
 import unittest
+from pathlib import Path
 from typing import Any
 
 from mock import MagicMock
@@ -9,12 +11,14 @@ from runway.cfngin.lookups.registry import (
     register_lookup_handler,
     unregister_lookup_handler,
 )
+from runway.cfngin import stack as stack_module
 from runway.cfngin.stack import Stack
 from runway.config import CfnginConfig
 from runway.context import CfnginContext
 from runway.lookups.handlers.base import LookupHandler
 
 from .factories import generate_definition
+from .fixtures import mock_blueprints
 
 
 class TestStack(unittest.TestCase):
@@ -118,6 +122,38 @@ class TestStack(unittest.TestCase):
         stack = Stack(definition=definition, context=self.context)
         self.assertEqual(stack.tags, {"environment": "prod", "app": "graph"})
 
+    def test_source_files_class_path(self) -> None:
+        """Test source_files with class_path."""
+        definition = generate_definition(
+            base_name="vpc",
+            stack_id=1,
+            variables={"Policy": "${file plain:file://policy.json}"},
+        )
+        stack = Stack(definition=definition, context=self.context)
+        source_files = stack.source_files
+        self.assertIn(Path(mock_blueprints.__file__).resolve(), source_files)
+        self.assertIn((Path.cwd() / "policy.json").resolve(), source_files)
+        self.assertFalse(
+            [i for i in source_files if Path(stack_module.__file__).parent in i.parents]
+        )
+
+    def test_source_files_template_path(self) -> None:
+        """Test source_files with template_path."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            template = Path(tmp_dir) / "template.yml"
+            template.write_text("Resources: {}")
+            policy = Path(tmp_dir) / "policy.json"
+            policy.write_text("{}")
+            definition = generate_definition(
+                base_name="vpc",
+                stack_id=1,
+                class_path=None,
+                stack_policy_path=str(policy),
+                template_path=str(template),
+            )
+            stack = Stack(definition=definition, context=self.context)
+            self.assertEqual(stack.source_files, {template.resolve(), policy.resolve()})
+
 
 if __name__ == "__main__":
     unittest.main()
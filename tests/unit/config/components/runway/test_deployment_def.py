@@ -1,9 +1,12 @@
 """Test runway.config.components.runway._deployment_dev."""
 # pylint: disable=no-self-use,protected-access
 # pyright: basic
-from typing import Any, Dict, List
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List
 
 import pytest
+from mock import MagicMock
 
 from runway.config.components.runway import (
     RunwayDeploymentDefinition,
@@ -14,6 +17,9 @@ from runway.config.models.runway import (
     RunwayModuleDefinitionModel,
 )
 
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
 
 class TestRunwayDeploymentDefinition:
     """Test runway.config.components.runway._deployment_dev.RunwayDeploymentDefinition."""
@@ -133,6 +139,37 @@ class TestRunwayDeploymentDefinition:
         assert len(result) == 1
         assert result[0]._data.dict(exclude_unset=True) == data[0]
 
+    def test_prefetch(self, mocker: MockerFixture) -> None:
+        """Test prefetch."""
+        mock_prefetch_lookups = mocker.patch(
+            "runway.config.components.runway.base.prefetch_lookups"
+        )
+        context = MagicMock()
+        obj = RunwayDeploymentDefinition.parse_obj(
+            {
+                "name": "test",
+                "modules": [
+                    {"path": "./", "parameters": {"key": "${ssm /module}"}},
+                    {"parallel": [{"path": "./", "env_vars": {"key": "val"}}]},
+                ],
+                "regions": ["us-east-1"],
+            }
+        )
+        assert not obj.prefetch(context)
+        assert mock_prefetch_lookups.call_count == 4
+        assert [
+            sorted(v.name for v in call.args[0])
+            for call in mock_prefetch_lookups.call_args_list
+        ] == [
+            ["test.assume_role", "test.regions"],
+            ["package.parameters", "package.path"],
+            [],
+            ["package.env_vars", "package.path"],
+        ]
+        assert all(
+            call.args[1] is context for call in mock_prefetch_lookups.call_args_list
+        )
+
     def test_register_variable(self) -> None:
         """Test _register_variable."""
         obj = RunwayDeploymentDefinition.parse_obj(
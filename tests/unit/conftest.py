@@ -11,8 +11,10 @@ import pytest
 import yaml
 from mock import MagicMock
 
+from runway.cfngin import session_cache
 from runway.config import RunwayConfig
 from runway.core.components import DeployEnvironment
+from runway.lookups.handlers.base import LOOKUP_CACHE
 
 from .factories import (
     MockCFNginContext,
@@ -73,6 +75,20 @@ def aws_credentials() -> Iterator[None]:
     saved_env.clear()
 
 
+@pytest.fixture(autouse=True)
+def clear_lookup_cache() -> Iterator[None]:
+    """Prevent cached lookup results from being shared between tests."""
+    yield
+    LOOKUP_CACHE.invalidate()
+
+
+@pytest.fixture(autouse=True)
+def clear_session_cache() -> Iterator[None]:
+    """Prevent boto3 sessions from being shared between tests."""
+    yield
+    session_cache.clear_session_cache()
+
+
 @pytest.fixture(scope="package")
 def fixture_dir() -> str:
     """Path to the fixture directory."""
@@ -3,11 +3,9 @@
 # pyright: basic
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Any, Dict
 
-import boto3
 import pytest
-from mock import MagicMock
 
 from runway.context._base import BaseContext
 from runway.context.sys_info import SystemInfo
@@ -30,20 +28,6 @@ TEST_ENV_CREDS = {
 }
 
 
-@pytest.fixture(scope="function")
-def mock_boto3_session(mocker: MockerFixture) -> MagicMock:
-    """Mock boto3.Session."""
-    mock_session = MagicMock(autospec=boto3.Session)
-    mocker.patch(f"{MODULE}.boto3", Session=mock_session)
-    return mock_session
-
-
-@pytest.fixture(scope="function")
-def mock_sso_botocore_session(mocker: MockerFixture) -> MagicMock:
-    """Mock runway.aws_sso_botocore.session.Session."""
-    return mocker.patch(f"{MODULE}.Session")
-
-
 class TestBaseContext:
     """Test runway.context._base.BaseContext."""
 
@@ -92,74 +76,36 @@ class TestBaseContext:
         mocker.patch.object(self.env, "ci", True)
         assert ctx.is_noninteractive
 
+    @pytest.mark.parametrize(
+        "kwargs, expected",
+        [
+            ({}, {"region": None, "profile": None}),
+            ({"region": "us-east-2"}, {"region": "us-east-2", "profile": None}),
+            ({"profile": "something"}, {"region": None, "profile": "something"}),
+        ],
+    )
     def test_get_session(
-        self, mock_boto3_session: MagicMock, mock_sso_botocore_session: MagicMock
+        self, expected: Dict[str, Any], kwargs: Dict[str, Any], mocker: MockerFixture
     ) -> None:
         """Test get_session."""
+        mock_get_session = mocker.patch(f"{MODULE}.get_session")
         ctx = BaseContext(deploy_environment=self.env)
-        assert ctx.get_session() == mock_boto3_session.return_value
-        mock_boto3_session.assert_called_once_with(
-            aws_access_key_id=None,
-            aws_secret_access_key=None,
-            aws_session_token=None,
-            botocore_session=mock_sso_botocore_session.return_value,
-            region_name=None,
-            profile_name=None,
+        assert ctx.get_session(**kwargs) == mock_get_session.return_value
+        mock_get_session.assert_called_once_with(
+            access_key=None, secret_key=None, session_token=None, **expected
         )
-        mock_boto3_session.return_value._session.get_component.assert_called_once_with(
-            "credential_provider"
-        )
-        cred_provider = cast(
-            MagicMock,
-            mock_boto3_session.return_value._session.get_component.return_value,
-        )
-        cred_provider.get_provider.assert_called_once_with("assume-role")
-        provider = cast(MagicMock, cred_provider.get_provider.return_value)
-        assert provider.cache == {}
 
-    def test_get_session_with_creds(
-        self, mock_boto3_session: MagicMock, mock_sso_botocore_session: MagicMock
-    ) -> None:
+    def test_get_session_with_creds(self, mocker: MockerFixture) -> None:
         """Test get_session with credentials."""
+        mock_get_session = mocker.patch(f"{MODULE}.get_session")
         ctx = BaseContext(deploy_environment=self.env)
-        assert ctx.get_session(**TEST_BOTO3_CREDS) == mock_boto3_session.return_value
-        mock_boto3_session.assert_called_once_with(
-            aws_access_key_id=TEST_BOTO3_CREDS["aws_access_key_id"],
-            aws_secret_access_key=TEST_BOTO3_CREDS["aws_secret_access_key"],
-            aws_session_token=TEST_BOTO3_CREDS["aws_session_token"],
-            botocore_session=mock_sso_botocore_session.return_value,
-            region_name=None,
-            profile_name=None,
-        )
-
-    def test_get_session_with_profile(
-        self, mock_boto3_session: MagicMock, mock_sso_botocore_session: MagicMock
-    ) -> None:
-        """Test get_session with profile."""
-        ctx = BaseContext(deploy_environment=self.env)
-        assert ctx.get_session(profile="something") == mock_boto3_session.return_value
-        mock_boto3_session.assert_called_once_with(
-            aws_access_key_id=None,
-            aws_secret_access_key=None,
-            aws_session_token=None,
-            botocore_session=mock_sso_botocore_session.return_value,
-            region_name=None,
-            profile_name="something",
-        )
-
-    def test_get_session_with_region(
-        self, mock_boto3_session: MagicMock, mock_sso_botocore_session: MagicMock
-    ) -> None:
-        """Test get_session with region."""
-        ctx = BaseContext(deploy_environment=self.env)
-        assert ctx.get_session(region="us-east-2") == mock_boto3_session.return_value
-        mock_boto3_session.assert_called_once_with(
-            aws_access_key_id=None,
-            aws_secret_access_key=None,
-            aws_session_token=None,
-            botocore_session=mock_sso_botocore_session.return_value,
-            region_name="us-east-2",
-            profile_name=None,
+        assert ctx.get_session(**TEST_BOTO3_CREDS) == mock_get_session.return_value
+        mock_get_session.assert_called_once_with(
+            region=None,
+            profile=None,
+            access_key=TEST_BOTO3_CREDS["aws_access_key_id"],
+            secret_key=TEST_BOTO3_CREDS["aws_secret_access_key"],
+            session_token=TEST_BOTO3_CREDS["aws_session_token"],
         )
 
     def test_sys_info(self) -> None:
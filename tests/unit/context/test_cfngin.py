@@ -18,6 +18,7 @@ from runway.cfngin.exceptions import (
     PersistentGraphCannotUnlock,
     PersistentGraphLockCodeMissmatch,
     PersistentGraphLocked,
+    PersistentGraphModified,
     PersistentGraphUnlocked,
 )
 from runway.cfngin.plan import Graph, json_serial
@@ -330,7 +331,10 @@ class TestCFNginContext:  # pylint: disable=too-many-public-methods
 
         stubber.add_response(
             "get_object",
-            {"Body": gen_s3_object_content(self.persist_graph_raw)},
+            {
+                "Body": gen_s3_object_content(self.persist_graph_raw),
+                "ETag": '"etag"',
+            },
             {
                 "ResponseContentType": "application/json",
                 **obj.persistent_graph_location,
@@ -340,6 +344,7 @@ class TestCFNginContext:  # pylint: disable=too-many-public-methods
         with stubber:
             assert isinstance(obj.persistent_graph, Graph)
             assert obj.persistent_graph.to_dict() == self.persist_graph_raw
+        assert obj._persistent_graph_etag == '"etag"'
 
     def test_persistent_graph_location_add_json(self) -> None:
         """Test persistent_graph_location adds `.json` extension."""
@@ -531,6 +536,85 @@ class TestCFNginContext:  # pylint: disable=too-many-public-methods
         with stubber:
             assert not obj.put_persistent_graph("123")
 
+    def test_put_persistent_graph_if_match(self, mocker: MockerFixture) -> None:
+        """Test put_persistent_graph only replaces the known version."""
+        mocker.patch.object(
+            CfnginContext,
+            "persistent_graph_location",
+            {"Bucket": "test-bucket", "Key": "something.json"},
+        )
+        mocker.patch.object(CfnginContext, "persistent_graph_locked", True)
+        mocker.patch.object(CfnginContext, "persistent_graph_lock_code", "123")
+        obj = CfnginContext()
+        obj.persistent_graph = Graph.from_dict(self.persist_graph_raw, context=obj)
+        obj._persistent_graph_etag = '"etag0"'
+        stubber = Stubber(obj.s3_client)
+        expected_params = {
+            "Body": json.dumps(
+                self.persist_graph_raw, default=json_serial, indent=4
+            ).encode(),
+            "ServerSideEncryption": "AES256",
+            "ACL": "bucket-owner-full-control",
+            "ContentType": "application/json",
+            "Tagging": "cfngin_lock_code=123",
+            **obj.persistent_graph_location,
+        }
+        stubber.add_response(
+            "put_object",
+            {"ETag": '"etag1"'},
+            {**expected_params, "IfMatch": '"etag0"'},
+        )
+        stubber.add_client_error(
+            "put_object",
+            "PreconditionFailed",
+            http_status_code=412,
+            expected_params={**expected_params, "IfMatch": '"etag1"'},
+        )
+        with stubber:
+            assert not obj.put_persistent_graph("123")
+            assert obj._persistent_graph_etag == '"etag1"'
+            with pytest.raises(PersistentGraphModified):
+                obj.put_persistent_graph("123")
+        stubber.assert_no_pending_responses()
+
+    def test_put_persistent_graph_if_match_unsupported(
+        self, mocker: MockerFixture
+    ) -> None:
+        """Test put_persistent_graph without support for IfMatch."""
+        mocker.patch.object(
+            CfnginContext,
+            "persistent_graph_location",
+            {"Bucket": "test-bucket", "Key": "something.json"},
+        )
+        mocker.patch.object(CfnginContext, "persistent_graph_locked", True)
+        mocker.patch.object(CfnginContext, "persistent_graph_lock_code", "123")
+        mocker.patch.object(CfnginContext, "_supports_if_match", False)
+        obj = CfnginContext()
+        obj.persistent_graph = Graph.from_dict(self.persist_graph_raw, context=obj)
+        obj._persistent_graph_etag = '"etag0"'
+        stubber = Stubber(obj.s3_client)
+        stubber.add_response(
+            "put_object",
+            {"ETag": '"etag1"'},
+            {
+                "Body": json.dumps(
+                    self.persist_graph_raw, default=json_serial, indent=4
+                ).encode(),
+                "ServerSideEncryption": "AES256",
+                "ACL": "bucket-owner-full-control",
+                "ContentType": "application/json",
+                "Tagging": "cfngin_lock_code=123",
+                **obj.persistent_graph_location,
+            },
+        )
+        with stubber:
+            assert not obj.put_persistent_graph("123")
+        stubber.assert_no_pending_responses()
+
+    def test_supports_if_match(self) -> None:
+        """Test _supports_if_match."""
+        assert CfnginContext()._supports_if_match is True
+
     def test_s3_bucket_verified_no_bucket(self, mocker: MockerFixture) -> None:
         """Test s3_bucket_verified no bucket."""
         mocker.patch.object(CfnginContext, "bucket_name", None)
@@ -582,6 +666,89 @@ class TestCFNginContext:  # pylint: disable=too-many-public-methods
         obj.set_hook_data("test", {"key": "val"})
         assert obj.hook_data == {"test": {"key": "val"}}
 
+    def test_stack_durations(self, tmp_path: Path) -> None:
+        """Test stack_durations & put_stack_durations."""
+        config = CfnginConfig.parse_obj(
+            {"namespace": "test", "cfngin_cache_dir": str(tmp_path)}
+        )
+        obj = CfnginContext(config=config)
+        assert obj.stack_durations == {}
+        assert obj.stack_durations_path == tmp_path / "stack_durations" / "test.json"
+        obj.put_stack_durations()
+        assert not obj.stack_durations_path.exists()
+        obj.stack_durations["_launch_stack"] = {"stack1": 1.5}
+        obj.put_stack_durations()
+        assert CfnginContext(config=config).stack_durations == {
+            "_launch_stack": {"stack1": 1.5}
+        }
+
+    def test_stack_durations_invalid(self, tmp_path: Path) -> None:
+        """Test stack_durations with an invalid file."""
+        config = CfnginConfig.parse_obj(
+            {"namespace": "test", "cfngin_cache_dir": str(tmp_path)}
+        )
+        obj = CfnginContext(config=config)
+        obj.stack_durations_path.parent.mkdir()
+        obj.stack_durations_path.write_text("invalid")
+        assert obj.stack_durations == {}
+
+    def test_stack_fingerprints_location(self) -> None:
+        """Test stack_fingerprints_location."""
+        obj = CfnginContext(config=self.persist_graph_config)
+        assert obj.stack_fingerprints_location == {
+            "Bucket": "cfngin-test",
+            "Key": "persistent_graphs/test/test.fingerprints.json",
+        }
+        assert CfnginContext(config=self.config).stack_fingerprints_location == {}
+
+    def test_stack_fingerprints(self, mocker: MockerFixture) -> None:
+        """Test stack_fingerprints & put_stack_fingerprints."""
+        location = {"Bucket": "test-bucket", "Key": "something.fingerprints.json"}
+        mocker.patch.object(CfnginContext, "stack_fingerprints_location", location)
+        data = {"stack1": {"fingerprint": "abc", "last_updated": "now"}}
+        obj = CfnginContext()
+        stubber = Stubber(obj.s3_client)
+        stubber.add_response(
+            "get_object", {"Body": gen_s3_object_content(data)}, location
+        )
+        data["stack2"] = {"fingerprint": "def", "last_updated": "now"}
+        stubber.add_response(
+            "put_object",
+            {},
+            {
+                "Body": json.dumps(data, indent=4).encode(),
+                "ServerSideEncryption": "AES256",
+                "ACL": "bucket-owner-full-control",
+                "ContentType": "application/json",
+                **location,
+            },
+        )
+
+        with stubber:
+            assert obj.stack_fingerprints == {"stack1": data["stack1"]}
+            obj.stack_fingerprints["stack2"] = data["stack2"]
+            obj.put_stack_fingerprints()
+        stubber.assert_no_pending_responses()
+
+    def test_stack_fingerprints_no_location(self) -> None:
+        """Test stack_fingerprints without a location."""
+        obj = CfnginContext(config=self.config)
+        assert obj.stack_fingerprints == {}
+        assert not obj.put_stack_fingerprints()
+
+    def test_stack_fingerprints_no_such_key(self, mocker: MockerFixture) -> None:
+        """Test stack_fingerprints NoSuchKey."""
+        mocker.patch.object(
+            CfnginContext,
+            "stack_fingerprints_location",
+            {"Bucket": "test-bucket", "Key": "something.fingerprints.json"},
+        )
+        obj = CfnginContext()
+        stubber = Stubber(obj.s3_client)
+        stubber.add_client_error("get_object", "NoSuchKey")
+        with stubber:
+            assert obj.stack_fingerprints == {}
+
     def test_stacks_dict(self) -> None:
         """Test stacks_dict."""
         obj = CfnginContext(config=self.config)
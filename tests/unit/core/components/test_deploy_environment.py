@@ -9,7 +9,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Dict, List
 
 import pytest
-from git.exc import InvalidGitRepositoryError
+from git.exc import GitCommandError, InvalidGitRepositoryError
 from mock import MagicMock
 
 from runway.core.components import DeployEnvironment
@@ -142,6 +142,42 @@ class TestDeployEnvironment:
         assert excinfo.value.code == 1
         assert "Unable to retrieve the current git branch name!" in caplog.messages
 
+    def test_changed_since(self, mocker: MockerFixture, tmp_path: Path) -> None:
+        """Test changed_since."""
+        mock_git = mocker.patch(f"{MODULE}.git")
+        mock_repo = MagicMock(
+            untracked_files=["new.txt"], working_tree_dir=str(tmp_path)
+        )
+        mock_repo.git.diff.return_value = "mod/main.tf\nrunway.yml\n"
+        mock_git.Repo.return_value = mock_repo
+        obj = DeployEnvironment(root_dir=tmp_path)
+        assert not obj.changed_since
+        assert obj.changed_files is None
+
+        obj.changed_since = "main"
+        assert obj.changed_since == "main"
+        assert obj.changed_files == {
+            tmp_path / "mod" / "main.tf",
+            tmp_path / "runway.yml",
+            tmp_path / "new.txt",
+        }
+        mock_repo.git.diff.assert_called_once_with("--name-only", "main")
+
+        obj.changed_since = None
+        assert obj.changed_files is None
+
+    def test_changed_since_invalid_ref(
+        self, caplog: LogCaptureFixture, mocker: MockerFixture, tmp_path: Path
+    ) -> None:
+        """Test changed_since invalid ref."""
+        caplog.set_level(logging.ERROR, logger="runway")
+        mock_git = mocker.patch(f"{MODULE}.git")
+        mock_git.Repo.return_value.git.diff.side_effect = GitCommandError("diff")
+        obj = DeployEnvironment(root_dir=tmp_path)
+        with pytest.raises(SystemExit):
+            obj.changed_since = "invalid"
+        assert "unable to determine files changed since invalid" in caplog.text
+
     def test_ci(self) -> None:
         """Test ci."""
         obj = DeployEnvironment(environ={})
@@ -309,6 +345,8 @@ class TestDeployEnvironment:
         assert obj_copy.name_derived_from == obj.name_derived_from
         assert obj_copy.root_dir == obj.root_dir
         assert obj_copy.vars == obj.vars
+        assert obj_copy.changed_since == obj.changed_since
+        assert obj_copy.changed_files == obj.changed_files
 
     @pytest.mark.parametrize(
         "derived_from, expected",
@@ -14,7 +14,7 @@ from runway.config.components.runway import (
     RunwayVariablesDefinition,
 )
 from runway.config.models.runway import RunwayFutureDefinitionModel
-from runway.core.components import Deployment
+from runway.core.components import Deployment, Module
 from runway.exceptions import UnresolvedVariable
 from runway.variables import Variable
 
@@ -219,6 +219,7 @@ class TestDeployment:
         mock_futures.ProcessPoolExecutor.return_value = executor
         mocker.patch.object(Deployment, "use_async", True)
         mock_mp_context = mocker.patch("multiprocessing.get_context")
+        mock_invalidate = mocker.patch.object(Module, "invalidate_lookup_cache")
 
         obj = Deployment(
             context=runway_context,
@@ -238,6 +239,7 @@ class TestDeployment:
             [call(obj.run, "deploy", "us-east-1"), call(obj.run, "deploy", "us-west-2")]
         )
         assert executor.submit.return_value.result.call_count == 2
+        mock_invalidate.assert_called_once_with()
 
     def test_deploy_sync(
         self,
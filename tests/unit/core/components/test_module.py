@@ -10,8 +10,9 @@ import pytest
 import yaml
 from mock import MagicMock, call
 
-from runway.core.components import Deployment, Module
+from runway.core.components import Deployment, Module, RunwayModuleType
 from runway.core.components._module import validate_environment
+from runway.lookups.handlers.base import LOOKUP_CACHE
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -47,6 +48,78 @@ class TestModule:
         mock_def.resolve.assert_called_once_with(mock_ctx.copy(), variables=mock_vars)
         assert mod.name == "module-name"
 
+    @pytest.mark.parametrize(
+        "changed_files, source, expected",
+        [
+            (None, "local", True),
+            ([], "git", True),
+            ([], "local", False),
+            (["other/file.txt"], "local", False),
+            (["sampleapp.cfn/stack.yml"], "local", True),
+            (["sampleapp.cfn"], "local", True),
+            (["runway.yml"], "local", True),
+            (["other/runway.yml"], "local", False),
+        ],
+    )
+    def test_changed(
+        self,
+        changed_files: Optional[List[str]],
+        expected: bool,
+        fx_deployments: YamlLoaderDeployment,
+        mocker: MockerFixture,
+        runway_context: MockRunwayContext,
+        source: str,
+        tmp_path: Path,
+    ) -> None:
+        """Test changed."""
+        mocker.patch.object(
+            Module,
+            "path",
+            MagicMock(module_root=tmp_path / "sampleapp.cfn", source=source),
+        )
+        mocker.patch.object(
+            Module,
+            "type",
+            MagicMock(class_path="runway.module.cdk.CloudDevelopmentKit"),
+        )
+        runway_context.env.root_dir = tmp_path
+        runway_context.env.changed_files = (
+            None
+            if changed_files is None
+            else frozenset(tmp_path / i for i in changed_files)
+        )
+        mod = Module(
+            context=runway_context,
+            definition=fx_deployments.load("min_required").modules[0],
+        )
+        assert mod.changed is expected
+
+    def test_changed_cloudformation(
+        self,
+        fx_deployments: YamlLoaderDeployment,
+        mocker: MockerFixture,
+        runway_context: MockRunwayContext,
+        tmp_path: Path,
+    ) -> None:
+        """Test changed always True for CloudFormation modules."""
+        mocker.patch.object(
+            Module,
+            "path",
+            MagicMock(module_root=tmp_path / "sampleapp.cfn", source="local"),
+        )
+        mocker.patch.object(
+            Module,
+            "type",
+            MagicMock(class_path=RunwayModuleType.TYPE_MAP["cloudformation"]),
+        )
+        runway_context.env.root_dir = tmp_path
+        runway_context.env.changed_files = frozenset([tmp_path / "shared/blueprint.py"])
+        mod = Module(
+            context=runway_context,
+            definition=fx_deployments.load("min_required").modules[0],
+        )
+        assert mod.changed
+
     def test_child_modules(
         self, fx_deployments: YamlLoaderDeployment, runway_context: MockRunwayContext
     ) -> None:
@@ -346,6 +419,7 @@ class TestModule:
         mock_futures.ProcessPoolExecutor.return_value = executor
         mocker.patch.object(Module, "use_async", True)
         mock_mp_context = mocker.patch("multiprocessing.get_context")
+        mock_invalidate = mocker.patch.object(Module, "invalidate_lookup_cache")
 
         obj = Module(
             context=runway_context,
@@ -368,6 +442,7 @@ class TestModule:
             ]
         )
         assert executor.submit.return_value.result.call_count == 2
+        mock_invalidate.assert_called_once_with()
 
     def test_deploy_sync(
         self,
@@ -546,6 +621,7 @@ class TestModule:
         mocker.patch.object(Module, "should_skip", True)
         mocker.patch.object(Module, "path", MagicMock(module_root=tmp_path))
         mocker.patch.object(Module, "type", mock_type)
+        mock_invalidate = mocker.patch.object(Module, "invalidate_lookup_cache")
 
         mod = Module(
             context=runway_context,
@@ -555,18 +631,39 @@ class TestModule:
         mock_change_dir.assert_not_called()
 
         mocker.patch.object(Module, "should_skip", False)
+        mocker.patch.object(Module, "changed", False)
+        assert not mod.run("deploy")
+        mock_change_dir.assert_not_called()
+
+        mocker.patch.object(Module, "changed", True)
         assert not mod.run("deploy")
         mock_change_dir.assert_called_once_with(tmp_path)
         mock_type.module_class.assert_called_once_with(
             mod.ctx, module_root=tmp_path, **mod.payload
         )
         mock_inst["deploy"].assert_called_once_with()
+        mock_invalidate.assert_called_once_with()
+
+        mock_inst["deploy"].side_effect = ValueError
+        with pytest.raises(ValueError):
+            mod.run("deploy")
+        assert mock_invalidate.call_count == 2
 
         del mock_inst.deploy
         with pytest.raises(SystemExit) as excinfo:
             assert mod.run("deploy")
         assert excinfo.value.code == 1
 
+    def test_invalidate_lookup_cache(self) -> None:
+        """Test invalidate_lookup_cache."""
+        LOOKUP_CACHE.set("cfn", "val", ttl=60, tags={"stack", "cfn"})
+        LOOKUP_CACHE.set("ssm", "val", ttl=60, tags={"/param", "ssm"})
+        LOOKUP_CACHE.set("ecr", "val", ttl=60, tags={"ecr"})
+        assert not Module.invalidate_lookup_cache()
+        assert LOOKUP_CACHE.get("cfn", lambda: "new", ttl=60) == "new"
+        assert LOOKUP_CACHE.get("ssm", lambda: "new", ttl=60) == "new"
+        assert LOOKUP_CACHE.get("ecr", lambda: "new", ttl=60) == "val"
+
     def test_run_list(
         self,
         fx_deployments: YamlLoaderDeployment,
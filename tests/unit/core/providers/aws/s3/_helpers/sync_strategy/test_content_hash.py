@@ -0,0 +1,172 @@
+"""Test runway.core.providers.aws.s3._helpers.sync_strategy.content_hash."""
+# pylint: disable=no-self-use
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from typing import TYPE_CHECKING
+
+import pytest
+
+from runway.core.providers.aws.s3._helpers.file_generator import FileStats
+from runway.core.providers.aws.s3._helpers.parameters import ParametersDataModel
+from runway.core.providers.aws.s3._helpers.sync_strategy.content_hash import (
+    MIB,
+    ContentHashSync,
+    DigestManifest,
+    calculate_etag,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+MODULE = "runway.core.providers.aws.s3._helpers.sync_strategy.content_hash"
+
+
+def test_calculate_etag(tmp_path: Path) -> None:
+    """Test calculate_etag."""
+    content = os.urandom(5 * MIB + 10)
+    tmp_file = tmp_path / "test.txt"
+    tmp_file.write_bytes(content)
+    assert calculate_etag(str(tmp_file)) == hashlib.md5(content).hexdigest()
+    parts = (
+        hashlib.md5(content[: 5 * MIB]).digest()
+        + hashlib.md5(content[5 * MIB :]).digest()
+    )
+    assert (
+        calculate_etag(str(tmp_file), 5 * MIB) == f"{hashlib.md5(parts).hexdigest()}-2"
+    )
+
+
+class TestDigestManifest:
+    """Test DigestManifest."""
+
+    def test_get_etag(self, mocker: MockerFixture, tmp_path: Path) -> None:
+        """Test get_etag."""
+        mock_calculate_etag = mocker.patch(
+            f"{MODULE}.calculate_etag", side_effect=["etag0", "etag1", "etag2"]
+        )
+        tmp_file = tmp_path / "test.txt"
+        tmp_file.write_text("test")
+        manifest = DigestManifest()
+        assert manifest.get_etag(str(tmp_file)) == "etag0"
+        assert manifest.get_etag(str(tmp_file)) == "etag0"
+        assert manifest.get_etag(str(tmp_file), 5 * MIB) == "etag1"
+        stat = tmp_file.stat()
+        os.utime(tmp_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        assert manifest.get_etag(str(tmp_file)) == "etag2"
+        assert mock_calculate_etag.call_count == 3
+
+    def test_save(self, mocker: MockerFixture, tmp_path: Path) -> None:
+        """Test save and load."""
+        mock_calculate_etag = mocker.patch(
+            f"{MODULE}.calculate_etag", return_value="etag"
+        )
+        manifest_path = tmp_path / "cache" / "manifest.json"
+        files = [tmp_path / "test0.txt", tmp_path / "test1.txt"]
+        for tmp_file in files:
+            tmp_file.write_text(tmp_file.name)
+
+        manifest = DigestManifest(manifest_path)
+        for tmp_file in files:
+            manifest.get_etag(str(tmp_file))
+        manifest.save()
+        assert sorted(json.loads(manifest_path.read_text())["files"]) == [
+            str(tmp_file) for tmp_file in files
+        ]
+
+        # only files that were used are retained
+        manifest = DigestManifest(manifest_path)
+        assert manifest.get_etag(str(files[0])) == "etag"
+        manifest.save()
+        assert list(json.loads(manifest_path.read_text())["files"]) == [str(files[0])]
+        assert mock_calculate_etag.call_count == 2
+
+    def test_load_invalid(self, tmp_path: Path) -> None:
+        """Test loading an invalid manifest."""
+        manifest_path = tmp_path / "manifest.json"
+        manifest_path.write_text("invalid")
+        tmp_file = tmp_path / "test.txt"
+        tmp_file.write_text("test")
+        manifest = DigestManifest(manifest_path)
+        assert manifest.get_etag(str(tmp_file)) == hashlib.md5(b"test").hexdigest()
+
+
+class TestContentHashSync:
+    """Test ContentHashSync."""
+
+    @pytest.mark.parametrize(
+        "content, etag, expected",
+        [
+            (b"test", hashlib.md5(b"test").hexdigest(), False),
+            (b"tset", hashlib.md5(b"test").hexdigest(), True),
+            (b"test", "", False),
+            (b"tests", hashlib.md5(b"test").hexdigest(), True),
+        ],
+    )
+    def test_determine_should_sync(
+        self, content: bytes, etag: str, expected: bool, tmp_path: Path
+    ) -> None:
+        """Test determine_should_sync."""
+        tmp_file = tmp_path / "test.txt"
+        tmp_file.write_bytes(content)
+        src_file = FileStats(
+            src=str(tmp_file),
+            last_update=FileStats.last_update.replace(year=2020),
+            operation_name="upload",
+            size=len(content),
+            src_type="local",
+        )
+        dest_file = FileStats(
+            src="bucket/test.txt",
+            response_data={"ETag": f'"{etag}"'} if etag else {},  # type: ignore
+            size=4,
+            src_type="s3",
+        )
+        # without an ETag, the modified times differing causes it to sync
+        assert ContentHashSync().determine_should_sync(src_file, dest_file) is (
+            expected or not etag
+        )
+        # download
+        assert ContentHashSync().determine_should_sync(
+            FileStats(
+                src=dest_file.src,
+                operation_name="download",
+                response_data=dest_file.response_data,
+                size=dest_file.size,
+                src_type="s3",
+            ),
+            FileStats(
+                src=src_file.src,
+                last_update=src_file.last_update,
+                size=src_file.size,
+                src_type="local",
+            ),
+        ) is (expected or not etag)
+
+    def test_compare_etag_multipart(self, tmp_path: Path) -> None:
+        """Test compare_etag with the ETag of a multipart upload."""
+        tmp_file = tmp_path / "test.txt"
+        tmp_file.write_bytes(os.urandom(5 * MIB + 10))
+        local_file = FileStats(src=str(tmp_file), size=5 * MIB + 10)
+        strategy = ContentHashSync()
+        assert strategy.compare_etag(local_file, calculate_etag(str(tmp_file), 5 * MIB))
+        assert not strategy.compare_etag(local_file, "0" * 32 + "-2")
+        assert not strategy.compare_etag(local_file, "0" * 32 + "-3")
+
+    def test_name(self) -> None:
+        """Test name."""
+        assert ContentHashSync().name == "content_hash"
+
+    def test_use_sync_strategy(self, tmp_path: Path) -> None:
+        """Test use_sync_strategy."""
+        strategy = ContentHashSync()
+        params = ParametersDataModel(dest="", src="")
+        assert not strategy.use_sync_strategy(params)
+        params.content_hash = True
+        params.content_hash_manifest = tmp_path / "manifest.json"
+        assert strategy.use_sync_strategy(params) is strategy
+        assert strategy.manifest.path == params.content_hash_manifest
@@ -140,10 +140,11 @@ class TestActionArchitecture:
         self.parameters.exclude = ["something"]
         files = {"type": "files"}
         rev_files = {"type": "rev_files"}
+        mock_sync_strategy = Mock()
         mocker.patch.object(
             ActionArchitecture,
             "choose_sync_strategies",
-            return_value={"sync_strategy": "test"},
+            return_value={"sync_strategy": mock_sync_strategy},
         )
         mocker.patch(
             f"{MODULE}.FormatPath", format=Mock(side_effect=[files, rev_files])
@@ -201,6 +202,7 @@ class TestActionArchitecture:
         mock_s3_transfer_handler.call.assert_called_once_with(
             mock_file_info_builder.call.return_value
         )
+        mock_sync_strategy.close.assert_called_once_with()
 
     def test_run_not_implimented(self, mocker: MockerFixture) -> None:
         """Test run NotImplimented."""
@@ -7,7 +7,7 @@ import os
 import platform
 import stat
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import pytest
 from botocore.exceptions import ClientError
@@ -212,6 +212,71 @@ class TestFileGenerator:
         assert len(result) == 1
         assert result[0] == (loc_files["local_file"], {"Size": 15, "LastModified": NOW})
 
+    @pytest.mark.parametrize("list_concurrency", [1, 3])
+    def test_list_files_order(self, list_concurrency: int, tmp_path: Path) -> None:
+        """Test list_files yields files in the same order as S3."""
+        keys = [
+            "a.txt",
+            "a/0.txt",
+            "a/b/0.txt",
+            "a/b/c/0.txt",
+            "a/c.txt",
+            "a0.txt",
+            "b/0.txt",
+            "c/d/e/0.txt",
+        ]
+        for key in reversed(keys):
+            (tmp_path / key).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / key).write_text(key)
+        (tmp_path / "empty").mkdir()
+        obj = FileGenerator(self.client, "", list_concurrency=list_concurrency)
+        result = list(obj.list_files(tmp_path, True))
+        assert [i[0] for i in result] == [tmp_path / key for key in keys]
+        assert [i[1]["Size"] for i in result] == [len(key) for key in keys]
+        assert obj.result_queue.empty()
+
+    @pytest.mark.skipif(
+        platform.system() == "Windows", reason="symlinks require admin on Windows"
+    )
+    @pytest.mark.parametrize("follow_symlinks", [False, True])
+    def test_list_files_symlink(self, follow_symlinks: bool, tmp_path: Path) -> None:
+        """Test list_files with a symlink to a directory."""
+        target = tmp_path / "target"
+        (target / "dir").mkdir(parents=True)
+        (target / "dir" / "test.txt").write_text("test")
+        src = tmp_path / "src"
+        src.mkdir()
+        (src / "dir").symlink_to(target / "dir", target_is_directory=True)
+        obj = FileGenerator(
+            self.client, "", follow_symlinks=follow_symlinks, list_concurrency=2
+        )
+        result = [i[0] for i in obj.list_files(src, True)]
+        assert result == ([src / "dir" / "test.txt"] if follow_symlinks else [])
+
+    @pytest.mark.parametrize("list_concurrency", [1, 2])
+    def test_list_files_unreadable_directory(
+        self, list_concurrency: int, mocker: MockerFixture, tmp_path: Path
+    ) -> None:
+        """Test list_files skips a directory that can't be read."""
+        (tmp_path / "bad").mkdir()
+        (tmp_path / "bad" / "test.txt").write_text("test")
+        (tmp_path / "good.txt").write_text("test")
+        scan_directory = FileGenerator.scan_directory
+
+        def mock_scan_directory(self: FileGenerator, path: Path) -> Any:
+            if path.name == "bad":
+                raise PermissionError
+            return scan_directory(self, path)
+
+        mocker.patch.object(FileGenerator, "scan_directory", mock_scan_directory)
+        mocker.patch.object(FileGenerator, "should_ignore_file", return_value=False)
+        mock_triggers_warning = mocker.patch.object(
+            FileGenerator, "triggers_warning", return_value=True
+        )
+        obj = FileGenerator(self.client, "", list_concurrency=list_concurrency)
+        assert [i[0] for i in obj.list_files(tmp_path, True)] == [tmp_path / "good.txt"]
+        mock_triggers_warning.assert_called_once_with(tmp_path / "bad")
+
     def test_list_objects(self, mocker: MockerFixture) -> None:
         """Test list_objects."""
         mock_list_objects = Mock(
@@ -233,6 +298,21 @@ class TestFileGenerator:
         )
         assert result == [mock_list_objects.return_value[0]]
 
+    def test_list_objects_concurrent(self, mocker: MockerFixture) -> None:
+        """Test list_objects with list_concurrency."""
+        mock_list_objects = Mock(return_value=[("bucket/key.txt", {"Size": 13})])
+        mock_class = mocker.patch(
+            f"{MODULE}.ShardedBucketLister",
+            return_value=Mock(list_objects=mock_list_objects),
+        )
+        obj = FileGenerator(self.client, "", list_concurrency=4)
+        result = list(obj.list_objects("bucket/", dir_op=True))
+        mock_class.assert_called_once_with(self.client, max_workers=4)
+        mock_list_objects.assert_called_once_with(
+            bucket="bucket", prefix="", page_size=None, extra_args={}
+        )
+        assert result == mock_list_objects.return_value
+
     def test_list_objects_delete(self, mocker: MockerFixture) -> None:
         """Test list_objects."""
         mock_list_objects = Mock(
@@ -344,6 +424,21 @@ class TestFileGenerator:
         )
         mock_get_file_stat.assert_called_once_with(tmp_path)
 
+    def test_safely_get_file_stats_entry(
+        self, mocker: MockerFixture, tmp_path: Path
+    ) -> None:
+        """Test safely_get_file_stats with a directory entry."""
+        mock_get_file_stat = mocker.patch(
+            f"{MODULE}.get_file_stat", return_value=(15, NOW)
+        )
+        entry = Mock(stat=Mock(return_value="stat"))
+        obj = FileGenerator(self.client, "")
+        assert obj.safely_get_file_stats(tmp_path, entry) == (
+            tmp_path,
+            {"Size": 15, "LastModified": NOW},
+        )
+        mock_get_file_stat.assert_called_once_with(tmp_path, "stat")
+
     def test_safely_get_file_stats_handle_os_error(
         self, mocker: MockerFixture, tmp_path: Path
     ) -> None:
@@ -15,7 +15,6 @@ from runway.core.providers.aws.s3._helpers.parameters import ParametersDataModel
 from runway.core.providers.aws.s3._helpers.results import (
     CommandResultRecorder,
     CopyResultSubscriber,
-    DeleteResultSubscriber,
     DownloadResultSubscriber,
     DownloadStreamResultSubscriber,
     DryRunResult,
@@ -394,19 +393,70 @@ class TestDeleteRequestSubmitter(BaseTransferRequestSubmitterTest):
         fileinfo = FileInfo(
             src=self.bucket + "/" + self.key, dest=None, operation_name="delete"
         )
-        future = self.transfer_request_submitter.submit(fileinfo)
-        assert self.transfer_manager.delete.return_value is future
+        assert self.transfer_request_submitter.submit(fileinfo)
+        self.transfer_manager.delete.assert_not_called()
+        self.transfer_manager.client.delete_objects.assert_not_called()
+        assert self.result_queue.get() == QueuedResult(
+            transfer_type="delete",
+            src="s3://" + self.bucket + "/" + self.key,
+            dest=None,
+            total_transfer_size=0,
+        )
 
-        call_kwargs = cast(Dict[str, Any], self.transfer_manager.delete.call_args[1])
-        assert call_kwargs["bucket"] == self.bucket
-        assert call_kwargs["key"] == self.key
-        assert call_kwargs["extra_args"] == {}
+        self.transfer_manager.client.delete_objects.return_value = {}
+        self.transfer_request_submitter.flush()
+        self.transfer_manager.client.delete_objects.assert_called_once_with(
+            Bucket=self.bucket,
+            Delete={"Objects": [{"Key": self.key}], "Quiet": True},
+        )
+        assert self.result_queue.get() == SuccessResult(
+            transfer_type="delete", src="s3://" + self.bucket + "/" + self.key
+        )
+        assert self.result_queue.empty()
 
-        ref_subscribers = [DeleteResultSubscriber]
-        actual_subscribers = call_kwargs["subscribers"]
-        assert len(ref_subscribers) == len(actual_subscribers)
-        for i, actual_subscriber in enumerate(actual_subscribers):
-            assert isinstance(actual_subscriber, ref_subscribers[i])
+    def test_submit_batches(self) -> None:
+        """Test submit deletes keys in batches."""
+        self.transfer_manager.client.delete_objects.return_value = {
+            "Errors": [{"Key": "key-1", "Code": "AccessDenied", "Message": "denied"}]
+        }
+        for index in range(DeleteRequestSubmitter.MAX_BATCH_SIZE + 1):
+            self.transfer_request_submitter.submit(
+                FileInfo(
+                    src=f"{self.bucket}/key-{index}", dest=None, operation_name="delete"
+                )
+            )
+        self.transfer_request_submitter.submit(
+            FileInfo(src="other-bucket/key", dest=None, operation_name="delete")
+        )
+        self.transfer_request_submitter.flush()
+
+        calls = self.transfer_manager.client.delete_objects.call_args_list
+        assert sorted(
+            (call.kwargs["Bucket"], len(call.kwargs["Delete"]["Objects"]))
+            for call in calls
+        ) == [("other-bucket", 1), (self.bucket, 1), (self.bucket, 1000)]
+        results = list(self.result_queue.queue)
+        assert len(results) == 2 * (DeleteRequestSubmitter.MAX_BATCH_SIZE + 2)
+        failures = [r for r in results if isinstance(r, FailureResult)]
+        assert len(failures) == 1
+        assert failures[0].src == f"s3://{self.bucket}/key-1"
+        assert "AccessDenied" in str(failures[0].exception)
+
+    def test_flush_request_failure(self) -> None:
+        """Test flush when a DeleteObjects request fails."""
+        exc = Exception("test")
+        self.transfer_manager.client.delete_objects.side_effect = exc
+        fileinfo = FileInfo(
+            src=self.bucket + "/" + self.key, dest=None, operation_name="delete"
+        )
+        self.transfer_request_submitter.submit(fileinfo)
+        self.transfer_request_submitter.flush()
+        assert isinstance(self.result_queue.get(), QueuedResult)
+        assert self.result_queue.get() == FailureResult(
+            exception=exc,
+            transfer_type="delete",
+            src="s3://" + self.bucket + "/" + self.key,
+        )
 
     def test_submit_dry_run(self) -> None:
         """Test submit."""
@@ -807,6 +857,7 @@ class TestS3TransferHandler:
             fileinfos[0]
         )
         mock_submitters.instances["copy"].submit.assert_called_once_with(fileinfos[0])
+        mock_submitters.instances["delete"].flush.assert_called_once_with()
         self.result_command_recorder.notify_total_submissions.assert_called_once_with(1)  # type: ignore  # noqa
         self.result_command_recorder.get_command_result.assert_called_once_with()  # type: ignore
 
@@ -45,6 +45,7 @@ from runway.core.providers.aws.s3._helpers.utils import (
     ProvideUploadContentTypeSubscriber,
     RequestParamsMapper,
     SetFileUtimeError,
+    ShardedBucketLister,
     StdoutBytesWriter,
     _date_parser,
     block_s3_object_lambda,
@@ -168,6 +169,139 @@ class TestBucketLister:
         )
 
 
+class TestShardedBucketLister:
+    """Test ShardedBucketLister."""
+
+    keys: ClassVar[List[str]] = [
+        "a.txt",
+        "a/0.txt",
+        "a/1.txt",
+        "a0.txt",
+        "b/0.txt",
+        "b/c/0.txt",
+        "c/0.txt",
+        "d.txt",
+    ]
+
+    @staticmethod
+    def fake_paginate(keys: List[str], calls: List[Dict[str, Any]]) -> Any:
+        """Create a fake paginate that lists keys like S3."""
+
+        def paginate(**kwargs: Any) -> List[Any]:
+            calls.append(kwargs)
+            prefix = kwargs.get("Prefix", "")
+            delimiter = kwargs.get("Delimiter")
+            contents: List[Dict[str, Any]] = []
+            common_prefixes: List[str] = []
+            for key in keys:
+                if not key.startswith(prefix):
+                    continue
+                if delimiter and delimiter in key[len(prefix) :]:
+                    common_prefix = key[: key.index(delimiter, len(prefix)) + 1]
+                    if common_prefix not in common_prefixes:
+                        common_prefixes.append(common_prefix)
+                    continue
+                contents.append(
+                    {"Key": key, "LastModified": "2014-02-27T04:20:38.000Z"}
+                )
+            # split into pages to ensure results of each page are used
+            return [
+                {"Contents": contents[:1]},
+                {
+                    "CommonPrefixes": [{"Prefix": i} for i in common_prefixes],
+                    "Contents": contents[1:],
+                },
+            ]
+
+        return paginate
+
+    @pytest.mark.parametrize("max_workers", [3, 10])
+    def test_list_objects(self, max_workers: int) -> None:
+        """Test list_objects."""
+        calls: List[Dict[str, Any]] = []
+        client = Mock()
+        client.get_paginator.return_value.paginate = self.fake_paginate(
+            self.keys, calls
+        )
+        lister = ShardedBucketLister(
+            client, Mock(return_value=sentinel.now), max_workers=max_workers
+        )
+        result = list(
+            lister.list_objects(
+                bucket="foo", page_size=5, extra_args={"RequestPayer": "requester"}
+            )
+        )
+        assert [i[0] for i in result] == [f"foo/{key}" for key in self.keys]
+        assert all(i[1]["LastModified"] == sentinel.now for i in result)
+        assert calls[0] == {
+            "Bucket": "foo",
+            "Delimiter": "/",
+            "PaginationConfig": {"PageSize": 5},
+            "RequestPayer": "requester",
+        }
+        assert sorted(calls[1:], key=lambda i: i["Prefix"]) == [
+            {
+                "Bucket": "foo",
+                "PaginationConfig": {"PageSize": 5},
+                "Prefix": prefix,
+                "RequestPayer": "requester",
+            }
+            for prefix in ["a/", "b/", "c/"]
+        ]
+
+    def test_list_objects_single_shard(self) -> None:
+        """Test list_objects with a single common prefix."""
+        calls: List[Dict[str, Any]] = []
+        keys = [f"prefix/{key}" for key in self.keys]
+        client = Mock()
+        client.get_paginator.return_value.paginate = self.fake_paginate(keys, calls)
+        lister = ShardedBucketLister(client, Mock(return_value=sentinel.now))
+        result = list(lister.list_objects(bucket="foo", prefix="p"))
+        assert [i[0] for i in result] == [f"foo/{key}" for key in keys]
+        assert [i.get("Delimiter") for i in calls[:3]] == ["/", "/", None]
+        assert [i["Prefix"] for i in calls[:2]] == ["p", "prefix/"]
+
+    def test_list_objects_no_shards(self) -> None:
+        """Test list_objects without common prefixes."""
+        calls: List[Dict[str, Any]] = []
+        keys = ["a.txt", "b.txt"]
+        client = Mock()
+        client.get_paginator.return_value.paginate = self.fake_paginate(keys, calls)
+        lister = ShardedBucketLister(client, Mock(return_value=sentinel.now))
+        result = list(lister.list_objects(bucket="foo"))
+        assert [i[0] for i in result] == ["foo/a.txt", "foo/b.txt"]
+        assert len(calls) == 1
+
+    def test_list_objects_too_many_shards(self) -> None:
+        """Test list_objects without sharding when too many shards are found."""
+        calls: List[Dict[str, Any]] = []
+        client = Mock()
+        client.get_paginator.return_value.paginate = self.fake_paginate(
+            self.keys, calls
+        )
+        lister = ShardedBucketLister(
+            client, Mock(return_value=sentinel.now), max_workers=2
+        )
+        result = list(lister.list_objects(bucket="foo", page_size=5))
+        assert [i[0] for i in result] == [f"foo/{key}" for key in self.keys]
+        assert calls[1] == {"Bucket": "foo", "PaginationConfig": {"PageSize": 5}}
+        assert len(calls) == 2
+
+    def test_list_objects_too_many_objects(self, mocker: MockerFixture) -> None:
+        """Test list_objects without sharding when too many objects are found."""
+        mocker.patch.object(ShardedBucketLister, "MAX_BUFFERED_OBJECTS", 1)
+        calls: List[Dict[str, Any]] = []
+        client = Mock()
+        client.get_paginator.return_value.paginate = self.fake_paginate(
+            self.keys, calls
+        )
+        lister = ShardedBucketLister(client, Mock(return_value=sentinel.now))
+        result = list(lister.list_objects(bucket="foo", page_size=5))
+        assert [i[0] for i in result] == [f"foo/{key}" for key in self.keys]
+        assert calls[1] == {"Bucket": "foo", "PaginationConfig": {"PageSize": 5}}
+        assert len(calls) == 2
+
+
 class TestDeleteCopySourceObjectSubscriber:
     """Test DeleteCopySourceObjectSubscriber."""
 
@@ -890,6 +1024,18 @@ def test_get_file_stat(tmp_path: Path) -> None:
     assert time.mktime(update_time.timetuple()) == epoch_now  # type: ignore
 
 
+def test_get_file_stat_stats(mocker: MockerFixture, tmp_path: Path) -> None:
+    """Test get_file_stat with the result of a previous stat."""
+    tmp_file = tmp_path / "test.txt"
+    tmp_file.write_text("foo")
+    stats = tmp_file.stat()
+    mock_stat = mocker.patch.object(Path, "stat")
+    size, update_time = get_file_stat(tmp_file, stats)
+    assert size == 3
+    assert update_time == datetime.datetime.fromtimestamp(stats.st_mtime, tzlocal())
+    mock_stat.assert_not_called()
+
+
 @pytest.mark.parametrize("exc", [ValueError(), OSError(), OverflowError()])
 def test_get_file_stat_handle_timestamp_error(
     exc: Exception, mocker: MockerFixture, tmp_path: Path
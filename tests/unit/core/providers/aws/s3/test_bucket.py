@@ -297,6 +297,8 @@ class TestBucket:
             src_directory, delete=True, exclude=["something"], prefix="prefix"
         )
         mock_handler_class.assert_called_once_with(
+            content_hash=False,
+            content_hash_manifest=None,
             context=runway_context,
             delete=True,
             dest="s3://test-bucket/prefix",
@@ -323,6 +325,8 @@ class TestBucket:
             dest_directory, follow_symlinks=True, include=["something"]
         )
         mock_handler_class.assert_called_once_with(
+            content_hash=False,
+            content_hash_manifest=None,
             context=runway_context,
             delete=False,
             dest=dest_directory,
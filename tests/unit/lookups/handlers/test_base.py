@@ -4,16 +4,147 @@
 from __future__ import annotations
 
 import json
-from typing import Dict, Optional
+import threading
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 import pytest
 import yaml
 from mock import MagicMock
 
-from runway.lookups.handlers.base import LookupHandler
+from runway.lookups.handlers.base import LOOKUP_CACHE, LookupCache, LookupHandler
 from runway.utils import MutableMap
 from runway.variables import VariableValue
 
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+MODULE = "runway.lookups.handlers.base"
+
+
+class TestLookupCache:
+    """Tests for LookupCache."""
+
+    def test_get(self) -> None:
+        """Test get."""
+        cache = LookupCache()
+        func = MagicMock(return_value={"key": "value"})
+        assert cache.get("key", func, ttl=60) == {"key": "value"}
+        result = cache.get("key", func, ttl=60)
+        assert result == {"key": "value"}
+        func.assert_called_once_with()
+        result["key"] = "changed"  # results are copied
+        assert cache.get("key", func, ttl=60) == {"key": "value"}
+
+    def test_get_expired(self, mocker: MockerFixture) -> None:
+        """Test get expired result."""
+        mock_time = mocker.patch(f"{MODULE}.time")
+        mock_time.monotonic.return_value = 100.0
+        cache = LookupCache()
+        func = MagicMock(side_effect=["first", "second"])
+        assert cache.get("key", func, ttl=10) == "first"
+        mock_time.monotonic.return_value = 110.0
+        assert cache.get("key", func, ttl=10) == "second"
+
+    def test_get_evict(self) -> None:
+        """Test least recently used results are evicted."""
+        cache = LookupCache(max_size=2)
+        cache.get("a", lambda: "a", ttl=60)
+        cache.get("b", lambda: "b", ttl=60)
+        cache.get("a", lambda: "a", ttl=60)
+        cache.get("c", lambda: "c", ttl=60)
+        func = MagicMock(return_value="new")
+        assert cache.get("a", func, ttl=60) == "a"
+        assert cache.get("c", func, ttl=60) == "c"
+        func.assert_not_called()
+        assert cache.get("b", func, ttl=60) == "new"
+
+    def test_get_exception(self) -> None:
+        """Test exceptions are not cached."""
+        cache = LookupCache()
+        func = MagicMock(side_effect=[ValueError, "value"])
+        with pytest.raises(ValueError):
+            cache.get("key", func, ttl=60)
+        assert cache.get("key", func, ttl=60) == "value"
+
+    def test_get_single_flight(self) -> None:
+        """Test concurrent requests for the same key share one call."""
+        cache = LookupCache()
+        started = threading.Event()
+        release = threading.Event()
+        calls: List[int] = []
+        results: List[Any] = []
+
+        def func() -> str:
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return "value"
+
+        owner = threading.Thread(
+            target=lambda: results.append(cache.get("key", func, ttl=60))
+        )
+        owner.start()
+        assert started.wait(5)
+        waiters = [
+            threading.Thread(
+                target=lambda: results.append(cache.get("key", func, ttl=60))
+            )
+            for _ in range(3)
+        ]
+        for thread in waiters:
+            thread.start()
+        release.set()
+        for thread in [owner, *waiters]:
+            thread.join(5)
+        assert results == ["value"] * 4
+        assert len(calls) == 1
+
+    def test_get_ttl_callable(self) -> None:
+        """Test get with a TTL calculated from the result."""
+        cache = LookupCache()
+        func = MagicMock(side_effect=[0, 60, 0])
+        assert cache.get("a", func, ttl=lambda result: result) == 0
+        assert cache.get("a", func, ttl=lambda result: result) == 60
+        assert cache.get("a", func, ttl=lambda result: result) == 60
+        assert func.call_count == 2
+
+    def test_set(self) -> None:
+        """Test set."""
+        cache = LookupCache(max_size=1)
+        cache.set("a", "a", ttl=60, tags=["tag"])
+        func = MagicMock(return_value="new")
+        assert cache.get("a", func, ttl=60) == "a"
+        func.assert_not_called()
+        cache.invalidate("tag")
+        assert cache.get("a", func, ttl=60) == "new"
+        cache.set("b", "b", ttl=60)
+        assert cache.get("a", func, ttl=60) == "new"
+        assert func.call_count == 2
+
+    def test_invalidate(self) -> None:
+        """Test invalidate."""
+        cache = LookupCache()
+        cache.get("a", lambda: "a", ttl=60, tags=["tag"])
+        cache.get("b", lambda: "b", ttl=60)
+        cache.invalidate("tag")
+        func = MagicMock(side_effect=lambda: "new")
+        assert cache.get("a", func, ttl=60) == "new"
+        assert cache.get("b", func, ttl=60) == "b"
+        cache.invalidate()
+        assert cache.get("b", func, ttl=60) == "new"
+        assert func.call_count == 2
+
+    def test_invalidate_in_flight(self) -> None:
+        """Test results of lookups in flight when invalidated are not stored."""
+        cache = LookupCache()
+
+        def func() -> str:
+            cache.invalidate("tag")
+            return "stale"
+
+        assert cache.get("key", func, ttl=60, tags=["tag"]) == "stale"
+        assert cache.get("key", lambda: "new", ttl=60, tags=["tag"]) == "new"
+
 
 class TestLookupHandler:
     """Tests for LookupHandler."""
@@ -23,6 +154,19 @@ class TestLookupHandler:
         with pytest.raises(NotImplementedError):
             LookupHandler.handle(None, None)  # type: ignore
 
+    def test_cache_key(self) -> None:
+        """Test cache_key."""
+        context = MagicMock()
+        context.env.aws_credentials = {"AWS_ACCESS_KEY_ID": "foo"}
+        assert LookupHandler.cache_key("query", context) == (
+            LookupHandler,
+            "query",
+            context.env.aws_profile,
+            context.env.aws_region,
+            (("AWS_ACCESS_KEY_ID", "foo"),),
+            None,
+        )
+
     def test_dependencies(self) -> None:
         """Test dependencies.
 
@@ -141,6 +285,26 @@ class TestLookupHandler:
         assert result_query == query
         assert result_args == expected_args
 
+    def test_resolve(self, mocker: MockerFixture) -> None:
+        """Test resolve."""
+        context = MagicMock()
+        context.env.aws_credentials = {}
+        mock_handle = mocker.patch.object(
+            LookupHandler, "handle", side_effect=["first", "second", "third"]
+        )
+        assert LookupHandler.resolve("query", context, provider=None) == "first"
+        assert LookupHandler.resolve("query", context, provider=None) == "second"
+        mock_handle.assert_called_with("query", context=context, provider=None)
+
+        mocker.patch.object(LookupHandler, "CACHE_TTL", 60)
+        mocker.patch.object(LookupHandler, "cache_tags", return_value={"tag"})
+        assert LookupHandler.resolve("query", context) == "third"
+        assert LookupHandler.resolve("query", context) == "third"
+        assert mock_handle.call_count == 3
+        LOOKUP_CACHE.invalidate("tag")
+        with pytest.raises(StopIteration):
+            LookupHandler.resolve("query", context)
+
     def test_transform_bool_to_bool(self) -> None:
         """Bool should be returned as is."""
         result_true = LookupHandler.transform(True, to_type="bool")
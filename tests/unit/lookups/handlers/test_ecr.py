@@ -31,6 +31,30 @@ def mock_format_results(mocker: MockerFixture) -> MagicMock:
 class TestEcrLookup:
     """Test runway.lookups.handlers.ecr.EcrLookup."""
 
+    def test_get_authorization_data(self, runway_context: MockRunwayContext) -> None:
+        """Test get_authorization_data."""
+        stubber = runway_context.add_stubber("ecr")
+        now = datetime.datetime.now(datetime.timezone.utc)
+        expired = {
+            "authorizationToken": "expired",
+            "expiresAt": now + datetime.timedelta(seconds=60),
+        }
+        valid = {
+            "authorizationToken": "valid",
+            "expiresAt": now + datetime.timedelta(hours=12),
+        }
+        stubber.add_response(
+            "get_authorization_token", {"authorizationData": [expired]}
+        )
+        stubber.add_response("get_authorization_token", {"authorizationData": [valid]})
+
+        with stubber:
+            # expires too soon to be reused
+            assert EcrLookup.get_authorization_data(runway_context) == expired
+            assert EcrLookup.get_authorization_data(runway_context) == valid
+            assert EcrLookup.get_authorization_data(runway_context) == valid
+        stubber.assert_no_pending_responses()
+
     def test_get_login_password(
         self, cfngin_context: MockCFNginContext, runway_context: MockRunwayContext
     ) -> None:
@@ -91,19 +115,19 @@ class TestEcrLookup:
     ) -> None:
         """Test handle login-password."""
         runway_context.add_stubber("ecr")
-        mock_get_login_password = mocker.patch.object(
+        mock_get_authorization_data = mocker.patch.object(
             EcrLookup,
-            "get_login_password",
-            return_value="EcrLookup.get_login_password()",
+            "get_authorization_data",
+            return_value={
+                "authorizationToken": base64.b64encode(b"AWS:p@ssword").decode()
+            },
         )
         assert (
-            EcrLookup.handle("login-password", runway_context)
+            EcrLookup.handle("login-password::region=us-west-2", runway_context)
             == mock_format_results.return_value
         )
-        mock_get_login_password.assert_called_once()
-        mock_format_results.assert_called_once_with(
-            mock_get_login_password.return_value
-        )
+        mock_get_authorization_data.assert_called_once_with(runway_context, "us-west-2")
+        mock_format_results.assert_called_once_with("p@ssword", region="us-west-2")
 
     def test_handle_value_error(self, runway_context: MockRunwayContext) -> None:
         """Test handle raise ValueError."""
@@ -11,6 +11,8 @@ import pytest
 import yaml
 
 from runway.exceptions import FailedVariableLookup
+from runway.lookups.handlers.base import LOOKUP_CACHE
+from runway.lookups.handlers.ssm import SsmLookup
 from runway.variables import Variable
 
 if TYPE_CHECKING:
@@ -72,12 +74,35 @@ class TestSsmLookup:
             cfngin_var.resolve(context=cfngin_context)
             assert cfngin_var.value == value
 
+            LOOKUP_CACHE.invalidate()  # both contexts use the same credentials
             runway_var.resolve(context=runway_context)
             assert runway_var.value == value
 
         cfn_stub.assert_no_pending_responses()
         rw_stub.assert_no_pending_responses()
 
+    def test_cached(self, runway_context: MockRunwayContext) -> None:
+        """Test result is cached until the parameter is invalidated."""
+        name = "/test/param"
+        stubber = runway_context.add_stubber("ssm")
+        for value in ["first", "second"]:
+            stubber.add_response(
+                "get_parameter",
+                get_parameter_response(name, value),
+                get_parameter_request(name),
+            )
+
+        with stubber as stub:
+            for _ in range(2):
+                var = Variable("test_var", f"${{ssm {name}}}", variable_type="runway")
+                var.resolve(context=runway_context)
+                assert var.value == "first"
+            LOOKUP_CACHE.invalidate(name)
+            var = Variable("test_var", f"${{ssm {name}}}", variable_type="runway")
+            var.resolve(context=runway_context)
+            assert var.value == "second"
+        stub.assert_no_pending_responses()
+
     def test_default(self, runway_context: MockRunwayContext) -> None:
         """Test resolution of a default value."""
         name = "/test/param"
@@ -164,6 +189,7 @@ class TestSsmLookup:
                 else:
                     raise ValueError
 
+                LOOKUP_CACHE.invalidate(name)  # value of the parameter changed
                 stubber.add_response(
                     "get_parameter",
                     get_parameter_response(name, dumped_value),
@@ -192,3 +218,64 @@ class TestSsmLookup:
 
         assert "ParameterNotFound" in str(err.value.__cause__)
         stub.assert_no_pending_responses()
+
+    def test_prefetch(self, runway_context: MockRunwayContext) -> None:
+        """Test prefetch."""
+        names = [f"/test/param{i:02d}" for i in range(11)]
+        stubber = runway_context.add_stubber("ssm")
+        stubber.add_response(
+            "get_parameters",
+            {
+                "Parameters": [
+                    get_parameter_response(name, f"{name} value")["Parameter"]
+                    for name in names[:10]
+                ]
+            },
+            {"Names": names[:10], "WithDecryption": True},
+        )
+        stubber.add_response(
+            "get_parameters",
+            {"Parameters": [], "InvalidParameters": [names[10]]},
+            {"Names": names[10:], "WithDecryption": True},
+        )
+        stubber.add_client_error(
+            "get_parameter",
+            "ParameterNotFound",
+            expected_params=get_parameter_request(names[10]),
+        )
+
+        with stubber as stub:
+            assert not SsmLookup.prefetch(
+                [*names, f"{names[0]}::load=json", "/test/param:1"], runway_context
+            )
+            for name in names[:10]:
+                var = Variable("test_var", f"${{ssm {name}}}", variable_type="runway")
+                var.resolve(context=runway_context)
+                assert var.value == f"{name} value"
+            with pytest.raises(FailedVariableLookup):
+                Variable(
+                    "test_var", f"${{ssm {names[10]}}}", variable_type="runway"
+                ).resolve(context=runway_context)
+        stub.assert_no_pending_responses()
+
+    def test_prefetch_error(self, runway_context: MockRunwayContext) -> None:
+        """Test prefetch falls back to retrieving parameters individually."""
+        name = "/test/param"
+        stubber = runway_context.add_stubber("ssm")
+        stubber.add_client_error(
+            "get_parameters",
+            "AccessDeniedException",
+            expected_params={"Names": [name], "WithDecryption": True},
+        )
+        stubber.add_response(
+            "get_parameter",
+            get_parameter_response(name, "test value"),
+            get_parameter_request(name),
+        )
+        var = Variable("test_var", f"${{ssm {name}}}", variable_type="runway")
+
+        with stubber as stub:
+            assert not SsmLookup.prefetch([name], runway_context)
+            var.resolve(context=runway_context)
+        assert var.value == "test value"
+        stub.assert_no_pending_responses()
@@ -19,11 +19,13 @@ class TestStaticSiteOptions:
         data = RunwayStaticSiteModuleOptionsDataModel(
             build_output="./dist",
             build_steps=["runway --help"],
+            content_hash=True,
             pre_build_steps=[{"command": "runway --help"}],
         )
         obj = StaticSiteOptions(data=data)
         assert obj.build_output == data.build_output
         assert obj.build_steps == data.build_steps
+        assert obj.content_hash == data.content_hash
         assert obj.data == data
         assert obj.extra_files == data.extra_files
         assert obj.pre_build_steps == data.pre_build_steps
@@ -104,6 +104,7 @@ class TestRunwayStaticSiteModuleOptionsDataModel:
         obj = RunwayStaticSiteModuleOptionsDataModel()
         assert obj.build_output == "./"
         assert obj.build_steps == []
+        assert not obj.content_hash
         assert obj.extra_files == []
         assert obj.pre_build_steps == []
         assert obj.source_hashing == RunwayStaticSiteSourceHashingDataModel()
@@ -118,6 +119,7 @@ class TestRunwayStaticSiteModuleOptionsDataModel:
         data = {
             "build_output": "./dist",
             "build_steps": ["runway --help"],
+            "content_hash": True,
             "extra_files": [{"name": "test.json", "content": "{}"}],
             "pre_build_steps": [{"command": "runway --help"}],
             "source_hashing": {"enabled": False},
@@ -125,6 +127,7 @@ class TestRunwayStaticSiteModuleOptionsDataModel:
         obj = RunwayStaticSiteModuleOptionsDataModel(**data)
         assert obj.build_output == data["build_output"]
         assert obj.build_steps == data["build_steps"]
+        assert obj.content_hash
         assert obj.extra_files == [
             RunwayStaticSiteExtraFileDataModel(**data["extra_files"][0])  # type: ignore
         ]
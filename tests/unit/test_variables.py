@@ -3,7 +3,8 @@
 # pyright: basic
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, ClassVar, List, Union
+import threading
+from typing import TYPE_CHECKING, Any, ClassVar, List, Set, Union
 
 import pytest
 from mock import MagicMock, call
@@ -29,6 +30,9 @@ from runway.variables import (
     VariableValueList,
     VariableValueLiteral,
     VariableValueLookup,
+    _iter_lookups,
+    _parse_str,
+    prefetch_lookups,
     resolve_variables,
 )
 
@@ -84,6 +88,82 @@ def test_resolve_variables(cfngin_context: MockCFNginContext) -> None:
     variable.resolve.assert_called_once_with(context=cfngin_context, provider=None)
 
 
+def test_resolve_variables_concurrent(
+    cfngin_context: MockCFNginContext, mocker: MockerFixture
+) -> None:
+    """Test resolve_variables resolves independent lookups concurrently."""
+    barrier = threading.Barrier(3, timeout=5)
+    threads: Set[str] = set()
+
+    def handle(value: str, *_args: Any, **_kwargs: Any) -> str:
+        if value.startswith("val"):
+            barrier.wait()  # all three independent lookups are in flight
+        threads.add(threading.current_thread().name)
+        return f"resolved-{value}"
+
+    mock_handle = mocker.patch.object(MockLookupHandler, "handle", side_effect=handle)
+    variables = [
+        Variable("Param0", "${test val0}"),
+        Variable("Param1", {"key": ["${test val1}", "${test ${test nested}}"]}),
+        Variable("Param2", "${test val2}"),
+    ]
+    assert not resolve_variables(variables, cfngin_context)
+    assert variables[0].value == "resolved-val0"
+    assert variables[1].value == {"key": ["resolved-val1", "resolved-resolved-nested"]}
+    assert variables[2].value == "resolved-val2"
+    assert mock_handle.call_count == 5
+    assert all(name.startswith("lookup") for name in threads - {"MainThread"})
+    assert all(
+        not lookup._preresolved for v in variables for lookup in _iter_lookups(v._value)
+    )
+
+
+def test_resolve_variables_concurrent_failed(
+    cfngin_context: MockCFNginContext, mocker: MockerFixture
+) -> None:
+    """Test resolve_variables raises errors in order."""
+
+    def handle(value: str, *_args: Any, **_kwargs: Any) -> str:
+        if value == "val0":
+            return "resolved"
+        raise ValueError(value)
+
+    mock_handle = mocker.patch.object(MockLookupHandler, "handle", side_effect=handle)
+    variables = [
+        Variable("Param0", "${test val0}"),
+        Variable("Param1", "${test val1}"),
+        Variable("Param2", "${test val2}"),
+    ]
+    with pytest.raises(FailedVariableLookup) as excinfo:
+        resolve_variables(variables, cfngin_context)
+    assert excinfo.value.variable is variables[1]
+    assert variables[0].value == "resolved"
+    # error of the failed lookup is raised in order without resolving it again
+    assert [c.args[0] for c in mock_handle.call_args_list].count("val1") == 1
+    assert all(
+        not lookup._prefailed and not lookup._preresolved
+        for v in variables
+        for lookup in _iter_lookups(v._value)
+    )
+
+
+def test_prefetch_lookups(
+    cfngin_context: MockCFNginContext, mocker: MockerFixture
+) -> None:
+    """Test prefetch_lookups."""
+    mock_prefetch = mocker.patch.object(MockLookupHandler, "prefetch")
+    variables = [
+        Variable("Param0", "${test val1}"),
+        Variable(
+            "Param1",
+            {"key": ["${test val0}", "prefix-${test ${test nested}}", "${test val1}"]},
+        ),
+        Variable("Param2", "literal"),
+    ]
+    assert not prefetch_lookups(variables, cfngin_context)
+    mock_prefetch.assert_called_once_with(["nested", "val0", "val1"], cfngin_context)
+
+
 class TestVariables:
     """Test runway.variables.Variables."""
 
@@ -95,6 +175,15 @@ class TestVariables:
         )
         assert Variable("Param", "val").dependencies == {"test"}
 
+    def test_lookup_names(self) -> None:
+        """Test lookup_names."""
+        assert Variable("Param", "val").lookup_names == set()
+        assert Variable(
+            "Param",
+            {"key": ["${default ${output vpc::Id}::val}", "${cfn stack.output}"]},
+            "cfngin",
+        ).lookup_names == {"cfn", "default", "output"}
+
     def test_get(self, mocker: MockerFixture) -> None:
         """Test get."""
         obj = Variable("Para", {"key": "val"})
@@ -302,6 +391,46 @@ class TestVariableValue:
         assert obj.value == "test"
         assert isinstance(obj, VariableValueLiteral)
 
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            ("${test val}", "Lookup[Literal[test] Concatenation[Literal[val]]]"),
+            (
+                "a ${test ${test b}-c} d",
+                "Concatenation[Literal[a ], Lookup[Literal[test] Concatenation["
+                "Literal[], Lookup[Literal[test] Concatenation[Literal[b]]], "
+                "Literal[-c]]], "
+                "Literal[ d]]",
+            ),
+            (
+                "${test a} ${test b",
+                "Literal[${test a} ${test b]",
+            ),
+            (
+                "${test a ${test b}",
+                "Concatenation[Literal[${test a ], "
+                "Lookup[Literal[test] Concatenation[Literal[b]]]]",
+            ),
+            (
+                "}${test a}}",
+                "Concatenation[Literal[}], Lookup[Literal[test] "
+                "Concatenation[Literal[a]]], Literal[}]]",
+            ),
+        ],
+    )
+    def test_parse_obj_str(self, expected: str, value: str) -> None:
+        """Test parse_obj str."""
+        assert repr(VariableValue.parse_obj(value)) == expected
+
+    def test_parse_obj_str_cached(self) -> None:
+        """Test parse_obj str reuses the parsed string but not the objects."""
+        _parse_str.cache_clear()
+        first = VariableValue.parse_obj("${test val}")
+        second = VariableValue.parse_obj("${test val}")
+        assert _parse_str.cache_info().hits == 1
+        assert first is not second
+        assert repr(first) == repr(second)
+
     def test_repr(self) -> None:
         """Test __repr__."""
         with pytest.raises(NotImplementedError):